@@ -0,0 +1,115 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""
+Measures cold import time of dkg entry points, each in a fresh interpreter.
+
+    python benchmarks/import_time.py [--repeat N] [--check]
+
+With --check the script exits with a non-zero status when a lightweight
+entry point loads one of the heavy dependencies, or exceeds its time budget.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = ["web3", "pandas", "rdflib", "pyld", "aiohttp", "eth_account"]
+
+# Entry point -> (heavy modules it may load, time budget in seconds)
+ENTRY_POINTS = {
+    "dkg": ([], 0.05),
+    "dkg.utils.ual": ([], 0.5),
+    "dkg.utils.merkle": ([], 0.5),
+    "dkg.utils.metadata": ([], 0.5),
+    "dkg.utils.rdf": ([], 0.5),
+    "dkg.main": (["web3", "aiohttp", "eth_account"], None),
+}
+
+MEASURE_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": elapsed,
+    "loaded": [m for m in {heavy_modules!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure(module: str, repeat: int) -> dict:
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                MEASURE_SCRIPT.format(module=module, heavy_modules=HEAVY_MODULES),
+            ],
+            cwd=ROOT_DIR,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        runs.append(json.loads(output))
+
+    return {
+        "median": statistics.median(run["seconds"] for run in runs),
+        "min": min(run["seconds"] for run in runs),
+        "loaded": runs[-1]["loaded"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--check", action="store_true")
+    args = parser.parse_args()
+
+    failures = []
+
+    print(f"{'module':<22}{'median ms':>12}{'min ms':>10}  heavy modules loaded")
+    for module, (allowed_modules, budget) in ENTRY_POINTS.items():
+        result = measure(module, args.repeat)
+        print(
+            f"{module:<22}{result['median'] * 1000:>12.1f}{result['min'] * 1000:>10.1f}"
+            f"  {', '.join(result['loaded']) or '-'}"
+        )
+
+        if unexpected := set(result["loaded"]) - set(allowed_modules):
+            failures.append(f"{module} imports {', '.join(sorted(unexpected))}")
+        if budget is not None and result["median"] > budget:
+            failures.append(
+                f"{module} import took {result['median']:.3f}s (budget {budget}s)"
+            )
+
+    if args.check and failures:
+        print("\n".join(["", "FAILED:", *failures]), file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""
+Measures assertion hashing and Merkle tree phases on synthetic N-Quads.
+
+    python benchmarks/merkle.py [--sizes N ...] [--engines NAME ...]
+                                [--proofs N] [--repeat N] [--json]
+
+Assertions of 1e2 to 1e6 canonical quads are generated locally, so the suite
+runs offline. For every engine the script reports median wall time,
+throughput and peak traced memory of leaf hashing, tree building, proof
+generation and proof verification. Memory is measured in a separate run,
+because tracemalloc slows the interpreter down. Roots of all engines are
+compared for every size, and the script exits with a non-zero status when
+they differ.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR))
+
+from dkg.utils.merkle import (  # noqa: E402
+    BytesMerkleTree,
+    MerkleTree,
+    StreamingMerkleRoot,
+    hash_assertion_with_indexes,
+    hash_leaves,
+    solidity_keccak256,
+)
+
+DEFAULT_SIZES = [10**2, 10**3, 10**4, 10**5, 10**6]
+PREDICATES = [
+    "<http://schema.org/name>",
+    "<http://schema.org/description>",
+    "<http://schema.org/dateCreated>",
+    "<http://schema.org/author>",
+    "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>",
+]
+
+
+def generate_assertion(size: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    quads = []
+    for i in range(size):
+        subject = f"<uuid:{rng.getrandbits(64):016x}>" if i % 7 else f"_:c14n{i}"
+        predicate = PREDICATES[i % len(PREDICATES)]
+        match i % len(PREDICATES):
+            case 0:
+                value = f'"Name {i}"'
+            case 1:
+                value = f'"Description of entity {i} ünïcödé"@en'
+            case 2:
+                value = (
+                    f'"2024-01-{i % 28 + 1:02d}"'
+                    "^^<http://www.w3.org/2001/XMLSchema#date>"
+                )
+            case 3:
+                value = f"<uuid:{rng.getrandbits(64):016x}>"
+            case _:
+                value = "<http://schema.org/Thing>"
+        quads.append(f"{subject} {predicate} {value} .")
+
+    quads.sort()
+    return quads
+
+
+def _legacy_keccak256(data: bytes) -> str:
+    # Not the default hash function, so hash_assertion_with_indexes takes the
+    # encode_packed path.
+    return solidity_keccak256(data)
+
+
+# Engine -> phase -> function of the previous phase's result
+ENGINES: dict[str, dict[str, Callable[..., Any]]] = {
+    "legacy": {
+        "hash_leaves": lambda quads: hash_assertion_with_indexes(
+            quads, _legacy_keccak256
+        ),
+        "build_tree": lambda leaves: MerkleTree(leaves, sort_pairs=True),
+    },
+    "bytes": {
+        "hash_leaves": lambda quads: b"".join(hash_leaves(quads)),
+        "build_tree": lambda leaves: BytesMerkleTree(leaves, sort_pairs=True),
+    },
+    "parallel": {
+        "hash_leaves": lambda quads: bytes.fromhex(
+            "".join(
+                leaf[2:] for leaf in hash_assertion_with_indexes(quads, parallel=True)
+            )
+        ),
+        "build_tree": lambda leaves: BytesMerkleTree(
+            leaves, sort_pairs=True, parallel=True
+        ),
+    },
+    "streaming": {
+        "root": lambda quads: StreamingMerkleRoot().add_quads(quads),
+    },
+}
+
+
+def measure(fn: Callable[[], Any], memory: bool) -> tuple[Any, float, int | None]:
+    if memory:
+        tracemalloc.start()
+
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+
+    peak_memory = None
+    if memory:
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result, elapsed, peak_memory
+
+
+def run_engine(
+    engine: str, quads: list[str], proofs: int, memory: bool
+) -> tuple[str, list[dict[str, Any]]]:
+    results = []
+
+    def phase(name: str, fn: Callable[[], Any], items: int) -> Any:
+        result, elapsed, peak_memory = measure(fn, memory)
+        results.append(
+            {
+                "phase": name,
+                "items": items,
+                "seconds": elapsed,
+                "peak_memory": peak_memory,
+            }
+        )
+        return result
+
+    phases = ENGINES[engine]
+    if "root" in phases:
+        root = phase("root", lambda: phases["root"](iter(quads)), len(quads))
+        return root, results
+
+    leaves = phase("hash_leaves", lambda: phases["hash_leaves"](quads), len(quads))
+    tree = phase("build_tree", lambda: phases["build_tree"](leaves), len(quads))
+
+    sample = random.Random(len(quads)).sample(tree.leaves, min(proofs, len(quads)))
+    leaf_proofs = phase("proofs", lambda: tree.proofs(sample), len(sample))
+    verified = phase(
+        "verify",
+        lambda: all(tree.verify(p, leaf) for p, leaf in zip(leaf_proofs, sample)),
+        len(sample),
+    )
+    if not verified:
+        raise AssertionError(f"{engine} failed to verify its own proofs.")
+
+    return tree.root, results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--engines", nargs="+", choices=list(ENGINES), default=list(ENGINES)
+    )
+    parser.add_argument(
+        "--proofs", type=int, default=1000, help="leaves to prove per size"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print raw results")
+    args = parser.parse_args()
+
+    report, mismatches = [], []
+    for size in args.sizes:
+        quads = generate_assertion(size)
+
+        roots = {}
+        for engine in args.engines:
+            timing_runs = []
+            for _ in range(args.repeat):
+                roots[engine], results = run_engine(
+                    engine, list(quads), args.proofs, False
+                )
+                timing_runs.append(results)
+            _, memory_run = run_engine(engine, list(quads), args.proofs, True)
+
+            for i, row in enumerate(memory_run):
+                seconds = statistics.median(run[i]["seconds"] for run in timing_runs)
+                report.append(
+                    {
+                        "size": size,
+                        "engine": engine,
+                        "phase": row["phase"],
+                        "median_seconds": seconds,
+                        "items_per_second": row["items"] / seconds if seconds else None,
+                        "peak_memory": row["peak_memory"],
+                    }
+                )
+
+        if len(set(roots.values())) > 1:
+            mismatches.append(f"size {size}: {roots}")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"{'size':>9}  {'engine':<10}{'phase':<13}{'median ms':>12}"
+            f"{'items/s':>13}{'peak MiB':>10}"
+        )
+        for row in report:
+            print(
+                f"{row['size']:>9}  {row['engine']:<10}{row['phase']:<13}"
+                f"{row['median_seconds'] * 1000:>12.1f}"
+                f"{row['items_per_second'] or 0:>13,.0f}"
+                f"{row['peak_memory'] / 2**20:>10.1f}"
+            )
+
+    if mismatches:
+        print("\n".join(["", "ROOT MISMATCH:", *mismatches]), file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""
+Measures cold-start phases of the client against local stub servers.
+
+    python benchmarks/startup.py [--repeat N] [--multicall] [--contracts-cache PATH]
+
+Every run happens in a fresh interpreter. The phases are importing dkg,
+constructing BlockchainProvider, constructing DKG and the first asset.get.
+For each phase the script reports wall time (median of all runs), JSON-RPC
+requests, node HTTP requests and peak traced memory. Memory is measured in a
+separate run, because tracemalloc slows the interpreter down.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable
+from urllib.request import urlopen
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+BLOCKCHAIN_ID = "hardhat1:31337"
+PHASES = ["import", "blockchain_provider", "dkg", "first_asset_get"]
+
+
+def _request_count(url: str) -> int:
+    with urlopen(f"{url}/stats") as response:
+        return json.load(response)["requests"]
+
+
+def run_phases(
+    rpc_url: str, node_url: str, ual: str, memory: bool, contracts_cache: str | None
+) -> list[dict[str, Any]]:
+    results = []
+
+    def measure(phase: str, fn: Callable[[], Any]) -> Any:
+        rpc_requests, node_requests = _request_count(rpc_url), _request_count(node_url)
+        if memory:
+            tracemalloc.start()
+
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+
+        peak_memory = None
+        if memory:
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        results.append(
+            {
+                "phase": phase,
+                "seconds": elapsed,
+                "rpc_requests": _request_count(rpc_url) - rpc_requests,
+                "node_requests": _request_count(node_url) - node_requests,
+                "peak_memory": peak_memory,
+            }
+        )
+        return result
+
+    def import_dkg():
+        from dkg import DKG
+        from dkg.providers import BlockchainProvider, NodeHTTPProvider
+        from dkg.utils.contracts_cache import ContractsCache
+
+        return DKG, BlockchainProvider, NodeHTTPProvider, ContractsCache
+
+    DKG, BlockchainProvider, NodeHTTPProvider, ContractsCache = measure(
+        "import", import_dkg
+    )
+    blockchain_provider = measure(
+        "blockchain_provider",
+        lambda: BlockchainProvider(
+            "development",
+            BLOCKCHAIN_ID,
+            rpc_url,
+            contracts_cache=(
+                ContractsCache(contracts_cache) if contracts_cache else None
+            ),
+        ),
+    )
+    dkg = measure("dkg", lambda: DKG(NodeHTTPProvider(node_url), blockchain_provider))
+    measure("first_asset_get", lambda: dkg.asset.get(ual))
+
+    return results
+
+
+def run_subprocess(args: list[str]) -> list[dict[str, Any]]:
+    env = {k: v for k, v in os.environ.items() if k != "PRIVATE_KEY"}
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(ROOT_DIR), env.get("PYTHONPATH")])
+    )
+    output = subprocess.run(
+        [sys.executable, __file__, "--run", *args],
+        cwd=ROOT_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--multicall", action="store_true", help="emulate a Multicall3 deployment"
+    )
+    parser.add_argument(
+        "--contracts-cache", help="path of the on-disk contracts cache to use"
+    )
+    parser.add_argument("--json", action="store_true", help="print raw results")
+    parser.add_argument("--run", nargs=4, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        rpc_url, node_url, ual, mode = args.run
+        print(
+            json.dumps(
+                run_phases(
+                    rpc_url, node_url, ual, mode == "memory", args.contracts_cache
+                )
+            )
+        )
+        return 0
+
+    sys.path.insert(0, str(ROOT_DIR))
+    from stubs import JSONRPCStub, NodeStub
+
+    with JSONRPCStub(multicall=args.multicall) as rpc, NodeStub() as node:
+        ual = (
+            f"did:dkg:{BLOCKCHAIN_ID}/"
+            f"{rpc.addresses['ContentAssetStorage'].lower()}/1"
+        )
+        cache_args = (
+            ["--contracts-cache", args.contracts_cache] if args.contracts_cache else []
+        )
+
+        timing_runs = [
+            run_subprocess([rpc.url, node.url, ual, "time", *cache_args])
+            for _ in range(args.repeat)
+        ]
+        memory_run = run_subprocess([rpc.url, node.url, ual, "memory", *cache_args])
+
+    report = []
+    for i, phase in enumerate(PHASES):
+        report.append(
+            {
+                "phase": phase,
+                "median_seconds": statistics.median(
+                    run[i]["seconds"] for run in timing_runs
+                ),
+                "rpc_requests": memory_run[i]["rpc_requests"],
+                "node_requests": memory_run[i]["node_requests"],
+                "peak_memory": memory_run[i]["peak_memory"],
+            }
+        )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{'phase':<22}{'median ms':>12}{'RPCs':>7}{'node reqs':>11}{'peak MiB':>10}")
+    for row in report:
+        print(
+            f"{row['phase']:<22}{row['median_seconds'] * 1000:>12.1f}"
+            f"{row['rpc_requests']:>7}{row['node_requests']:>11}"
+            f"{row['peak_memory'] / 2**20:>10.1f}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+"""
+Local stand-ins for an EVM JSON-RPC endpoint and a DKG node, used by the
+benchmarks to exercise the client without a running network.
+"""
+
+import itertools
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from dkg.utils.abi import abis
+from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
+from eth_abi import decode, encode
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
+
+CHAIN_ID = 31337
+BLOCK_NUMBER = 100
+BLOCK_TIMESTAMP = 1_700_000_000
+HASH_ZERO = b"\x00" * 32
+
+ASSERTION = [
+    '<urn:dkg:benchmark:1> <http://schema.org/name> "Benchmark" .',
+    '<urn:dkg:benchmark:1> <http://schema.org/value> "1" .',
+    '<urn:dkg:benchmark:2> <http://schema.org/value> "2" .',
+]
+ASSERTION_ID = MerkleTree(
+    hash_assertion_with_indexes(list(ASSERTION)), sort_pairs=True
+).root
+
+
+def _abi_types(params: list[dict[str, Any]]) -> list[str]:
+    types = []
+    for param in params:
+        if param["type"].startswith("tuple"):
+            components = ",".join(_abi_types(param["components"]))
+            types.append(f"({components}){param['type'][5:]}")
+        else:
+            types.append(param["type"])
+    return types
+
+
+class _StubServer:
+    def __init__(self):
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.request_count = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "_StubServer":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "_StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle_get(self, path: str) -> Any:
+        if path == "/stats":
+            return {"requests": self.request_count}
+        raise KeyError(path)
+
+    def handle_post(self, path: str, body: Any) -> Any:
+        raise KeyError(path)
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                self._respond(lambda: stub.handle_get(self.path))
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self._respond(lambda: stub.handle_post(self.path, json.loads(body)))
+
+            def _respond(self, handle: Callable[[], Any]) -> None:
+                try:
+                    status, payload = 200, handle()
+                except KeyError as err:
+                    status, payload = 404, {"error": str(err)}
+
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+class JSONRPCStub(_StubServer):
+    def __init__(self, multicall: bool = False):
+        super().__init__()
+        self.multicall = multicall
+
+        self.functions = {}
+        for contract in abis:
+            for item in abis[contract]:
+                if item["type"] == "function":
+                    self.functions.setdefault(
+                        function_abi_to_4byte_selector(item), item
+                    )
+
+        names = [contract for contract in abis if contract not in ("Hub", "Multicall3")]
+        self.addresses = {
+            name: to_checksum_address(f"0x{0x1000 + i:040x}")
+            for i, name in enumerate(names)
+        }
+
+    def handle_post(self, path: str, body: Any) -> Any:
+        if isinstance(body, list):
+            return [self._handle_request(request) for request in body]
+        return self._handle_request(body)
+
+    def _handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        self.request_count += 1
+        try:
+            result = self.handle_rpc(request["method"], request.get("params", []))
+            return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+        except Exception as err:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32000, "message": f"execution reverted: {err!r}"},
+            }
+
+    def handle_rpc(self, method: str, params: list[Any]) -> Any:
+        match method:
+            case "eth_chainId":
+                return hex(CHAIN_ID)
+            case "eth_blockNumber":
+                return hex(BLOCK_NUMBER)
+            case "eth_gasPrice":
+                return hex(10**9)
+            case "eth_getCode":
+                return "0x01" if self.multicall else "0x"
+            case "eth_getLogs":
+                return []
+            case "eth_getBlockByNumber":
+                return self._block()
+            case "eth_call":
+                return "0x" + self._call(bytes.fromhex(params[0]["data"][2:])).hex()
+        raise KeyError(method)
+
+    def _call(self, data: bytes) -> bytes:
+        function = self.functions[data[:4]]
+        args = decode(_abi_types(function["inputs"]), data[4:])
+
+        if function["name"] == "aggregate3":
+            results = []
+            for _, _, call_data in args[0]:
+                try:
+                    results.append((True, self._call(call_data)))
+                except Exception:
+                    results.append((False, b""))
+            result = results
+        else:
+            result = self.contract_function(function["name"], *args)
+
+        output_types = _abi_types(function["outputs"])
+        return encode(output_types, result if len(output_types) > 1 else [result])
+
+    def contract_function(self, name: str, *args: Any) -> Any:
+        storages = {c for c in self.addresses if c.endswith("AssetStorage")}
+        match name:
+            case "getAllContracts":
+                return [(c, a) for c, a in self.addresses.items() if c not in storages]
+            case "getAllAssetStorages":
+                return [(c, a) for c, a in self.addresses.items() if c in storages]
+            case "isContract":
+                return args[0] in self.addresses and args[0] not in storages
+            case "isAssetStorage":
+                return args[0] in storages
+            case "getContractAddress" | "getAssetStorageAddress":
+                return self.addresses[args[0]]
+            case "status":
+                return True
+            case "getUnfinalizedState":
+                return HASH_ZERO
+            case "getLatestAssertionId":
+                return bytes.fromhex(ASSERTION_ID[2:])
+            case "getAssertionIds":
+                return [bytes.fromhex(ASSERTION_ID[2:])]
+        raise KeyError(name)
+
+    def _block(self) -> dict[str, Any]:
+        return {
+            "number": hex(BLOCK_NUMBER),
+            "timestamp": hex(BLOCK_TIMESTAMP),
+            "hash": "0x" + "11" * 32,
+            "parentHash": "0x" + "22" * 32,
+            "miner": "0x" + "00" * 20,
+            "gasLimit": hex(30_000_000),
+            "gasUsed": "0x0",
+            "baseFeePerGas": "0x1",
+            "difficulty": "0x0",
+            "totalDifficulty": "0x0",
+            "extraData": "0x",
+            "logsBloom": "0x" + "00" * 256,
+            "nonce": "0x" + "00" * 8,
+            "mixHash": "0x" + "00" * 32,
+            "receiptsRoot": "0x" + "00" * 32,
+            "sha3Uncles": "0x" + "00" * 32,
+            "stateRoot": "0x" + "00" * 32,
+            "transactionsRoot": "0x" + "00" * 32,
+            "size": "0x0",
+            "transactions": [],
+            "uncles": [],
+        }
+
+
+class NodeStub(_StubServer):
+    def __init__(self, pending_polls: int = 0):
+        super().__init__()
+        self.pending_polls = pending_polls
+        self._operation_ids = itertools.count()
+        self._polls: dict[str, int] = {}
+
+    def handle_get(self, path: str) -> Any:
+        if path == "/stats":
+            return super().handle_get(path)
+
+        self.request_count += 1
+        parts = path.split("?")[0].strip("/").split("/")
+        match parts[1:]:
+            case ["info"]:
+                return {"version": "6.0.0"}
+            case ["bid-suggestion"]:
+                return {"bidSuggestion": "10"}
+            case [operation, operation_id]:
+                polls = self._polls.get(operation_id, 0)
+                self._polls[operation_id] = polls + 1
+                if polls < self.pending_polls:
+                    return {"status": "PENDING", "data": {}}
+                return {
+                    "status": "COMPLETED",
+                    "data": {"assertion": ASSERTION} if operation == "get" else [],
+                }
+        raise KeyError(path)
+
+    def handle_post(self, path: str, body: Any) -> Any:
+        self.request_count += 1
+        return {"operationId": f"operation-{next(self._operation_ids)}"}
@@ -1,3 +1,33 @@
-from . import providers  # NOQA: F401
-from . import utils  # NOQA: F401
-from .main import DKG  # NOQA: F401
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from . import providers  # NOQA: F401
+    from . import utils  # NOQA: F401
+    from .main import DKG, AsyncDKG  # NOQA: F401
+
+# Submodules are imported on first attribute access, so that `import dkg`
+# doesn't load web3, pandas, rdflib and pyld up front.
+_LAZY_ATTRIBUTES = {
+    "providers": ".providers",
+    "utils": ".utils",
+    "DKG": ".main",
+    "AsyncDKG": ".main",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_LAZY_ATTRIBUTES[name], __name__)
+    value = module if module.__name__ == f"{__name__}.{name}" else getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
@@ -20,7 +20,7 @@ from typing import Literal
 from dkg.manager import DefaultRequestManager
 from dkg.module import Module
 from dkg.types import JSONLD, HexStr
-from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
+from dkg.utils.merkle import calculate_merkle_root
 from dkg.utils.metadata import generate_assertion_metadata
 from dkg.utils.rdf import format_content
 
@@ -37,10 +37,7 @@ class Assertion(Module):
     ) -> HexStr:
         assertions = format_content(content)
 
-        return MerkleTree(
-            hash_assertion_with_indexes(assertions["public"]),
-            sort_pairs=True,
-        ).root
+        return calculate_merkle_root(assertions["public"])
 
     def get_size(self, content: dict[Literal["public", "private"], JSONLD]) -> int:
         assertions = format_content(content)
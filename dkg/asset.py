@@ -15,18 +15,19 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import asyncio
 import json
-import math
 import re
-from typing import Literal, Type
+from concurrent.futures import Future
+from typing import Any, Callable, Iterable, Literal
 
-from pyld import jsonld
 from web3 import Web3
 from web3.constants import ADDRESS_ZERO, HASH_ZERO
 from web3.exceptions import ContractLogicError
 from web3.types import TxReceipt
 
 from dkg.constants import (
+    DEFAULT_CREATE_MANY_CONCURRENCY,
     DEFAULT_HASH_FUNCTION_ID,
     DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS,
     PRIVATE_ASSERTION_PREDICATE,
@@ -45,33 +46,396 @@ from dkg.exceptions import (
     InvalidStateOption,
     InvalidTokenAmount,
     MissingKnowledgeAssetState,
-    OperationNotFinished,
 )
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
-from dkg.types import JSONLD, UAL, Address, AgreementData, HexStr, Wei
+from dkg.module import AsyncModule, Module
+from dkg.types import JSONLD, UAL, Address, HexStr, NQuads, Wei
+from dkg.utils.agreement import AgreementCache, AgreementEntry
+from dkg.utils.allowance import AllowanceBudget, AsyncAllowanceBudget
 from dkg.utils.blockchain_request import BlockchainRequest
-from dkg.utils.decorators import retry
-from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
+from dkg.utils.merkle import calculate_merkle_root
 from dkg.utils.metadata import (
     generate_agreement_id,
     generate_assertion_metadata,
     generate_keyword,
 )
-from dkg.utils.node_request import (
-    NodeRequest,
-    OperationStatus,
-    StoreTypes,
-    validate_operation_status,
-)
+from dkg.utils.node_request import NodeRequest, OperationStatus, StoreTypes
+from dkg.utils.pipeline import AsyncPipeline, Pipeline, Stage
+from dkg.utils.receipts import AsyncTransactionHandle, TransactionHandle
 from dkg.utils.rdf import format_content, normalize_dataset
 from dkg.utils.ual import format_ual, parse_ual
 
 
+def _build_knowledge_asset_args(
+    assertion_id: HexStr,
+    assertion_metadata: dict[str, int],
+    token_amount: Wei,
+    epochs_number: int,
+    score_function_id: int,
+    immutable: bool,
+) -> dict[str, bytes | int | Wei | bool]:
+    return {
+        "assertionId": Web3.to_bytes(hexstr=assertion_id),
+        "size": assertion_metadata["size"],
+        "triplesNumber": assertion_metadata["triples_number"],
+        "chunksNumber": assertion_metadata["chunks_number"],
+        "tokenAmount": token_amount,
+        "epochsNumber": epochs_number,
+        "scoreFunctionId": score_function_id,
+        "immutable_": immutable,
+    }
+
+
+def _prepare_asset(
+    content: dict[Literal["public", "private"], JSONLD],
+    content_type: Literal["JSON-LD", "N-Quads"],
+) -> dict[str, Any]:
+    assertions = format_content(content, content_type)
+
+    return {
+        "assertions": assertions,
+        "public_assertion_id": calculate_merkle_root(assertions["public"]),
+        "public_assertion_metadata": generate_assertion_metadata(assertions["public"]),
+        "private_assertion_id": (
+            calculate_merkle_root(assertions["private"])
+            if content.get("private", None)
+            else None
+        ),
+    }
+
+
+def _generate_agreement_id(ual: UAL, first_assertion_id: HexStr) -> HexStr:
+    parsed_ual = parse_ual(ual)
+    contract_address, token_id = parsed_ual["contract_address"], parsed_ual["token_id"]
+    keyword = generate_keyword(contract_address, first_assertion_id)
+    return generate_agreement_id(contract_address, token_id, keyword)
+
+
+def _cache_agreements(
+    agreement_cache: AgreementCache,
+    entries: dict[UAL, AgreementEntry | None],
+    agreement_ids: list[HexStr],
+    states: list[Any],
+    results: list[Any],
+) -> None:
+    missing = [ual for ual, entry in entries.items() if entry is None]
+    for i, ual in enumerate(missing):
+        entries[ual] = AgreementEntry(
+            agreement_id=agreement_ids[i],
+            agreement_data=results[2 * i],
+            latest_state=states[2 * i + 1],
+            latest_state_size=results[2 * i + 1],
+        )
+        agreement_cache.set(ual, entries[ual])
+
+
+def _format_assertion(assertion: NQuads, output_format: str) -> list[JSONLD] | str:
+    match output_format:
+        case "NQUADS" | "N-QUADS":
+            from pyld import jsonld
+
+            return jsonld.from_rdf(
+                "\n".join(assertion),
+                {"algorithm": "URDNA2015", "format": "application/n-quads"},
+            )
+        case "JSONLD" | "JSON-LD":
+            return "\n".join(assertion)
+        case _:
+            raise DatasetOutputFormatNotSupported(f"{output_format} isn't supported!")
+
+
+def _format_operation(
+    operation_id: str, operation_result: NodeResponseDict
+) -> dict[str, str]:
+    return {"operationId": operation_id, "status": operation_result["status"]}
+
+
+def _prepare_mint(
+    asset: dict[str, Any],
+    epochs_number: int,
+    token_amount: Wei,
+    immutable: bool,
+    paranet_ual: UAL | None,
+    environment: str,
+    blockchain_id: str,
+) -> tuple[dict[str, Any], tuple[Address, int] | None, dict[str, HexStr | dict]]:
+    result = {"publicAssertionId": asset["public_assertion_id"], "operation": {}}
+    knowledge_asset_args = _build_knowledge_asset_args(
+        asset["public_assertion_id"],
+        asset["public_assertion_metadata"],
+        token_amount,
+        epochs_number,
+        DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[environment][blockchain_id],
+        immutable,
+    )
+
+    if paranet_ual is None:
+        return knowledge_asset_args, None, result
+
+    parsed_paranet_ual = parse_ual(paranet_ual)
+    paranet = (parsed_paranet_ual["contract_address"], parsed_paranet_ual["token_id"])
+    result["paranetId"] = Web3.to_hex(
+        Web3.solidity_keccak(["address", "uint256"], list(paranet))
+    )
+
+    return knowledge_asset_args, paranet, result
+
+
+def _check_receipt(receipt: TxReceipt) -> TxReceipt:
+    if receipt["status"] == 0:
+        raise ContractLogicError(
+            f"Transaction {receipt['transactionHash'].hex()} reverted."
+        )
+    return receipt
+
+
+def _format_mint_result(
+    blockchain_provider: Any,
+    receipt: TxReceipt,
+    result: dict[str, HexStr | dict],
+    content_asset_storage_address: Address,
+) -> tuple[int, dict[str, UAL | HexStr | dict[str, TxReceipt]]]:
+    events = blockchain_provider.decode_logs_event(
+        receipt,
+        "ContentAsset",
+        "AssetMinted",
+    )
+    token_id = events[0].args["tokenId"]
+
+    result["UAL"] = format_ual(
+        blockchain_provider.blockchain_id,
+        content_asset_storage_address,
+        token_id,
+    )
+    result["operation"]["mintKnowledgeAsset"] = json.loads(Web3.to_json(receipt))
+
+    return token_id, result
+
+
+def _build_assertions_list(
+    asset: dict[str, Any],
+    blockchain_id: str,
+    content_asset_storage_address: Address,
+    token_id: int,
+    store_type: StoreTypes,
+) -> list[dict[str, Any]]:
+    assertions = asset["assertions"]
+    assertion_ids = [("public", asset["public_assertion_id"])]
+    if asset["private_assertion_id"] is not None:
+        assertion_ids.append(("private", asset["private_assertion_id"]))
+
+    return [
+        {
+            "blockchain": blockchain_id,
+            "contract": content_asset_storage_address,
+            "tokenId": token_id,
+            "assertionId": assertion_id,
+            "assertion": assertions[visibility],
+            "storeType": store_type,
+        }
+        for visibility, assertion_id in assertion_ids
+    ]
+
+
+def _get_update_token_amount(
+    bid_suggestion: NodeResponseDict, agreement: AgreementEntry
+) -> Wei:
+    token_amount = int(bid_suggestion["bidSuggestion"])
+    token_amount -= agreement.agreement_data.tokens[0]
+    return token_amount if token_amount > 0 else 0
+
+
+def _get_agreement_states_requests(
+    module: Module | AsyncModule, token_ids: list[int]
+) -> list[Any]:
+    return [
+        request
+        for token_id in token_ids
+        for request in (
+            module._get_assertion_id_by_index.request(token_id, 0),
+            module._get_latest_assertion_id.request(token_id),
+        )
+    ]
+
+
+def _get_agreement_data_requests(
+    module: Module | AsyncModule,
+    agreement_ids: list[HexStr],
+    latest_states: list[HexStr],
+    anchor_clock: bool,
+) -> list[Any]:
+    return [
+        request
+        for agreement_id, latest_state in zip(agreement_ids, latest_states)
+        for request in (
+            module._get_service_agreement_data.request(agreement_id),
+            module._get_assertion_size.request(latest_state),
+        )
+    ] + ([module._get_block.request("latest")] if anchor_clock else [])
+
+
+def _is_state_hash(state: str | HexStr | int) -> bool:
+    return isinstance(state, str) and bool(re.match(r"^0x[a-fA-F0-9]{64}$", state))
+
+
+def _normalize_get_options(
+    state: str | HexStr | int, content_visibility: str, output_format: str
+) -> tuple[str | HexStr | int, str, str]:
+    return (
+        (
+            state.upper()
+            if isinstance(state, str) and not _is_state_hash(state)
+            else state
+        ),
+        content_visibility.upper(),
+        output_format.upper(),
+    )
+
+
+def _resolve_latest_state(
+    unfinalized_state: bytes, latest_finalized_state: bytes
+) -> tuple[HexStr, bool]:
+    unfinalized_state = Web3.to_hex(unfinalized_state)
+
+    if unfinalized_state and unfinalized_state != HASH_ZERO:
+        return unfinalized_state, False
+    else:
+        return Web3.to_hex(latest_finalized_state), True
+
+
+def _resolve_state(
+    state: HexStr | int, assertion_ids: list[bytes]
+) -> tuple[HexStr, bool]:
+    assertion_ids = [Web3.to_hex(assertion_id) for assertion_id in assertion_ids]
+
+    if isinstance(state, int):
+        if 0 <= state < len(assertion_ids):
+            return assertion_ids[state], state == len(assertion_ids) - 1
+
+        raise InvalidStateOption(f"State index {state} is out of range.")
+
+    if state in assertion_ids:
+        return state, state == assertion_ids[-1]
+
+    raise InvalidStateOption(f"Given state hash: {state} is not a part of the KA.")
+
+
+def _validate_assertion(assertion: NQuads, assertion_id: HexStr) -> None:
+    root = calculate_merkle_root(assertion)
+    if root != assertion_id:
+        raise InvalidKnowledgeAsset(f"State: {assertion_id}. Merkle Tree Root: {root}")
+
+
+def _get_public_assertion(
+    operation_result: NodeResponseDict, public_assertion_id: HexStr, validate: bool
+) -> NQuads:
+    public_assertion = operation_result["data"].get("assertion", None)
+
+    if public_assertion is None:
+        raise MissingKnowledgeAssetState("Unable to find state on the network!")
+
+    if validate:
+        _validate_assertion(public_assertion, public_assertion_id)
+
+    return public_assertion
+
+
+def _format_public_get_result(
+    public_assertion: NQuads,
+    public_assertion_id: HexStr,
+    content_visibility: str,
+    output_format: str,
+    operation_id: str,
+    operation_result: NodeResponseDict,
+) -> dict[str, HexStr | list[JSONLD] | dict[str, str]]:
+    result = {"operation": {}}
+    if content_visibility == KnowledgeAssetContentVisibility.PRIVATE:
+        return result
+
+    formatted_public_assertion = _format_assertion(public_assertion, output_format)
+
+    if content_visibility == KnowledgeAssetContentVisibility.PUBLIC:
+        result = {
+            **result,
+            "asertion": formatted_public_assertion,
+            "assertionId": public_assertion_id,
+        }
+    else:
+        result["public"] = {
+            "assertion": formatted_public_assertion,
+            "assertionId": public_assertion_id,
+        }
+
+    result["operation"]["publicGet"] = _format_operation(operation_id, operation_result)
+
+    return result
+
+
+def _get_private_assertion_id(public_assertion: NQuads) -> HexStr | None:
+    for element in public_assertion:
+        if PRIVATE_ASSERTION_PREDICATE in element:
+            return re.search(r'"(.*?)"', element).group(1)
+
+    return None
+
+
+def _get_private_assertion_query(private_assertion_id: HexStr) -> str:
+    return f"""
+    CONSTRUCT {{ ?s ?p ?o }}
+    WHERE {{
+        {{
+            GRAPH <assertion:{private_assertion_id}>
+            {{
+                ?s ?p ?o .
+            }}
+        }}
+    }}
+    """
+
+
+def _add_private_get_result(
+    result: dict[str, HexStr | list[JSONLD] | dict[str, str]],
+    private_assertion_id: HexStr,
+    content_visibility: str,
+    output_format: str,
+    validate: bool,
+    operation_id: str,
+    operation_result: NodeResponseDict,
+) -> dict[str, HexStr | list[JSONLD] | dict[str, str]]:
+    private_assertion = normalize_dataset(operation_result["data"], "N-Quads")
+
+    if validate:
+        _validate_assertion(private_assertion, private_assertion_id)
+
+    formatted_private_assertion = _format_assertion(private_assertion, output_format)
+
+    if content_visibility == KnowledgeAssetContentVisibility.PRIVATE:
+        result = {
+            **result,
+            "assertion": formatted_private_assertion,
+            "assertionId": private_assertion_id,
+        }
+    else:
+        result["private"] = {
+            "assertion": formatted_private_assertion,
+            "assertionId": private_assertion_id,
+        }
+
+    result["operation"]["queryPrivate"] = _format_operation(
+        operation_id, operation_result
+    )
+
+    return result
+
+
 class KnowledgeAsset(Module):
     def __init__(self, manager: DefaultRequestManager):
         self.manager = manager
+        self.allowance_budget = AllowanceBudget(
+            self.get_current_allowance, self.increase_allowance
+        )
+        self.agreement_cache = AgreementCache()
 
     _owner = Method(BlockchainRequest.owner_of)
 
@@ -166,6 +530,7 @@ class KnowledgeAsset(Module):
             self._increase_allowance(spender, allowance_difference)
         elif allowance_difference < 0:
             self._decrease_allowance(spender, -allowance_difference)
+        self.allowance_budget.invalidate()
 
         return allowance_difference
 
@@ -176,6 +541,7 @@ class KnowledgeAsset(Module):
             spender = self._get_contract_address("ServiceAgreementV1")
 
         self._increase_allowance(spender, token_amount)
+        self.allowance_budget.invalidate()
 
         return token_amount
 
@@ -189,6 +555,7 @@ class KnowledgeAsset(Module):
         subtracted_value = min(token_amount, current_allowance)
 
         self._decrease_allowance(spender, subtracted_value)
+        self.allowance_budget.invalidate()
 
         return subtracted_value
 
@@ -211,133 +578,199 @@ class KnowledgeAsset(Module):
         content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
         paranet_ual: UAL | None = None,
     ) -> dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]:
-        blockchain_id = self.manager.blockchain_provider.blockchain_id
-        assertions = format_content(content, content_type)
-
-        public_assertion_id = MerkleTree(
-            hash_assertion_with_indexes(assertions["public"]),
-            sort_pairs=True,
-        ).root
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
+        asset = _prepare_asset(content, content_type)
 
         content_asset_storage_address = self._get_asset_storage_address(
             "ContentAssetStorage"
         )
 
         if token_amount is None:
-            token_amount = int(
-                self._get_bid_suggestion(
-                    blockchain_id,
-                    epochs_number,
-                    public_assertion_metadata["size"],
-                    content_asset_storage_address,
-                    public_assertion_id,
-                    DEFAULT_HASH_FUNCTION_ID,
-                    token_amount or BidSuggestionRange.LOW,
-                )["bidSuggestion"]
+            token_amount = self._get_asset_bid_suggestion(
+                asset, epochs_number, content_asset_storage_address
             )
 
-        current_allowance = self.get_current_allowance()
-        if is_allowance_increased := current_allowance < token_amount:
-            self.increase_allowance(token_amount)
+        token_id, result = self._mint_asset(
+            asset,
+            epochs_number,
+            token_amount,
+            immutable,
+            paranet_ual,
+            content_asset_storage_address,
+        )
 
-        result = {"publicAssertionId": public_assertion_id, "operation": {}}
+        return self._publish_asset(
+            asset, token_id, result, content_asset_storage_address
+        )
+
+    def create_many(
+        self,
+        contents: Iterable[dict[Literal["public", "private"], JSONLD]],
+        epochs_number: int,
+        token_amount: Wei | None = None,
+        immutable: bool = False,
+        content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        paranet_ual: UAL | None = None,
+        concurrency: dict[str, int] | None = None,
+        max_pending: int | None = None,
+        allowance: Wei | None = None,
+    ) -> list[
+        dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]] | Exception
+    ]:
+        concurrency = {**DEFAULT_CREATE_MANY_CONCURRENCY, **(concurrency or {})}
+        content_asset_storage_address = self._get_asset_storage_address(
+            "ContentAssetStorage"
+        )
+
+        if allowance is not None:
+            self.allowance_budget.approve(allowance)
+
+        def prepare(content):
+            return _prepare_asset(content, content_type)
+
+        def bid(asset):
+            if token_amount is not None:
+                return asset, token_amount
+
+            return asset, self._get_asset_bid_suggestion(
+                asset, epochs_number, content_asset_storage_address
+            )
+
+        def mint(asset_and_token_amount):
+            asset, asset_token_amount = asset_and_token_amount
+            return (
+                asset,
+                asset_token_amount,
+                *self._send_mint(
+                    asset, epochs_number, asset_token_amount, immutable, paranet_ual
+                ),
+            )
+
+        def confirm(minted_asset):
+            asset, asset_token_amount, handle, result = minted_asset
+            return asset, *self._confirm_mint(
+                handle, asset_token_amount, result, content_asset_storage_address
+            )
+
+        def publish(asset_token_id_and_result):
+            return self._publish_asset(
+                *asset_token_id_and_result, content_asset_storage_address
+            )
+
+        stages = [
+            Stage(name, fn, concurrency[name])
+            for name, fn in [
+                ("prepare", prepare),
+                ("bid", bid),
+                ("mint", mint),
+                ("confirm", confirm),
+                ("publish", publish),
+            ]
+        ]
+
+        return Pipeline(stages, max_pending).run(contents)
+
+    def _get_asset_bid_suggestion(
+        self,
+        asset: dict[str, Any],
+        epochs_number: int,
+        content_asset_storage_address: Address,
+    ) -> Wei:
+        return int(
+            self._get_bid_suggestion(
+                self.manager.blockchain_provider.blockchain_id,
+                epochs_number,
+                asset["public_assertion_metadata"]["size"],
+                content_asset_storage_address,
+                asset["public_assertion_id"],
+                DEFAULT_HASH_FUNCTION_ID,
+                BidSuggestionRange.LOW,
+            )["bidSuggestion"]
+        )
+
+    def _mint_asset(
+        self,
+        asset: dict[str, Any],
+        epochs_number: int,
+        token_amount: Wei,
+        immutable: bool,
+        paranet_ual: UAL | None,
+        content_asset_storage_address: Address,
+    ) -> tuple[int, dict[str, UAL | HexStr | dict[str, TxReceipt]]]:
+        handle, result = self._send_mint(
+            asset, epochs_number, token_amount, immutable, paranet_ual
+        )
+
+        return self._confirm_mint(
+            handle, token_amount, result, content_asset_storage_address
+        )
+
+    def _send_mint(
+        self,
+        asset: dict[str, Any],
+        epochs_number: int,
+        token_amount: Wei,
+        immutable: bool,
+        paranet_ual: UAL | None,
+    ) -> tuple[TransactionHandle, dict[str, HexStr | dict]]:
+        knowledge_asset_args, paranet, result = _prepare_mint(
+            asset,
+            epochs_number,
+            token_amount,
+            immutable,
+            paranet_ual,
+            self.manager.blockchain_provider.environment,
+            self.manager.blockchain_provider.blockchain_id,
+        )
+
+        self.allowance_budget.reserve(token_amount)
 
         try:
-            if paranet_ual is None:
-                receipt: TxReceipt = self._create(
-                    {
-                        "assertionId": Web3.to_bytes(hexstr=public_assertion_id),
-                        "size": public_assertion_metadata["size"],
-                        "triplesNumber": public_assertion_metadata["triples_number"],
-                        "chunksNumber": public_assertion_metadata["chunks_number"],
-                        "tokenAmount": token_amount,
-                        "epochsNumber": epochs_number,
-                        "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
-                            self.manager.blockchain_provider.environment
-                        ][blockchain_id],
-                        "immutable_": immutable,
-                    }
-                )
+            if paranet is None:
+                handle = self._create(knowledge_asset_args, wait=False)
             else:
-                parsed_paranet_ual = parse_ual(paranet_ual)
-                paranet_knowledge_asset_storage, paranet_knowledge_asset_token_id = (
-                    parsed_paranet_ual["contract_address"],
-                    parsed_paranet_ual["token_id"],
+                handle = self._mint_paranet_knowledge_asset(
+                    *paranet, knowledge_asset_args, wait=False
                 )
+        except Exception:
+            self.allowance_budget.release(token_amount)
+            raise
 
-                receipt: TxReceipt = self._mint_paranet_knowledge_asset(
-                    paranet_knowledge_asset_storage,
-                    paranet_knowledge_asset_token_id,
-                    {
-                        "assertionId": Web3.to_bytes(hexstr=public_assertion_id),
-                        "size": public_assertion_metadata["size"],
-                        "triplesNumber": public_assertion_metadata["triples_number"],
-                        "chunksNumber": public_assertion_metadata["chunks_number"],
-                        "tokenAmount": token_amount,
-                        "epochsNumber": epochs_number,
-                        "scoreFunctionId": DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS[
-                            self.manager.blockchain_provider.environment
-                        ][blockchain_id],
-                        "immutable_": immutable,
-                    },
-                )
+        return handle, result
 
-                result["paranetId"] = Web3.to_hex(
-                    Web3.solidity_keccak(
-                        ["address", "uint256"],
-                        [
-                            paranet_knowledge_asset_storage,
-                            paranet_knowledge_asset_token_id,
-                        ],
-                    )
-                )
-        except ContractLogicError as err:
-            if is_allowance_increased:
-                self.decrease_allowance(token_amount)
-            raise err
+    def _confirm_mint(
+        self,
+        handle: TransactionHandle,
+        token_amount: Wei,
+        result: dict[str, HexStr | dict],
+        content_asset_storage_address: Address,
+    ) -> tuple[int, dict[str, UAL | HexStr | dict[str, TxReceipt]]]:
+        try:
+            receipt = _check_receipt(handle.wait())
+        except Exception:
+            self.allowance_budget.release(token_amount)
+            raise
 
-        events = self.manager.blockchain_provider.decode_logs_event(
-            receipt,
-            "ContentAsset",
-            "AssetMinted",
-        )
-        token_id = events[0].args["tokenId"]
+        self.allowance_budget.confirm(token_amount)
 
-        result["UAL"] = format_ual(
-            blockchain_id, content_asset_storage_address, token_id
+        return _format_mint_result(
+            self.manager.blockchain_provider,
+            receipt,
+            result,
+            content_asset_storage_address,
         )
-        result["operation"]["mintKnowledgeAsset"] = json.loads(Web3.to_json(receipt))
-
-        assertions_list = [
-            {
-                "blockchain": blockchain_id,
-                "contract": content_asset_storage_address,
-                "tokenId": token_id,
-                "assertionId": public_assertion_id,
-                "assertion": assertions["public"],
-                "storeType": StoreTypes.TRIPLE,
-            }
-        ]
 
-        if content.get("private", None):
-            assertions_list.append(
-                {
-                    "blockchain": blockchain_id,
-                    "contract": content_asset_storage_address,
-                    "tokenId": token_id,
-                    "assertionId": MerkleTree(
-                        hash_assertion_with_indexes(assertions["private"]),
-                        sort_pairs=True,
-                    ).root,
-                    "assertion": assertions["private"],
-                    "storeType": StoreTypes.TRIPLE,
-                }
-            )
+    def _publish_asset(
+        self,
+        asset: dict[str, Any],
+        token_id: int,
+        result: dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]],
+        content_asset_storage_address: Address,
+    ) -> dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]:
+        blockchain_id = self.manager.blockchain_provider.blockchain_id
 
         operation_id = self._publish(
-            public_assertion_id,
-            assertions["public"],
+            asset["public_assertion_id"],
+            asset["assertions"]["public"],
             blockchain_id,
             content_asset_storage_address,
             token_id,
@@ -345,19 +778,25 @@ class KnowledgeAsset(Module):
         )["operationId"]
         operation_result = self.get_operation_result(operation_id, "publish")
 
-        result["operation"]["publish"] = {
-            "operationId": operation_id,
-            "status": operation_result["status"],
-        }
+        result["operation"]["publish"] = _format_operation(
+            operation_id, operation_result
+        )
 
         if operation_result["status"] == OperationStatus.COMPLETED:
-            operation_id = self._local_store(assertions_list)["operationId"]
+            operation_id = self._local_store(
+                _build_assertions_list(
+                    asset,
+                    blockchain_id,
+                    content_asset_storage_address,
+                    token_id,
+                    StoreTypes.TRIPLE,
+                )
+            )["operationId"]
             operation_result = self.get_operation_result(operation_id, "local-store")
 
-            result["operation"]["localStore"] = {
-                "operationId": operation_id,
-                "status": operation_result["status"],
-            }
+            result["operation"]["localStore"] = _format_operation(
+                operation_id, operation_result
+            )
 
         return result
 
@@ -403,19 +842,21 @@ class KnowledgeAsset(Module):
         self,
         ual: UAL,
         new_owner: Address,
-    ) -> dict[str, UAL | Address | TxReceipt]:
+        wait: bool = True,
+    ) -> dict[str, UAL | Address | TxReceipt | TransactionHandle]:
         token_id = parse_ual(ual)["token_id"]
 
-        receipt: TxReceipt = self._transfer(
+        receipt: TxReceipt | TransactionHandle = self._transfer(
             self.manager.blockchain_provider.account,
             new_owner,
             token_id,
+            wait=wait,
         )
 
         return {
             "UAL": ual,
             "owner": new_owner,
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": json.loads(Web3.to_json(receipt)) if wait else receipt,
         }
 
     _update = Method(NodeRequest.update)
@@ -439,30 +880,14 @@ class KnowledgeAsset(Module):
             parsed_ual["token_id"],
         )
 
-        assertions = format_content(content, content_type)
-
-        public_assertion_id = MerkleTree(
-            hash_assertion_with_indexes(assertions["public"]),
-            sort_pairs=True,
-        ).root
-        public_assertion_metadata = generate_assertion_metadata(assertions["public"])
+        asset = _prepare_asset(content, content_type)
+        public_assertion_id = asset["public_assertion_id"]
+        public_assertion_metadata = asset["public_assertion_metadata"]
 
         if token_amount is None:
-            agreement_id = self.get_agreement_id(
-                content_asset_storage_address, token_id
-            )
-            # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
-            )
-
-            timestamp_now = self._get_block("latest")["timestamp"]
-            current_epoch = math.floor(
-                (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
-            )
-            epochs_left = agreement_data.epochsNumber - current_epoch
+            agreement, epochs_left = self._get_agreement(ual)
 
-            token_amount = int(
+            token_amount = _get_update_token_amount(
                 self._get_bid_suggestion(
                     blockchain_id,
                     epochs_left,
@@ -470,16 +895,12 @@ class KnowledgeAsset(Module):
                     content_asset_storage_address,
                     public_assertion_id,
                     DEFAULT_HASH_FUNCTION_ID,
-                    token_amount or BidSuggestionRange.LOW,
-                )["bidSuggestion"]
+                    BidSuggestionRange.LOW,
+                ),
+                agreement,
             )
 
-            token_amount -= agreement_data.tokens[0]
-            token_amount = token_amount if token_amount > 0 else 0
-
-        current_allowance = self.get_current_allowance()
-        if is_allowance_increased := current_allowance < token_amount:
-            self.increase_allowance(token_amount)
+        self.allowance_budget.reserve(token_amount)
 
         try:
             self._update_asset_state(
@@ -490,43 +911,28 @@ class KnowledgeAsset(Module):
                 chunks_number=public_assertion_metadata["chunks_number"],
                 update_token_amount=token_amount,
             )
-        except ContractLogicError as err:
-            if is_allowance_increased:
-                self.decrease_allowance(token_amount)
-            raise err
-
-        assertions_list = [
-            {
-                "blockchain": blockchain_id,
-                "contract": content_asset_storage_address,
-                "tokenId": token_id,
-                "assertionId": public_assertion_id,
-                "assertion": assertions["public"],
-                "storeType": StoreTypes.PENDING,
-            }
-        ]
-
-        if content.get("private", None):
-            assertions_list.append(
-                {
-                    "blockchain": blockchain_id,
-                    "contract": content_asset_storage_address,
-                    "tokenId": token_id,
-                    "assertionId": MerkleTree(
-                        hash_assertion_with_indexes(assertions["private"]),
-                        sort_pairs=True,
-                    ).root,
-                    "assertion": assertions["private"],
-                    "storeType": StoreTypes.PENDING,
-                }
-            )
-
-        operation_id = self._local_store(assertions_list)["operationId"]
+        except Exception:
+            self.allowance_budget.release(token_amount)
+            raise
+        finally:
+            self.agreement_cache.invalidate(ual)
+
+        self.allowance_budget.confirm(token_amount)
+
+        operation_id = self._local_store(
+            _build_assertions_list(
+                asset,
+                blockchain_id,
+                content_asset_storage_address,
+                token_id,
+                StoreTypes.PENDING,
+            )
+        )["operationId"]
         self.get_operation_result(operation_id, "local-store")
 
         operation_id = self._update(
             public_assertion_id,
-            assertions["public"],
+            asset["assertions"]["public"],
             blockchain_id,
             content_asset_storage_address,
             token_id,
@@ -537,10 +943,7 @@ class KnowledgeAsset(Module):
         return {
             "UAL": ual,
             "publicAssertionId": public_assertion_id,
-            "operation": {
-                "operationId": operation_id,
-                "status": operation_result["status"],
-            },
+            "operation": _format_operation(operation_id, operation_result),
         }
 
     _cancel_update = Method(BlockchainRequest.cancel_asset_state_update)
@@ -549,6 +952,7 @@ class KnowledgeAsset(Module):
         token_id = parse_ual(ual)["token_id"]
 
         receipt: TxReceipt = self._cancel_update(token_id)
+        self._invalidate_agreement(ual)
 
         return {
             "UAL": ual,
@@ -557,12 +961,18 @@ class KnowledgeAsset(Module):
 
     _burn_asset = Method(BlockchainRequest.burn_asset)
 
-    def burn(self, ual: UAL) -> dict[str, UAL | TxReceipt]:
+    def burn(
+        self, ual: UAL, wait: bool = True
+    ) -> dict[str, UAL | TxReceipt | TransactionHandle]:
         token_id = parse_ual(ual)["token_id"]
 
-        receipt: TxReceipt = self._burn_asset(token_id)
+        receipt: TxReceipt | TransactionHandle = self._burn_asset(token_id, wait=wait)
+        self._invalidate_agreement(ual, receipt)
 
-        return {"UAL": ual, "operation": json.loads(Web3.to_json(receipt))}
+        return {
+            "UAL": ual,
+            "operation": json.loads(Web3.to_json(receipt)) if wait else receipt,
+        }
 
     _get_assertion_ids = Method(BlockchainRequest.get_assertion_ids)
     _get_latest_assertion_id = Method(BlockchainRequest.get_latest_assertion_id)
@@ -579,68 +989,31 @@ class KnowledgeAsset(Module):
         output_format: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
         validate: bool = True,
     ) -> dict[str, UAL | HexStr | list[JSONLD] | dict[str, str]]:
-        state = (
-            state.upper()
-            if (isinstance(state, str) and not re.match(r"^0x[a-fA-F0-9]{64}$", state))
-            else state
+        state, content_visibility, output_format = _normalize_get_options(
+            state, content_visibility, output_format
         )
-        content_visibility = content_visibility.upper()
-        output_format = output_format.upper()
 
         token_id = parse_ual(ual)["token_id"]
 
-        def handle_latest_state(token_id: int) -> tuple[HexStr, bool]:
-            unfinalized_state = Web3.to_hex(self._get_unfinalized_state(token_id))
-
-            if unfinalized_state and unfinalized_state != HASH_ZERO:
-                return unfinalized_state, False
-            else:
-                return handle_latest_finalized_state(token_id)
-
-        def handle_latest_finalized_state(token_id: int) -> tuple[HexStr, bool]:
-            return Web3.to_hex(self._get_latest_assertion_id(token_id)), True
-
-        is_state_finalized = False
-
         match state:
             case KnowledgeAssetEnumStates.LATEST:
-                public_assertion_id, is_state_finalized = handle_latest_state(token_id)
+                public_assertion_id, is_state_finalized = _resolve_latest_state(
+                    *self.manager.batch_request(
+                        self._get_unfinalized_state.request(token_id),
+                        self._get_latest_assertion_id.request(token_id),
+                    )
+                )
 
             case KnowledgeAssetEnumStates.LATEST_FINALIZED:
-                public_assertion_id, is_state_finalized = handle_latest_finalized_state(
-                    token_id
+                public_assertion_id = Web3.to_hex(
+                    self._get_latest_assertion_id(token_id)
                 )
+                is_state_finalized = True
 
-            case _ if isinstance(state, int):
-                assertion_ids = [
-                    Web3.to_hex(assertion_id)
-                    for assertion_id in self._get_assertion_ids(token_id)
-                ]
-                if 0 <= state < (states_number := len(assertion_ids)):
-                    public_assertion_id = assertion_ids[state]
-
-                    if state == states_number - 1:
-                        is_state_finalized = True
-                else:
-                    raise InvalidStateOption(f"State index {state} is out of range.")
-
-            case _ if isinstance(state, str) and re.match(
-                r"^0x[a-fA-F0-9]{64}$", state
-            ):
-                assertion_ids = [
-                    Web3.to_hex(assertion_id)
-                    for assertion_id in self._get_assertion_ids(token_id)
-                ]
-
-                if state in assertion_ids:
-                    public_assertion_id = state
-
-                    if state == assertion_ids[-1]:
-                        is_state_finalized = True
-                else:
-                    raise InvalidStateOption(
-                        f"Given state hash: {state} is not a part of the KA."
-                    )
+            case _ if isinstance(state, int) or _is_state_hash(state):
+                public_assertion_id, is_state_finalized = _resolve_state(
+                    state, self._get_assertion_ids(token_id)
+                )
 
             case _:
                 raise InvalidStateOption(f"Invalid state option: {state}.")
@@ -652,148 +1025,48 @@ class KnowledgeAsset(Module):
         get_public_operation_result = self.get_operation_result(
             get_public_operation_id, "get"
         )
-        public_assertion = get_public_operation_result["data"].get("assertion", None)
-
-        if public_assertion is None:
-            raise MissingKnowledgeAssetState("Unable to find state on the network!")
-
-        if validate:
-            root = MerkleTree(
-                hash_assertion_with_indexes(public_assertion), sort_pairs=True
-            ).root
-            if root != public_assertion_id:
-                raise InvalidKnowledgeAsset(
-                    f"State: {public_assertion_id}. " f"Merkle Tree Root: {root}"
-                )
-
-        result = {"operation": {}}
-        if content_visibility != KnowledgeAssetContentVisibility.PRIVATE:
-            formatted_public_assertion = public_assertion
-
-            match output_format:
-                case "NQUADS" | "N-QUADS":
-                    formatted_public_assertion: list[JSONLD] = jsonld.from_rdf(
-                        "\n".join(public_assertion),
-                        {"algorithm": "URDNA2015", "format": "application/n-quads"},
-                    )
-                case "JSONLD" | "JSON-LD":
-                    formatted_public_assertion = "\n".join(public_assertion)
+        public_assertion = _get_public_assertion(
+            get_public_operation_result, public_assertion_id, validate
+        )
 
-                case _:
-                    raise DatasetOutputFormatNotSupported(
-                        f"{output_format} isn't supported!"
-                    )
+        result = _format_public_get_result(
+            public_assertion,
+            public_assertion_id,
+            content_visibility,
+            output_format,
+            get_public_operation_id,
+            get_public_operation_result,
+        )
 
-            if content_visibility == KnowledgeAssetContentVisibility.PUBLIC:
-                result = {
-                    **result,
-                    "asertion": formatted_public_assertion,
-                    "assertionId": public_assertion_id,
-                }
-            else:
-                result["public"] = {
-                    "assertion": formatted_public_assertion,
-                    "assertionId": public_assertion_id,
-                }
-
-            result["operation"]["publicGet"] = {
-                "operationId": get_public_operation_id,
-                "status": get_public_operation_result["status"],
-            }
-
-        if content_visibility != KnowledgeAssetContentVisibility.PUBLIC:
-            private_assertion_link_triples = list(
-                filter(
-                    lambda element: PRIVATE_ASSERTION_PREDICATE in element,
-                    public_assertion,
-                )
+        if (
+            content_visibility != KnowledgeAssetContentVisibility.PUBLIC
+            and (private_assertion_id := _get_private_assertion_id(public_assertion))
+            and get_public_operation_result["data"].get("privateAssertion", None)
+            is None
+        ):
+            query_private_operation_id = self._query(
+                _get_private_assertion_query(private_assertion_id),
+                "CONSTRUCT",
+                (
+                    PRIVATE_CURRENT_REPOSITORY
+                    if is_state_finalized
+                    else PRIVATE_HISTORICAL_REPOSITORY
+                ),
+            )["operationId"]
+
+            query_private_operation_result = self.get_operation_result(
+                query_private_operation_id, "query"
             )
 
-            if private_assertion_link_triples:
-                private_assertion_id = re.search(
-                    r'"(.*?)"', private_assertion_link_triples[0]
-                ).group(1)
-
-                private_assertion = get_public_operation_result["data"].get(
-                    "privateAssertion", None
-                )
-
-                query_private_operation_id: NodeResponseDict | None = None
-                if private_assertion is None:
-                    query = f"""
-                    CONSTRUCT {{ ?s ?p ?o }}
-                    WHERE {{
-                        {{
-                            GRAPH <assertion:{private_assertion_id}>
-                            {{
-                                ?s ?p ?o .
-                            }}
-                        }}
-                    }}
-                    """
-
-                    query_private_operation_id = self._query(
-                        query,
-                        "CONSTRUCT",
-                        PRIVATE_CURRENT_REPOSITORY
-                        if is_state_finalized
-                        else PRIVATE_HISTORICAL_REPOSITORY,
-                    )["operationId"]
-
-                    query_private_operation_result = self.get_operation_result(
-                        query_private_operation_id, "query"
-                    )
-
-                    private_assertion = normalize_dataset(
-                        query_private_operation_result["data"],
-                        "N-Quads",
-                    )
-
-                    if validate:
-                        root = MerkleTree(
-                            hash_assertion_with_indexes(private_assertion),
-                            sort_pairs=True,
-                        ).root
-                        if root != private_assertion_id:
-                            raise InvalidKnowledgeAsset(
-                                f"State: {private_assertion_id}. "
-                                f"Merkle Tree Root: {root}"
-                            )
-
-                    match output_format:
-                        case "NQUADS" | "N-QUADS":
-                            formatted_private_assertion: list[JSONLD] = jsonld.from_rdf(
-                                "\n".join(private_assertion),
-                                {
-                                    "algorithm": "URDNA2015",
-                                    "format": "application/n-quads",
-                                },
-                            )
-                        case "JSONLD" | "JSON-LD":
-                            formatted_private_assertion = "\n".join(private_assertion)
-
-                        case _:
-                            raise DatasetOutputFormatNotSupported(
-                                f"{output_format} isn't supported!"
-                            )
-
-                    if content_visibility == KnowledgeAssetContentVisibility:
-                        result = {
-                            **result,
-                            "assertion": formatted_private_assertion,
-                            "assertionId": private_assertion_id,
-                        }
-                    else:
-                        result["private"] = {
-                            "assertion": formatted_private_assertion,
-                            "assertionId": private_assertion_id,
-                        }
-
-                    if query_private_operation_id is not None:
-                        result["operation"]["queryPrivate"] = {
-                            "operationId": query_private_operation_id,
-                            "status": query_private_operation_result["status"],
-                        }
+            result = _add_private_get_result(
+                result,
+                private_assertion_id,
+                content_visibility,
+                output_format,
+                validate,
+                query_private_operation_id,
+                query_private_operation_result,
+            )
 
         return result
 
@@ -804,7 +1077,8 @@ class KnowledgeAsset(Module):
         ual: UAL,
         additional_epochs: int,
         token_amount: Wei | None = None,
-    ) -> dict[str, UAL | TxReceipt]:
+        wait: bool = True,
+    ) -> dict[str, UAL | TxReceipt | TransactionHandle]:
         parsed_ual = parse_ual(ual)
         blockchain_id, content_asset_storage_address, token_id = (
             parsed_ual["blockchain"],
@@ -813,10 +1087,14 @@ class KnowledgeAsset(Module):
         )
 
         if token_amount is None:
-            latest_finalized_state = self._get_latest_assertion_id(token_id)
-            latest_finalized_state_size = self._get_assertion_size(
-                latest_finalized_state
-            )
+            if (agreement := self.agreement_cache.get(ual)) is not None:
+                latest_finalized_state = agreement.latest_state
+                latest_finalized_state_size = agreement.latest_state_size
+            else:
+                latest_finalized_state = self._get_latest_assertion_id(token_id)
+                latest_finalized_state_size = self._get_assertion_size(
+                    latest_finalized_state
+                )
 
             token_amount = int(
                 self._get_bid_suggestion(
@@ -830,13 +1108,14 @@ class KnowledgeAsset(Module):
                 )["bidSuggestion"]
             )
 
-        receipt: TxReceipt = self._extend_storing_period(
-            token_id, additional_epochs, token_amount
+        receipt: TxReceipt | TransactionHandle = self._extend_storing_period(
+            token_id, additional_epochs, token_amount, wait=wait
         )
+        self._invalidate_agreement(ual, receipt)
 
         return {
             "UAL": ual,
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": json.loads(Web3.to_json(receipt)) if wait else receipt,
         }
 
     _get_assertion_size = Method(BlockchainRequest.get_assertion_size)
@@ -855,36 +1134,19 @@ class KnowledgeAsset(Module):
         )
 
         if token_amount is None:
-            agreement_id = self.get_agreement_id(
-                content_asset_storage_address, token_id
-            )
-            # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
-            )
-
-            timestamp_now = self._get_block("latest")["timestamp"]
-            current_epoch = math.floor(
-                (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
-            )
-            epochs_left = agreement_data.epochsNumber - current_epoch
-
-            latest_finalized_state = self._get_latest_assertion_id(token_id)
-            latest_finalized_state_size = self._get_assertion_size(
-                latest_finalized_state
-            )
+            agreement, epochs_left = self._get_agreement(ual)
 
             token_amount = int(
                 self._get_bid_suggestion(
                     blockchain_id,
                     epochs_left,
-                    latest_finalized_state_size,
+                    agreement.latest_state_size,
                     content_asset_storage_address,
-                    latest_finalized_state,
+                    agreement.latest_state,
                     DEFAULT_HASH_FUNCTION_ID,
                     token_amount or BidSuggestionRange.LOW,
                 )["bidSuggestion"]
-            ) - sum(agreement_data.tokensInfo)
+            ) - sum(agreement.agreement_data.tokens)
 
             if token_amount <= 0:
                 raise InvalidTokenAmount(
@@ -894,6 +1156,7 @@ class KnowledgeAsset(Module):
                 )
 
         receipt: TxReceipt = self._add_tokens(token_id, token_amount)
+        self._invalidate_agreement(ual)
 
         return {
             "UAL": ual,
@@ -915,34 +1178,19 @@ class KnowledgeAsset(Module):
         )
 
         if token_amount is None:
-            agreement_id = self.get_agreement_id(
-                content_asset_storage_address, token_id
-            )
-            # TODO: Dynamic types for namedtuples?
-            agreement_data: Type[AgreementData] = self._get_service_agreement_data(
-                agreement_id
-            )
-
-            timestamp_now = self._get_block("latest")["timestamp"]
-            current_epoch = math.floor(
-                (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
-            )
-            epochs_left = agreement_data.epochsNumber - current_epoch
-
-            unfinalized_state = self._get_latest_assertion_id(token_id)
-            unfinalized_state_size = self._get_assertion_size(unfinalized_state)
+            agreement, epochs_left = self._get_agreement(ual)
 
             token_amount = int(
                 self._get_bid_suggestion(
                     blockchain_id,
                     epochs_left,
-                    unfinalized_state_size,
+                    agreement.latest_state_size,
                     content_asset_storage_address,
-                    unfinalized_state,
+                    agreement.latest_state,
                     DEFAULT_HASH_FUNCTION_ID,
                     token_amount or BidSuggestionRange.LOW,
                 )["bidSuggestion"]
-            ) - sum(agreement_data.tokensInfo)
+            ) - sum(agreement.agreement_data.tokens)
 
             if token_amount <= 0:
                 raise InvalidTokenAmount(
@@ -952,6 +1200,7 @@ class KnowledgeAsset(Module):
                 )
 
         receipt: TxReceipt = self._add_update_tokens(token_id, token_amount)
+        self._invalidate_agreement(ual)
 
         return {
             "UAL": ual,
@@ -970,17 +1219,616 @@ class KnowledgeAsset(Module):
         keyword = generate_keyword(contract_address, first_assertion_id)
         return generate_agreement_id(contract_address, token_id, keyword)
 
-    _get_operation_result = Method(NodeRequest.get_operation_result)
+    def prefetch_agreements(self, uals: Iterable[UAL]) -> list[AgreementEntry]:
+        uals = list(uals)
+        entries = {ual: self.agreement_cache.get(ual) for ual in uals}
+        missing = [ual for ual, entry in entries.items() if entry is None]
+        token_ids = [parse_ual(ual)["token_id"] for ual in missing]
+
+        states = self.manager.batch_request(
+            *_get_agreement_states_requests(self, token_ids)
+        )
+        agreement_ids = [
+            _generate_agreement_id(ual, first_assertion_id)
+            for ual, first_assertion_id in zip(missing, states[::2])
+        ]
+
+        anchor_clock = not self.agreement_cache.clock.is_anchored
+        results = self.manager.batch_request(
+            *_get_agreement_data_requests(
+                self, agreement_ids, states[1::2], anchor_clock
+            )
+        )
+        if anchor_clock:
+            self.agreement_cache.clock.anchor(results.pop()["timestamp"])
+
+        _cache_agreements(self.agreement_cache, entries, agreement_ids, states, results)
+
+        return [entries[ual] for ual in uals]
+
+    def _get_agreement(self, ual: UAL) -> tuple[AgreementEntry, int]:
+        entry = self.prefetch_agreements([ual])[0]
+
+        epochs_left = self.agreement_cache.epochs_left(entry.agreement_data)
+        if epochs_left is None:
+            self.agreement_cache.clock.anchor(self._get_block("latest")["timestamp"])
+            epochs_left = self.agreement_cache.epochs_left(entry.agreement_data)
+
+        return entry, epochs_left
+
+    def _invalidate_agreement(
+        self, ual: UAL, receipt: TxReceipt | TransactionHandle | None = None
+    ) -> None:
+        self.agreement_cache.invalidate(ual)
+        if isinstance(receipt, TransactionHandle):
+            receipt.future.add_done_callback(
+                lambda _: self.agreement_cache.invalidate(ual)
+            )
 
-    @retry(catch=OperationNotFinished, max_retries=5, base_delay=1, backoff=2)
     def get_operation_result(
         self, operation_id: str, operation: str
     ) -> NodeResponseDict:
-        operation_result = self._get_operation_result(
-            operation_id=operation_id,
-            operation=operation,
+        return self.manager.poll_operation_result(operation_id, operation).result()
+
+    def poll_operation_result(
+        self,
+        operation_id: str,
+        operation: str,
+        callback: Callable[[Future], Any] | None = None,
+    ) -> Future:
+        return self.manager.poll_operation_result(operation_id, operation, callback)
+
+
+class AsyncKnowledgeAsset(AsyncModule):
+    def __init__(self, manager: AsyncRequestManager):
+        self.manager = manager
+        self.allowance_budget = AsyncAllowanceBudget(
+            self.get_current_allowance, self.increase_allowance
+        )
+        self.agreement_cache = AgreementCache()
+
+    _get_contract_address = Method(BlockchainRequest.get_contract_address)
+    _get_current_allowance = Method(BlockchainRequest.allowance)
+
+    async def get_current_allowance(self, spender: Address | None = None) -> Wei:
+        if spender is None:
+            spender = await self._get_contract_address("ServiceAgreementV1")
+
+        return int(
+            await self._get_current_allowance(
+                self.manager.blockchain_provider.account.address, spender
+            )
         )
 
-        validate_operation_status(operation_result)
+    _increase_allowance = Method(BlockchainRequest.increase_allowance)
+    _decrease_allowance = Method(BlockchainRequest.decrease_allowance)
+
+    async def increase_allowance(
+        self, token_amount: Wei, spender: Address | None = None
+    ) -> Wei:
+        if spender is None:
+            spender = await self._get_contract_address("ServiceAgreementV1")
+
+        await self._increase_allowance(spender, token_amount)
+        self.allowance_budget.invalidate()
+
+        return token_amount
 
-        return operation_result
+    async def decrease_allowance(
+        self, token_amount: Wei, spender: Address | None = None
+    ) -> Wei:
+        if spender is None:
+            spender = await self._get_contract_address("ServiceAgreementV1")
+
+        current_allowance = await self.get_current_allowance(spender)
+        subtracted_value = min(token_amount, current_allowance)
+
+        await self._decrease_allowance(spender, subtracted_value)
+        self.allowance_budget.invalidate()
+
+        return subtracted_value
+
+    _get_asset_storage_address = Method(BlockchainRequest.get_asset_storage_address)
+    _create = Method(BlockchainRequest.create_asset)
+    _mint_paranet_knowledge_asset = Method(BlockchainRequest.mint_knowledge_asset)
+
+    _get_bid_suggestion = Method(NodeRequest.bid_suggestion)
+    _local_store = Method(NodeRequest.local_store)
+    _publish = Method(NodeRequest.publish)
+
+    async def create(
+        self,
+        content: dict[Literal["public", "private"], JSONLD],
+        epochs_number: int,
+        token_amount: Wei | None = None,
+        immutable: bool = False,
+        content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        paranet_ual: UAL | None = None,
+    ) -> dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]:
+        asset = _prepare_asset(content, content_type)
+
+        content_asset_storage_address = await self._get_asset_storage_address(
+            "ContentAssetStorage"
+        )
+
+        if token_amount is None:
+            token_amount = await self._get_asset_bid_suggestion(
+                asset, epochs_number, content_asset_storage_address
+            )
+
+        token_id, result = await self._mint_asset(
+            asset,
+            epochs_number,
+            token_amount,
+            immutable,
+            paranet_ual,
+            content_asset_storage_address,
+        )
+
+        return await self._publish_asset(
+            asset, token_id, result, content_asset_storage_address
+        )
+
+    async def create_many(
+        self,
+        contents: Iterable[dict[Literal["public", "private"], JSONLD]],
+        epochs_number: int,
+        token_amount: Wei | None = None,
+        immutable: bool = False,
+        content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        paranet_ual: UAL | None = None,
+        concurrency: dict[str, int] | None = None,
+        max_pending: int | None = None,
+        allowance: Wei | None = None,
+    ) -> list[
+        dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]] | Exception
+    ]:
+        concurrency = {**DEFAULT_CREATE_MANY_CONCURRENCY, **(concurrency or {})}
+        content_asset_storage_address = await self._get_asset_storage_address(
+            "ContentAssetStorage"
+        )
+
+        if allowance is not None:
+            await self.allowance_budget.approve(allowance)
+
+        async def prepare(content):
+            return await asyncio.to_thread(_prepare_asset, content, content_type)
+
+        async def bid(asset):
+            if token_amount is not None:
+                return asset, token_amount
+
+            return asset, await self._get_asset_bid_suggestion(
+                asset, epochs_number, content_asset_storage_address
+            )
+
+        async def mint(asset_and_token_amount):
+            asset, asset_token_amount = asset_and_token_amount
+            return (
+                asset,
+                asset_token_amount,
+                *await self._send_mint(
+                    asset, epochs_number, asset_token_amount, immutable, paranet_ual
+                ),
+            )
+
+        async def confirm(minted_asset):
+            asset, asset_token_amount, handle, result = minted_asset
+            return asset, *await self._confirm_mint(
+                handle, asset_token_amount, result, content_asset_storage_address
+            )
+
+        async def publish(asset_token_id_and_result):
+            return await self._publish_asset(
+                *asset_token_id_and_result, content_asset_storage_address
+            )
+
+        stages = [
+            Stage(name, fn, concurrency[name])
+            for name, fn in [
+                ("prepare", prepare),
+                ("bid", bid),
+                ("mint", mint),
+                ("confirm", confirm),
+                ("publish", publish),
+            ]
+        ]
+
+        return await AsyncPipeline(stages, max_pending).run(contents)
+
+    async def _get_asset_bid_suggestion(
+        self,
+        asset: dict[str, Any],
+        epochs_number: int,
+        content_asset_storage_address: Address,
+    ) -> Wei:
+        return int(
+            (
+                await self._get_bid_suggestion(
+                    self.manager.blockchain_provider.blockchain_id,
+                    epochs_number,
+                    asset["public_assertion_metadata"]["size"],
+                    content_asset_storage_address,
+                    asset["public_assertion_id"],
+                    DEFAULT_HASH_FUNCTION_ID,
+                    BidSuggestionRange.LOW,
+                )
+            )["bidSuggestion"]
+        )
+
+    async def _mint_asset(
+        self,
+        asset: dict[str, Any],
+        epochs_number: int,
+        token_amount: Wei,
+        immutable: bool,
+        paranet_ual: UAL | None,
+        content_asset_storage_address: Address,
+    ) -> tuple[int, dict[str, UAL | HexStr | dict[str, TxReceipt]]]:
+        handle, result = await self._send_mint(
+            asset, epochs_number, token_amount, immutable, paranet_ual
+        )
+
+        return await self._confirm_mint(
+            handle, token_amount, result, content_asset_storage_address
+        )
+
+    async def _send_mint(
+        self,
+        asset: dict[str, Any],
+        epochs_number: int,
+        token_amount: Wei,
+        immutable: bool,
+        paranet_ual: UAL | None,
+    ) -> tuple[AsyncTransactionHandle | TransactionHandle, dict[str, HexStr | dict]]:
+        knowledge_asset_args, paranet, result = _prepare_mint(
+            asset,
+            epochs_number,
+            token_amount,
+            immutable,
+            paranet_ual,
+            self.manager.blockchain_provider.environment,
+            self.manager.blockchain_provider.blockchain_id,
+        )
+
+        await self.allowance_budget.reserve(token_amount)
+
+        try:
+            if paranet is None:
+                handle = await self._create(knowledge_asset_args, wait=False)
+            else:
+                handle = await self._mint_paranet_knowledge_asset(
+                    *paranet, knowledge_asset_args, wait=False
+                )
+        except Exception:
+            self.allowance_budget.release(token_amount)
+            raise
+
+        return handle, result
+
+    async def _confirm_mint(
+        self,
+        handle: AsyncTransactionHandle | TransactionHandle,
+        token_amount: Wei,
+        result: dict[str, HexStr | dict],
+        content_asset_storage_address: Address,
+    ) -> tuple[int, dict[str, UAL | HexStr | dict[str, TxReceipt]]]:
+        try:
+            receipt = _check_receipt(await handle)
+        except Exception:
+            self.allowance_budget.release(token_amount)
+            raise
+
+        self.allowance_budget.confirm(token_amount)
+
+        return _format_mint_result(
+            self.manager.blockchain_provider,
+            receipt,
+            result,
+            content_asset_storage_address,
+        )
+
+    async def _publish_asset(
+        self,
+        asset: dict[str, Any],
+        token_id: int,
+        result: dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]],
+        content_asset_storage_address: Address,
+    ) -> dict[str, UAL | HexStr | dict[str, dict[str, str] | TxReceipt]]:
+        blockchain_id = self.manager.blockchain_provider.blockchain_id
+
+        operation_id = (
+            await self._publish(
+                asset["public_assertion_id"],
+                asset["assertions"]["public"],
+                blockchain_id,
+                content_asset_storage_address,
+                token_id,
+                DEFAULT_HASH_FUNCTION_ID,
+            )
+        )["operationId"]
+        operation_result = await self.get_operation_result(operation_id, "publish")
+
+        result["operation"]["publish"] = _format_operation(
+            operation_id, operation_result
+        )
+
+        if operation_result["status"] == OperationStatus.COMPLETED:
+            operation_id = (
+                await self._local_store(
+                    _build_assertions_list(
+                        asset,
+                        blockchain_id,
+                        content_asset_storage_address,
+                        token_id,
+                        StoreTypes.TRIPLE,
+                    )
+                )
+            )["operationId"]
+            operation_result = await self.get_operation_result(
+                operation_id, "local-store"
+            )
+
+            result["operation"]["localStore"] = _format_operation(
+                operation_id, operation_result
+            )
+
+        return result
+
+    _update = Method(NodeRequest.update)
+
+    _get_block = Method(BlockchainRequest.get_block)
+
+    _get_service_agreement_data = Method(BlockchainRequest.get_service_agreement_data)
+    _update_asset_state = Method(BlockchainRequest.update_asset_state)
+
+    async def update(
+        self,
+        ual: UAL,
+        content: dict[Literal["public", "private"], JSONLD],
+        token_amount: Wei | None = None,
+        content_type: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+    ) -> dict[str, UAL | HexStr | dict[str, str]]:
+        parsed_ual = parse_ual(ual)
+        blockchain_id, content_asset_storage_address, token_id = (
+            parsed_ual["blockchain"],
+            parsed_ual["contract_address"],
+            parsed_ual["token_id"],
+        )
+
+        asset = _prepare_asset(content, content_type)
+        public_assertion_id = asset["public_assertion_id"]
+        public_assertion_metadata = asset["public_assertion_metadata"]
+
+        if token_amount is None:
+            agreement, epochs_left = await self._get_agreement(ual)
+
+            token_amount = _get_update_token_amount(
+                await self._get_bid_suggestion(
+                    blockchain_id,
+                    epochs_left,
+                    public_assertion_metadata["size"],
+                    content_asset_storage_address,
+                    public_assertion_id,
+                    DEFAULT_HASH_FUNCTION_ID,
+                    BidSuggestionRange.LOW,
+                ),
+                agreement,
+            )
+
+        await self.allowance_budget.reserve(token_amount)
+
+        try:
+            await self._update_asset_state(
+                token_id=token_id,
+                assertion_id=public_assertion_id,
+                size=public_assertion_metadata["size"],
+                triples_number=public_assertion_metadata["triples_number"],
+                chunks_number=public_assertion_metadata["chunks_number"],
+                update_token_amount=token_amount,
+            )
+        except Exception:
+            self.allowance_budget.release(token_amount)
+            raise
+        finally:
+            self.agreement_cache.invalidate(ual)
+
+        self.allowance_budget.confirm(token_amount)
+
+        operation_id = (
+            await self._local_store(
+                _build_assertions_list(
+                    asset,
+                    blockchain_id,
+                    content_asset_storage_address,
+                    token_id,
+                    StoreTypes.PENDING,
+                )
+            )
+        )["operationId"]
+        await self.get_operation_result(operation_id, "local-store")
+
+        operation_id = (
+            await self._update(
+                public_assertion_id,
+                asset["assertions"]["public"],
+                blockchain_id,
+                content_asset_storage_address,
+                token_id,
+                DEFAULT_HASH_FUNCTION_ID,
+            )
+        )["operationId"]
+        operation_result = await self.get_operation_result(operation_id, "update")
+
+        return {
+            "UAL": ual,
+            "publicAssertionId": public_assertion_id,
+            "operation": _format_operation(operation_id, operation_result),
+        }
+
+    _get_assertion_ids = Method(BlockchainRequest.get_assertion_ids)
+    _get_latest_assertion_id = Method(BlockchainRequest.get_latest_assertion_id)
+    _get_unfinalized_state = Method(BlockchainRequest.get_unfinalized_state)
+    _get_assertion_size = Method(BlockchainRequest.get_assertion_size)
+
+    _get = Method(NodeRequest.get)
+    _query = Method(NodeRequest.query)
+
+    async def get(
+        self,
+        ual: UAL,
+        state: str | HexStr | int = KnowledgeAssetEnumStates.LATEST,
+        content_visibility: str = KnowledgeAssetContentVisibility.ALL,
+        output_format: Literal["JSON-LD", "N-Quads"] = "JSON-LD",
+        validate: bool = True,
+    ) -> dict[str, UAL | HexStr | list[JSONLD] | dict[str, str]]:
+        state, content_visibility, output_format = _normalize_get_options(
+            state, content_visibility, output_format
+        )
+
+        token_id = parse_ual(ual)["token_id"]
+
+        match state:
+            case KnowledgeAssetEnumStates.LATEST:
+                public_assertion_id, is_state_finalized = _resolve_latest_state(
+                    *await self.manager.async_batch_request(
+                        self._get_unfinalized_state.request(token_id),
+                        self._get_latest_assertion_id.request(token_id),
+                    )
+                )
+
+            case KnowledgeAssetEnumStates.LATEST_FINALIZED:
+                public_assertion_id = Web3.to_hex(
+                    await self._get_latest_assertion_id(token_id)
+                )
+                is_state_finalized = True
+
+            case _ if isinstance(state, int) or _is_state_hash(state):
+                public_assertion_id, is_state_finalized = _resolve_state(
+                    state, await self._get_assertion_ids(token_id)
+                )
+
+            case _:
+                raise InvalidStateOption(f"Invalid state option: {state}.")
+
+        get_public_operation_id: NodeResponseDict = (
+            await self._get(ual, public_assertion_id, hashFunctionId=1)
+        )["operationId"]
+
+        get_public_operation_result = await self.get_operation_result(
+            get_public_operation_id, "get"
+        )
+        public_assertion = _get_public_assertion(
+            get_public_operation_result, public_assertion_id, validate
+        )
+
+        result = _format_public_get_result(
+            public_assertion,
+            public_assertion_id,
+            content_visibility,
+            output_format,
+            get_public_operation_id,
+            get_public_operation_result,
+        )
+
+        if (
+            content_visibility != KnowledgeAssetContentVisibility.PUBLIC
+            and (private_assertion_id := _get_private_assertion_id(public_assertion))
+            and get_public_operation_result["data"].get("privateAssertion", None)
+            is None
+        ):
+            query_private_operation_id = (
+                await self._query(
+                    _get_private_assertion_query(private_assertion_id),
+                    "CONSTRUCT",
+                    (
+                        PRIVATE_CURRENT_REPOSITORY
+                        if is_state_finalized
+                        else PRIVATE_HISTORICAL_REPOSITORY
+                    ),
+                )
+            )["operationId"]
+
+            query_private_operation_result = await self.get_operation_result(
+                query_private_operation_id, "query"
+            )
+
+            result = _add_private_get_result(
+                result,
+                private_assertion_id,
+                content_visibility,
+                output_format,
+                validate,
+                query_private_operation_id,
+                query_private_operation_result,
+            )
+
+        return result
+
+    _owner = Method(BlockchainRequest.owner_of)
+
+    async def get_owner(self, ual: UAL) -> Address:
+        token_id = parse_ual(ual)["token_id"]
+
+        return await self._owner(token_id)
+
+    _get_assertion_id_by_index = Method(BlockchainRequest.get_assertion_id_by_index)
+
+    async def get_agreement_id(
+        self, contract_address: Address, token_id: int
+    ) -> HexStr:
+        first_assertion_id = await self._get_assertion_id_by_index(token_id, 0)
+        keyword = generate_keyword(contract_address, first_assertion_id)
+        return generate_agreement_id(contract_address, token_id, keyword)
+
+    async def prefetch_agreements(self, uals: Iterable[UAL]) -> list[AgreementEntry]:
+        uals = list(uals)
+        entries = {ual: self.agreement_cache.get(ual) for ual in uals}
+        missing = [ual for ual, entry in entries.items() if entry is None]
+        token_ids = [parse_ual(ual)["token_id"] for ual in missing]
+
+        states = await self.manager.async_batch_request(
+            *_get_agreement_states_requests(self, token_ids)
+        )
+        agreement_ids = [
+            _generate_agreement_id(ual, first_assertion_id)
+            for ual, first_assertion_id in zip(missing, states[::2])
+        ]
+
+        anchor_clock = not self.agreement_cache.clock.is_anchored
+        results = await self.manager.async_batch_request(
+            *_get_agreement_data_requests(
+                self, agreement_ids, states[1::2], anchor_clock
+            )
+        )
+        if anchor_clock:
+            self.agreement_cache.clock.anchor(results.pop()["timestamp"])
+
+        _cache_agreements(self.agreement_cache, entries, agreement_ids, states, results)
+
+        return [entries[ual] for ual in uals]
+
+    async def _get_agreement(self, ual: UAL) -> tuple[AgreementEntry, int]:
+        entry = (await self.prefetch_agreements([ual]))[0]
+
+        epochs_left = self.agreement_cache.epochs_left(entry.agreement_data)
+        if epochs_left is None:
+            self.agreement_cache.clock.anchor(
+                (await self._get_block("latest"))["timestamp"]
+            )
+            epochs_left = self.agreement_cache.epochs_left(entry.agreement_data)
+
+        return entry, epochs_left
+
+    async def get_operation_result(
+        self, operation_id: str, operation: str
+    ) -> NodeResponseDict:
+        return await self.manager.poll_operation_result(operation_id, operation)
+
+    def poll_operation_result(
+        self,
+        operation_id: str,
+        operation: str,
+        callback: Callable[[asyncio.Future], Any] | None = None,
+    ) -> asyncio.Task:
+        return self.manager.poll_operation_result(operation_id, operation, callback)
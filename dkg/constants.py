@@ -80,6 +80,8 @@ BLOCKCHAINS = {
     },
 }
 
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
 DEFAULT_GAS_PRICE_GWEI = {
     "otp": 1,
     "gnosis": 20,
@@ -87,6 +89,14 @@ DEFAULT_GAS_PRICE_GWEI = {
 }
 
 DEFAULT_HASH_FUNCTION_ID = 1
+DEFAULT_CREATE_MANY_CONCURRENCY = {
+    "prepare": 4,
+    "bid": 8,
+    "mint": 4,
+    "confirm": 64,
+    "publish": 16,
+}
+DEFAULT_MERKLE_PARALLEL_THRESHOLD = 2**16
 DEFAULT_PROXIMITY_SCORE_FUNCTIONS_PAIR_IDS = {
     "development": {"hardhat1:31337": 2, "hardhat2:31337": 2, "otp:2043": 2},
     "devnet": {
@@ -17,10 +17,17 @@
 
 from dataclasses import dataclass
 from enum import auto, Enum
+from typing import TYPE_CHECKING
 
-import pandas as pd
+from dkg.types import (
+    AutoStrEnum,
+    AutoStrEnumCapitalize,
+    AutoStrEnumUpperCase,
+    HexStr,
+)
 
-from dkg.types import AutoStrEnum, AutoStrEnumCapitalize, AutoStrEnumUpperCase
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class BlockchainResponseDict(dict):
@@ -33,7 +40,9 @@ class HTTPRequestMethod(Enum):
 
 
 class NodeResponseDict(dict):
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> "pd.DataFrame":
+        import pandas as pd
+
         return pd.DataFrame(self)
 
 
@@ -64,3 +73,45 @@ class ParanetIncentivizationType(Enum):
 class BaseIncentivesPoolParams:
     def to_contract_args(self) -> dict:
         raise NotImplementedError("This method should be overridden in subclasses")
+
+
+class MultiproofStep(Enum):
+    PROOF = auto()
+    QUEUE = auto()
+    CARRY = auto()
+
+
+# Not OpenZeppelin's multiProofVerify layout in general: the tree carries the
+# last node of an odd level up unhashed, and a known node carried past other
+# known nodes has to be re-queued, which is recorded as a CARRY step and has
+# no bool[] equivalent. Proofs without CARRY steps convert losslessly.
+@dataclass
+class Multiproof:
+    leaves: list[HexStr]
+    proof: list[HexStr]
+    steps: list[MultiproofStep]
+
+    def to_openzeppelin(self) -> dict[str, list[HexStr] | list[bool]]:
+        if MultiproofStep.CARRY in self.steps:
+            raise ValueError(
+                "Multiproof carries an odd node and has no OpenZeppelin layout."
+            )
+
+        return {
+            "leaves": self.leaves,
+            "proof": self.proof,
+            "proofFlags": [step is MultiproofStep.QUEUE for step in self.steps],
+        }
+
+    @classmethod
+    def from_openzeppelin(
+        cls, multiproof: dict[str, list[HexStr] | list[bool]]
+    ) -> "Multiproof":
+        return cls(
+            leaves=multiproof["leaves"],
+            proof=multiproof["proof"],
+            steps=[
+                MultiproofStep.QUEUE if flag else MultiproofStep.PROOF
+                for flag in multiproof["proofFlags"]
+            ],
+        )
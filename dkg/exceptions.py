@@ -101,6 +101,14 @@ class NodeRequestError(DKGException):
     pass
 
 
+class OperationTimeout(NodeRequestError):
+    """
+    Raised when operation result isn't ready before the polling deadline.
+    """
+
+    pass
+
+
 class OperationNotFinished(DKGException):
     """
     Raised when requested operation result isn't ready.
@@ -15,16 +15,19 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from rdflib.plugins.sparql.parser import parseQuery
-
 from dkg.dataclasses import NodeResponseDict
-from dkg.exceptions import OperationNotFinished
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
+from dkg.module import AsyncModule, Module
 from dkg.types import NQuads
-from dkg.utils.decorators import retry
-from dkg.utils.node_request import NodeRequest, validate_operation_status
+from dkg.utils.node_request import NodeRequest
+
+
+def _get_query_type(query: str) -> str:
+    from rdflib.plugins.sparql.parser import parseQuery
+
+    parsed_query = parseQuery(query)
+    return parsed_query[1].name.replace("Query", "").upper()
 
 
 class Graph(Module):
@@ -32,15 +35,13 @@ class Graph(Module):
         self.manager = manager
 
     _query = Method(NodeRequest.query)
-    _get_operation_result = Method(NodeRequest.get_operation_result)
 
     def query(
         self,
         query: str,
         repository: str,
     ) -> NQuads:
-        parsed_query = parseQuery(query)
-        query_type = parsed_query[1].name.replace("Query", "").upper()
+        query_type = _get_query_type(query)
 
         operation_id: NodeResponseDict = self._query(query, query_type, repository)[
             "operationId"
@@ -49,15 +50,33 @@ class Graph(Module):
 
         return operation_result["data"]
 
-    @retry(catch=OperationNotFinished, max_retries=5, base_delay=1, backoff=2)
     def get_operation_result(
         self, operation_id: str, operation: str
     ) -> NodeResponseDict:
-        operation_result = self._get_operation_result(
-            operation_id=operation_id,
-            operation=operation,
-        )
+        return self.manager.poll_operation_result(operation_id, operation).result()
+
+
+class AsyncGraph(AsyncModule):
+    def __init__(self, manager: AsyncRequestManager):
+        self.manager = manager
+
+    _query = Method(NodeRequest.query)
 
-        validate_operation_status(operation_result)
+    async def query(
+        self,
+        query: str,
+        repository: str,
+    ) -> NQuads:
+        query_type = _get_query_type(query)
+
+        operation_id: NodeResponseDict = (
+            await self._query(query, query_type, repository)
+        )["operationId"]
+        operation_result = await self.get_operation_result(operation_id, "query")
 
-        return operation_result
+        return operation_result["data"]
+
+    async def get_operation_result(
+        self, operation_id: str, operation: str
+    ) -> NodeResponseDict:
+        return await self.manager.poll_operation_result(operation_id, operation)
@@ -18,14 +18,19 @@
 from functools import wraps
 
 from dkg.assertion import Assertion
-from dkg.asset import KnowledgeAsset
-from dkg.graph import Graph
-from dkg.manager import DefaultRequestManager
-from dkg.module import Module
-from dkg.network import Network
-from dkg.node import Node
-from dkg.paranet import Paranet
-from dkg.providers import BlockchainProvider, NodeHTTPProvider
+from dkg.asset import AsyncKnowledgeAsset, KnowledgeAsset
+from dkg.graph import AsyncGraph, Graph
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
+from dkg.module import AsyncModule, Module
+from dkg.network import AsyncNetwork, Network
+from dkg.node import AsyncNode, Node
+from dkg.paranet import AsyncParanet, Paranet
+from dkg.providers import (
+    AsyncBlockchainProvider,
+    AsyncNodeHTTPProvider,
+    BlockchainProvider,
+    NodeHTTPProvider,
+)
 from dkg.types import UAL, Address, ChecksumAddress
 from dkg.utils.ual import format_ual, parse_ual
 
@@ -66,6 +71,17 @@ class DKG(Module):
         }
         self._attach_modules(modules)
 
+    def __enter__(self) -> "DKG":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.manager.operation_poller.close()
+        self.node_provider.close()
+        self.blockchain_provider.close()
+
     @property
     def node_provider(self) -> NodeHTTPProvider:
         return self.manager.node_provider
@@ -81,3 +97,77 @@ class DKG(Module):
     @blockchain_provider.setter
     def blockchain_provider(self, blockchain_provider: BlockchainProvider) -> None:
         self.manager.blockchain_provider = blockchain_provider
+
+
+class AsyncDKG(AsyncModule):
+    assertion: Assertion
+    asset: AsyncKnowledgeAsset
+    paranet: AsyncParanet
+    network: AsyncNetwork
+    node: AsyncNode
+    graph: AsyncGraph
+
+    @staticmethod
+    @wraps(format_ual)
+    def format_ual(
+        blockchain: str, contract_address: Address | ChecksumAddress, token_id: int
+    ) -> UAL:
+        return format_ual(blockchain, contract_address, token_id)
+
+    @staticmethod
+    @wraps(parse_ual)
+    def parse_ual(ual: UAL) -> dict[str, str | Address | int]:
+        return parse_ual(ual)
+
+    def __init__(
+        self,
+        node_provider: AsyncNodeHTTPProvider,
+        blockchain_provider: AsyncBlockchainProvider | BlockchainProvider,
+    ):
+        self.manager = AsyncRequestManager(node_provider, blockchain_provider)
+        modules = {
+            "assertion": Assertion(self.manager),
+            "asset": AsyncKnowledgeAsset(self.manager),
+            "paranet": AsyncParanet(self.manager),
+            "network": AsyncNetwork(self.manager),
+            "node": AsyncNode(self.manager),
+            "graph": AsyncGraph(self.manager),
+        }
+        self._attach_modules(modules)
+
+    async def __aenter__(self) -> "AsyncDKG":
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def initialize(self) -> None:
+        if isinstance(self.blockchain_provider, AsyncBlockchainProvider):
+            await self.blockchain_provider.initialize()
+
+    async def close(self) -> None:
+        await self.node_provider.close()
+
+        if isinstance(self.blockchain_provider, AsyncBlockchainProvider):
+            await self.blockchain_provider.close()
+        else:
+            self.blockchain_provider.close()
+
+    @property
+    def node_provider(self) -> AsyncNodeHTTPProvider:
+        return self.manager.node_provider
+
+    @node_provider.setter
+    def node_provider(self, node_provider: AsyncNodeHTTPProvider) -> None:
+        self.manager.node_provider = node_provider
+
+    @property
+    def blockchain_provider(self) -> AsyncBlockchainProvider | BlockchainProvider:
+        return self.manager.blockchain_provider
+
+    @blockchain_provider.setter
+    def blockchain_provider(
+        self, blockchain_provider: AsyncBlockchainProvider | BlockchainProvider
+    ) -> None:
+        self.manager.blockchain_provider = blockchain_provider
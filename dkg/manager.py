@@ -15,21 +15,56 @@
 # specific language governing permissions and limitations
 # under the License.
 
-from typing import Any, Type
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Callable, Type
 
 from dkg.dataclasses import BlockchainResponseDict, NodeResponseDict
 from dkg.exceptions import InvalidRequest
-from dkg.providers import BlockchainProvider, NodeHTTPProvider
 from dkg.utils.blockchain_request import ContractInteraction, JSONRPCRequest
-from dkg.utils.node_request import NodeCall
+from dkg.utils.node_request import NodeCall, NodeRequest
+from dkg.utils.poller import AsyncOperationPoller, OperationPoller
+
+if TYPE_CHECKING:
+    from dkg.providers import (
+        AsyncBlockchainProvider,
+        AsyncNodeHTTPProvider,
+        BlockchainProvider,
+        NodeHTTPProvider,
+    )
+
+Request = tuple[Type[JSONRPCRequest | ContractInteraction | NodeCall], dict[str, Any]]
+
+
+def _is_contract_call(request: Request) -> bool:
+    request_type, request_params = request
+    return issubclass(request_type, ContractInteraction) and not request_params.get(
+        "state_changing", False
+    )
+
+
+def _operation_result_request(operation: str, operation_id: str) -> dict[str, Any]:
+    request = NodeRequest.get_operation_result
+    return {
+        "method": request.method,
+        "path": request.path.format(operation=operation, operation_id=operation_id),
+    }
 
 
 class DefaultRequestManager:
     def __init__(
-        self, node_provider: NodeHTTPProvider, blockchain_provider: BlockchainProvider
+        self,
+        node_provider: NodeHTTPProvider,
+        blockchain_provider: BlockchainProvider,
+        operation_poller: OperationPoller | None = None,
     ):
         self._node_provider = node_provider
         self._blockchain_provider = blockchain_provider
+        self.operation_poller = operation_poller or OperationPoller(
+            self._fetch_operation_result
+        )
 
     @property
     def node_provider(self) -> NodeHTTPProvider:
@@ -62,3 +97,141 @@ class DefaultRequestManager:
             raise InvalidRequest(
                 "Invalid Request. Manager can only process Blockchain/Node requests."
             )
+
+    def batch_request(
+        self, *requests: Request
+    ) -> list[BlockchainResponseDict | NodeResponseDict]:
+        results = [None] * len(requests)
+
+        calls = {}
+        for i, request in enumerate(requests):
+            if _is_contract_call(request):
+                calls[i] = request[1]
+            else:
+                results[i] = self.blocking_request(*request)
+
+        for i, result in zip(
+            calls.keys(), self.blockchain_provider.multicall(list(calls.values()))
+        ):
+            results[i] = result
+
+        return results
+
+    def poll_operation_result(
+        self,
+        operation_id: str,
+        operation: str,
+        callback: Callable[[Future], Any] | None = None,
+    ) -> Future:
+        return self.operation_poller.submit(operation_id, operation, callback)
+
+    def _fetch_operation_result(
+        self, operation: str, operation_id: str
+    ) -> NodeResponseDict:
+        return self.node_provider.make_request(
+            **_operation_result_request(operation, operation_id)
+        )
+
+
+class AsyncRequestManager:
+    def __init__(
+        self,
+        node_provider: AsyncNodeHTTPProvider,
+        blockchain_provider: AsyncBlockchainProvider | BlockchainProvider,
+        operation_poller: AsyncOperationPoller | None = None,
+    ):
+        self._node_provider = node_provider
+        self._blockchain_provider = blockchain_provider
+        self.operation_poller = operation_poller or AsyncOperationPoller(
+            self._fetch_operation_result
+        )
+
+    @property
+    def node_provider(self) -> AsyncNodeHTTPProvider:
+        return self._node_provider
+
+    @node_provider.setter
+    def node_provider(self, node_provider: AsyncNodeHTTPProvider) -> None:
+        self._node_provider = node_provider
+
+    @property
+    def blockchain_provider(self) -> AsyncBlockchainProvider | BlockchainProvider:
+        return self._blockchain_provider
+
+    @blockchain_provider.setter
+    def blockchain_provider(
+        self, blockchain_provider: AsyncBlockchainProvider | BlockchainProvider
+    ) -> None:
+        self._blockchain_provider = blockchain_provider
+
+    async def async_request(
+        self,
+        request_type: Type[JSONRPCRequest | ContractInteraction | NodeCall],
+        request_params: dict[str, Any],
+    ) -> BlockchainResponseDict | NodeResponseDict:
+        if issubclass(request_type, JSONRPCRequest):
+            return await self._blockchain_request(
+                self.blockchain_provider.make_json_rpc_request, request_params
+            )
+        elif issubclass(request_type, ContractInteraction):
+            return await self._blockchain_request(
+                self.blockchain_provider.call_function, request_params
+            )
+        elif issubclass(request_type, NodeCall):
+            return await self.node_provider.make_request(**request_params)
+        else:
+            raise InvalidRequest(
+                "Invalid Request. Manager can only process Blockchain/Node requests."
+            )
+
+    async def async_batch_request(
+        self, *requests: Request
+    ) -> list[BlockchainResponseDict | NodeResponseDict]:
+        calls = {
+            i: request[1]
+            for i, request in enumerate(requests)
+            if _is_contract_call(request)
+        }
+        other_requests = {
+            i: request for i, request in enumerate(requests) if i not in calls
+        }
+
+        multicall_results, *other_results = await asyncio.gather(
+            self._blockchain_request(
+                self.blockchain_provider.multicall, {"calls": list(calls.values())}
+            ),
+            *(self.async_request(*request) for request in other_requests.values()),
+        )
+
+        results = [None] * len(requests)
+        for i, result in zip(calls.keys(), multicall_results):
+            results[i] = result
+        for i, result in zip(other_requests.keys(), other_results):
+            results[i] = result
+
+        return results
+
+    def poll_operation_result(
+        self,
+        operation_id: str,
+        operation: str,
+        callback: Callable[[asyncio.Future], Any] | None = None,
+    ) -> asyncio.Task:
+        return self.operation_poller.submit(operation_id, operation, callback)
+
+    async def _fetch_operation_result(
+        self, operation: str, operation_id: str
+    ) -> NodeResponseDict:
+        return await self.node_provider.make_request(
+            **_operation_result_request(operation, operation_id)
+        )
+
+    async def _blockchain_request(
+        self, request_fn: Callable[..., Any], request_params: dict[str, Any]
+    ) -> Any:
+        if asyncio.iscoroutinefunction(request_fn):
+            return await request_fn(**request_params)
+
+        # Synchronous blockchain provider calls are offloaded to the default
+        # executor to keep the event loop free for node operations.
+        return await asyncio.to_thread(request_fn, **request_params)
@@ -62,9 +62,17 @@ class Method(Generic[TFunc]):
                             "ContractInteraction requires a 'contract' to be provided"
                         )
 
+                if not isinstance(self.action, ContractTransaction):
+                    return {
+                        "args": self._validate_and_map(self.action.args, args, kwargs),
+                        "state_changing": False,
+                    }
+
+                wait = kwargs.pop("wait", True)
                 return {
                     "args": self._validate_and_map(self.action.args, args, kwargs),
-                    "state_changing": isinstance(self.action, ContractTransaction),
+                    "state_changing": True,
+                    "wait": wait,
                 }
             case NodeCall():
                 return self._process_node_call_args(args, kwargs)
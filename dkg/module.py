@@ -16,12 +16,15 @@
 # under the License.
 
 from dataclasses import asdict
-from typing import Any, Callable, Sequence
+from functools import partial
+from typing import Any, Awaitable, Callable, Sequence, Type
 
 from dkg.exceptions import ValidationError
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
 from dkg.types import TReturn
+from dkg.utils.blockchain_request import ContractInteraction, JSONRPCRequest
+from dkg.utils.node_request import NodeCall
 
 
 class Module:
@@ -31,14 +34,24 @@ class Module:
         self, method: Method[Callable[..., TReturn]]
     ) -> Callable[..., TReturn]:
         def caller(*args: Any, **kwargs: Any) -> TReturn:
-            processed_args = method.process_args(*args, **kwargs)
-            request_params = asdict(method.action)
-            request_params.update(processed_args)
+            return self.manager.blocking_request(
+                *self._build_request(method, *args, **kwargs)
+            )
 
-            return self.manager.blocking_request(type(method.action), request_params)
+        caller.request = partial(self._build_request, method)
 
         return caller
 
+    @staticmethod
+    def _build_request(
+        method: Method[Callable[..., TReturn]], *args: Any, **kwargs: Any
+    ) -> tuple[Type[JSONRPCRequest | ContractInteraction | NodeCall], dict[str, Any]]:
+        processed_args = method.process_args(*args, **kwargs)
+        request_params = asdict(method.action)
+        request_params.update(processed_args)
+
+        return type(method.action), request_params
+
     def _attach_modules(self, module_definitions: dict[str, Any]) -> None:
         for module_name, module_info in module_definitions.items():
             module_info_is_list_like = isinstance(module_info, Sequence)
@@ -62,3 +75,19 @@ class Module:
                     raise ValidationError(
                         "Module definitions can only have 1 or 2 elements."
                     )
+
+
+class AsyncModule(Module):
+    manager: AsyncRequestManager
+
+    def retrieve_caller_fn(
+        self, method: Method[Callable[..., TReturn]]
+    ) -> Callable[..., Awaitable[TReturn]]:
+        async def caller(*args: Any, **kwargs: Any) -> TReturn:
+            return await self.manager.async_request(
+                *self._build_request(method, *args, **kwargs)
+            )
+
+        caller.request = partial(self._build_request, method)
+
+        return caller
@@ -17,9 +17,9 @@
 
 from dkg.constants import DEFAULT_HASH_FUNCTION_ID
 from dkg.dataclasses import BidSuggestionRange
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
+from dkg.module import AsyncModule, Module
 from dkg.types import DataHexStr
 from dkg.utils.blockchain_request import BlockchainRequest
 from dkg.utils.node_request import NodeRequest
@@ -59,3 +59,39 @@ class Network(Module):
             if range != BidSuggestionRange.ALL
             else response
         )
+
+
+class AsyncNetwork(AsyncModule):
+    def __init__(self, manager: AsyncRequestManager):
+        self.manager = manager
+
+    _get_asset_storage_address = Method(BlockchainRequest.get_asset_storage_address)
+
+    _get_bid_suggestion = Method(NodeRequest.bid_suggestion)
+
+    async def get_bid_suggestion(
+        self,
+        public_assertion_id: DataHexStr,
+        size_in_bytes: int,
+        epochs_number: int,
+        range: BidSuggestionRange = BidSuggestionRange.LOW,
+    ) -> int:
+        content_asset_storage_address = await self._get_asset_storage_address(
+            "ContentAssetStorage"
+        )
+
+        response = await self._get_bid_suggestion(
+            self.manager.blockchain_provider.blockchain_id,
+            epochs_number,
+            size_in_bytes,
+            content_asset_storage_address,
+            public_assertion_id,
+            DEFAULT_HASH_FUNCTION_ID,
+            range,
+        )
+
+        return (
+            int(response["bidSuggestion"])
+            if range != BidSuggestionRange.ALL
+            else response
+        )
@@ -15,10 +15,12 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from typing import Awaitable
+
 from dkg.dataclasses import NodeResponseDict
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
+from dkg.module import AsyncModule, Module
 from dkg.utils.node_request import NodeRequest
 
 
@@ -31,3 +33,14 @@ class Node(Module):
     @property
     def info(self) -> NodeResponseDict:
         return self._info()
+
+
+class AsyncNode(AsyncModule):
+    def __init__(self, manager: AsyncRequestManager):
+        self.manager = manager
+
+    _info = Method(NodeRequest.info)
+
+    @property
+    def info(self) -> Awaitable[NodeResponseDict]:
+        return self._info()
@@ -22,11 +22,12 @@ from web3 import Web3
 from web3.types import TxReceipt
 
 from dkg.dataclasses import BaseIncentivesPoolParams, ParanetIncentivizationType
-from dkg.manager import DefaultRequestManager
+from dkg.manager import AsyncRequestManager, DefaultRequestManager
 from dkg.method import Method
-from dkg.module import Module
+from dkg.module import AsyncModule, Module
 from dkg.types import Address, UAL, HexStr
 from dkg.utils.blockchain_request import BlockchainRequest
+from dkg.utils.receipts import TransactionHandle
 from dkg.utils.ual import parse_ual
 from dkg.constants import NEUROWEB_BLOCKCHAIN_PREFIX, INCENTIVE_POOL_NAME
 
@@ -324,15 +325,17 @@ class Paranet(Module):
         self,
         ual: UAL,
         incentives_type: None,
-    ) -> dict[str, str | HexStr | TxReceipt]:
+        wait: bool = True,
+    ) -> dict[str, str | HexStr | TxReceipt | TransactionHandle]:
         incentives_type = incentives_type or (
             ParanetIncentivizationType.NEUROWEB.value
             if NEUROWEB_BLOCKCHAIN_PREFIX in ual
             else ParanetIncentivizationType.NEUROWEB_ERC20.value
         )
 
-        receipt: TxReceipt = self._claim_knowledge_miner_reward(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+        receipt: TxReceipt | TransactionHandle = self._claim_knowledge_miner_reward(
+            contract=self._get_incentives_pool_contract(ual, incentives_type),
+            wait=wait,
         )
 
         parsed_ual = parse_ual(ual)
@@ -349,7 +352,7 @@ class Paranet(Module):
                     [knowledge_asset_storage, knowledge_asset_token_id],
                 )
             ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": json.loads(Web3.to_json(receipt)) if wait else receipt,
         }
 
     _get_claimable_paranet_operator_reward_amount = Method(
@@ -379,15 +382,17 @@ class Paranet(Module):
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType | None = None,
-    ) -> dict[str, str | HexStr | TxReceipt]:
+        wait: bool = True,
+    ) -> dict[str, str | HexStr | TxReceipt | TransactionHandle]:
         incentives_type = incentives_type or (
             ParanetIncentivizationType.NEUROWEB.value
             if NEUROWEB_BLOCKCHAIN_PREFIX in ual
             else ParanetIncentivizationType.NEUROWEB_ERC20.value
         )
 
-        receipt: TxReceipt = self._claim_paranet_operator_reward(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+        receipt: TxReceipt | TransactionHandle = self._claim_paranet_operator_reward(
+            contract=self._get_incentives_pool_contract(ual, incentives_type),
+            wait=wait,
         )
 
         parsed_ual = parse_ual(ual)
@@ -404,7 +409,7 @@ class Paranet(Module):
                     [knowledge_asset_storage, knowledge_asset_token_id],
                 )
             ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": json.loads(Web3.to_json(receipt)) if wait else receipt,
         }
 
     _get_claimable_proposal_voter_reward_amount = Method(
@@ -453,15 +458,19 @@ class Paranet(Module):
         self,
         ual: UAL,
         incentives_type: ParanetIncentivizationType | None = None,
-    ) -> dict[str, str | HexStr | TxReceipt]:
+        wait: bool = True,
+    ) -> dict[str, str | HexStr | TxReceipt | TransactionHandle]:
         incentives_type = incentives_type or (
             ParanetIncentivizationType.NEUROWEB.value
             if NEUROWEB_BLOCKCHAIN_PREFIX in ual
             else ParanetIncentivizationType.NEUROWEB_ERC20.value
         )
 
-        receipt: TxReceipt = self._claim_incentivization_proposal_voter_reward(
-            contract=self._get_incentives_pool_contract(ual, incentives_type)
+        receipt: TxReceipt | TransactionHandle = (
+            self._claim_incentivization_proposal_voter_reward(
+                contract=self._get_incentives_pool_contract(ual, incentives_type),
+                wait=wait,
+            )
         )
 
         parsed_ual = parse_ual(ual)
@@ -478,7 +487,7 @@ class Paranet(Module):
                     [knowledge_asset_storage, knowledge_asset_token_id],
                 )
             ),
-            "operation": json.loads(Web3.to_json(receipt)),
+            "operation": json.loads(Web3.to_json(receipt)) if wait else receipt,
         }
 
     _get_updating_knowledge_asset_states = Method(
@@ -532,3 +541,107 @@ class Paranet(Module):
                 "address": self.get_incentives_pool_address(ual, incentives_type),
             }
         )
+
+
+class AsyncParanet(AsyncModule):
+    def __init__(self, manager: AsyncRequestManager):
+        self.manager = manager
+
+    _register_paranet = Method(BlockchainRequest.register_paranet)
+
+    async def create(
+        self, ual: UAL, name: str, description: str
+    ) -> dict[str, str | HexStr | TxReceipt]:
+        parsed_ual = parse_ual(ual)
+        knowledge_asset_storage, knowledge_asset_token_id = (
+            parsed_ual["contract_address"],
+            parsed_ual["token_id"],
+        )
+
+        receipt: TxReceipt = await self._register_paranet(
+            knowledge_asset_storage,
+            knowledge_asset_token_id,
+            name,
+            description,
+        )
+
+        return {
+            "paranetUAL": ual,
+            "paranetId": Web3.to_hex(
+                Web3.solidity_keccak(
+                    ["address", "uint256"],
+                    [knowledge_asset_storage, knowledge_asset_token_id],
+                )
+            ),
+            "operation": json.loads(Web3.to_json(receipt)),
+        }
+
+    _register_paranet_service = Method(BlockchainRequest.register_paranet_service)
+
+    async def create_service(
+        self, ual: UAL, name: str, description: str, addresses: list[Address]
+    ) -> dict[str, str | HexStr | TxReceipt]:
+        parsed_ual = parse_ual(ual)
+        knowledge_asset_storage, knowledge_asset_token_id = (
+            parsed_ual["contract_address"],
+            parsed_ual["token_id"],
+        )
+
+        receipt: TxReceipt = await self._register_paranet_service(
+            knowledge_asset_storage,
+            knowledge_asset_token_id,
+            name,
+            description,
+            addresses,
+        )
+
+        return {
+            "paranetServiceUAL": ual,
+            "paranetServiceId": Web3.to_hex(
+                Web3.solidity_keccak(
+                    ["address", "uint256"],
+                    [knowledge_asset_storage, knowledge_asset_token_id],
+                )
+            ),
+            "operation": json.loads(Web3.to_json(receipt)),
+        }
+
+    _add_paranet_services = Method(BlockchainRequest.add_paranet_services)
+
+    async def add_services(
+        self, ual: UAL, services_uals: list[UAL]
+    ) -> dict[str, str | HexStr | TxReceipt]:
+        parsed_paranet_ual = parse_ual(ual)
+        paranet_knowledge_asset_storage, paranet_knowledge_asset_token_id = (
+            parsed_paranet_ual["contract_address"],
+            parsed_paranet_ual["token_id"],
+        )
+
+        parsed_service_uals = []
+        for service_ual in services_uals:
+            parsed_service_ual = parse_ual(service_ual)
+            parsed_service_uals.append(
+                {
+                    "knowledgeAssetStorageContract": parsed_service_ual[
+                        "contract_address"
+                    ],
+                    "tokenId": parsed_service_ual["token_id"],
+                }
+            )
+
+        receipt: TxReceipt = await self._add_paranet_services(
+            paranet_knowledge_asset_storage,
+            paranet_knowledge_asset_token_id,
+            parsed_service_uals,
+        )
+
+        return {
+            "paranetUAL": ual,
+            "paranetId": Web3.to_hex(
+                Web3.solidity_keccak(
+                    ["address", "uint256"],
+                    [paranet_knowledge_asset_storage, paranet_knowledge_asset_token_id],
+                )
+            ),
+            "operation": json.loads(Web3.to_json(receipt)),
+        }
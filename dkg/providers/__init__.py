@@ -1,2 +1,31 @@
-from .blockchain import BlockchainProvider  # NOQA
-from .node_http import NodeHTTPProvider  # NOQA
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_blockchain import AsyncBlockchainProvider  # NOQA
+    from .async_node_http import AsyncNodeHTTPProvider  # NOQA
+    from .blockchain import BlockchainProvider  # NOQA
+    from .node_http import NodeHTTPProvider  # NOQA
+
+_LAZY_ATTRIBUTES = {
+    "AsyncBlockchainProvider": ".async_blockchain",
+    "AsyncNodeHTTPProvider": ".async_node_http",
+    "BlockchainProvider": ".blockchain",
+    "NodeHTTPProvider": ".node_http",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
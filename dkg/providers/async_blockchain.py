@@ -0,0 +1,407 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import os
+from functools import partial, wraps
+from typing import Any, Awaitable, Callable
+
+from dkg.exceptions import AccountMissing
+from dkg.providers.blockchain import BaseBlockchainProvider
+from dkg.types import URI, DataHexStr, Environment, Wei
+from dkg.utils.contracts_cache import ContractsCache
+from dkg.utils.gas import GasLimitModel
+from dkg.utils.nonce import AsyncNonceManager
+from dkg.utils.receipts import (
+    AsyncReceiptCollector,
+    AsyncTransactionHandle,
+    ReceiptsBatch,
+)
+from aiohttp import ClientSession
+from eth_account.signers.local import LocalAccount
+from hexbytes import HexBytes
+from web3 import AsyncHTTPProvider, AsyncWeb3
+from web3._utils.request import async_make_post_request
+from web3.contract.async_contract import AsyncContractFunction
+from web3.types import TxReceipt
+
+
+class AsyncBlockchainProvider(BaseBlockchainProvider):
+    def __init__(
+        self,
+        environment: Environment,
+        blockchain_id: str,
+        rpc_uri: URI | None = None,
+        private_key: DataHexStr | None = None,
+        gas_price: Wei | None = None,
+        verify: bool = True,
+        contracts_cache: ContractsCache | None = None,
+    ):
+        super().__init__(
+            environment, blockchain_id, rpc_uri, gas_price, contracts_cache
+        )
+
+        self.w3 = AsyncWeb3(
+            AsyncHTTPProvider(
+                self.rpc_uri, request_kwargs={} if verify else {"ssl": False}
+            )
+        )
+        self.receipt_collector = AsyncReceiptCollector(self._get_transaction_receipts)
+
+        # Chain ID of an unrecognized blockchain can only be fetched
+        # asynchronously, so it's resolved together with the contracts.
+        self._blockchain_name = blockchain_id
+        if self.blockchain_id is not None:
+            self._init_blockchain(self.blockchain_id)
+
+        self._initialized = False
+        self._initialization_lock: asyncio.Lock | None = None
+        self._session: ClientSession | None = None
+
+        if (
+            private_key is not None
+            or (private_key_env := os.environ.get("PRIVATE_KEY", None)) is not None
+        ):
+            self.set_account(private_key or private_key_env)
+
+    async def initialize(self) -> None:
+        if self._initialized:
+            return
+
+        if self._initialization_lock is None:
+            self._initialization_lock = asyncio.Lock()
+
+        async with self._initialization_lock:
+            if self._initialized:
+                return
+
+            # AsyncHTTPProvider keeps its aiohttp session in a module-level
+            # cache, registering it here is what lets close() release it.
+            session = ClientSession(raise_for_status=True)
+            self._session = await self.w3.provider.cache_async_session(session)
+            if self._session is not session:
+                await session.close()
+
+            if self.blockchain_id is None:
+                self._init_blockchain(
+                    f"{self._blockchain_name}:{await self.w3.eth.chain_id}"
+                )
+
+            await self._init_contracts()
+            self._initialized = True
+
+    async def close(self) -> None:
+        await self.receipt_collector.close()
+
+        if getattr(self, "gas_price_service", None) is not None:
+            self.gas_price_service.close()
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def make_json_rpc_request(
+        self, endpoint: str, args: dict[str, Any] = {}
+    ) -> Any:
+        await self.initialize()
+
+        web3_method = getattr(self.w3.eth, endpoint)
+
+        if callable(web3_method):
+            return await web3_method(**args)
+        else:
+            return await web3_method
+
+    @staticmethod
+    def handle_updated_contract(func):
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            contract_name = kwargs.get("contract") or (args[0] if args else None)
+
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as err:
+                if (
+                    contract_name
+                    and isinstance(contract_name, str)
+                    and self._is_contract_error(err)
+                    and not await self._check_contract_status(contract_name)
+                ):
+                    is_updated = await self._update_contract_instance(contract_name)
+                    if is_updated:
+                        return await func(self, *args, **kwargs)
+                raise err
+
+        return wrapper
+
+    async def call_function(
+        self,
+        contract: str | dict[str, str],
+        function: str,
+        args: dict[str, Any] = {},
+        state_changing: bool = False,
+        gas_price: Wei | None = None,
+        gas_limit: Wei | None = None,
+        wait: bool = True,
+    ) -> TxReceipt | AsyncTransactionHandle | Any:
+        await self.initialize()
+
+        return await self._call_function(
+            contract, function, args, state_changing, gas_price, gas_limit, wait
+        )
+
+    @handle_updated_contract
+    async def _call_function(
+        self,
+        contract: str | dict[str, str],
+        function: str,
+        args: dict[str, Any] = {},
+        state_changing: bool = False,
+        gas_price: Wei | None = None,
+        gas_limit: Wei | None = None,
+        wait: bool = True,
+    ) -> TxReceipt | AsyncTransactionHandle | Any:
+        contract_name, contract_instance = self._get_contract_instance(contract)
+
+        contract_function: AsyncContractFunction = getattr(
+            contract_instance.functions, function
+        )
+
+        if not state_changing:
+            result = await contract_function(**args).call()
+            return self._format_call_result(contract_name, function, result)
+        else:
+            if not hasattr(self, "account"):
+                raise AccountMissing(
+                    "State-changing transactions can be performed only with specified "
+                    "account."
+                )
+
+            gas_price = (
+                self.gas_price
+                or gas_price
+                or await asyncio.to_thread(self._get_network_gas_price)
+            )
+
+            gas_limit_key = GasLimitModel.key(contract_name, function, args)
+            learned_gas_limit = (
+                self.gas_limit_model.predict(gas_limit_key)
+                if gas_limit is None
+                else None
+            )
+
+            options = {"from": self.account.address}
+            if gas_price is not None:
+                options["gasPrice"] = gas_price
+
+            async def send_transaction(gas: Wei) -> AsyncTransactionHandle:
+                async def send_signed_transaction(nonce: int) -> HexBytes:
+                    transaction = await contract_function(**args).build_transaction(
+                        {**options, "gas": gas, "nonce": nonce}
+                    )
+                    signed_transaction = self.account.sign_transaction(transaction)
+
+                    return await self.w3.eth.send_raw_transaction(
+                        signed_transaction.rawTransaction
+                    )
+
+                tx_hash = await self.nonce_manager.send(send_signed_transaction)
+
+                handle = self.receipt_collector.submit(tx_hash)
+                handle.future.add_done_callback(
+                    partial(self._on_transaction_done, gas_limit_key)
+                )
+                return handle
+
+            handle = await send_transaction(
+                gas_limit
+                or learned_gas_limit
+                or await contract_function(**args).estimate_gas()
+            )
+
+            if learned_gas_limit is not None:
+
+                async def resend() -> AsyncTransactionHandle:
+                    return await send_transaction(
+                        await contract_function(**args).estimate_gas()
+                    )
+
+                handle = self._with_gas_fallback(handle, resend)
+
+            if not wait:
+                return handle
+
+            return await handle.wait()
+
+    @staticmethod
+    def _with_gas_fallback(
+        handle: AsyncTransactionHandle,
+        resend: Callable[[], Awaitable[AsyncTransactionHandle]],
+    ) -> AsyncTransactionHandle:
+        # Transactions sent with a learned gas limit skip estimation, so one
+        # that reverts (e.g. out of gas) is estimated and sent once more.
+        async def wait_for_receipt() -> TxReceipt:
+            receipt = await handle.wait()
+            if receipt["status"] == 0:
+                resent_handle = await resend()
+                fallback_handle.tx_hash = resent_handle.tx_hash
+                receipt = await resent_handle.wait()
+
+            return receipt
+
+        fallback_handle = AsyncTransactionHandle(
+            handle.tx_hash, asyncio.ensure_future(wait_for_receipt())
+        )
+        return fallback_handle
+
+    def set_account(self, private_key: DataHexStr):
+        # Transactions are signed locally in call_function, AsyncWeb3 signing
+        # middleware can't be constructed outside of a running event loop.
+        self.account: LocalAccount = self.w3.eth.account.from_key(private_key)
+        self.w3.eth.default_account = self.account.address
+        self.nonce_manager = AsyncNonceManager(
+            partial(self.w3.eth.get_transaction_count, self.account.address, "pending")
+        )
+
+    async def multicall(self, calls: list[dict[str, Any]]) -> list[Any]:
+        await self.initialize()
+
+        if len(calls) < 2 or not await self._is_multicall_available():
+            return list(
+                await asyncio.gather(*(self._call_function(**call) for call in calls))
+            )
+
+        bound_calls = [self._bind_call(**call) for call in calls]
+        results = (
+            await self.contracts["Multicall3"]
+            .functions.aggregate3(
+                [
+                    (
+                        contract_function.address,
+                        True,
+                        contract_function._encode_transaction_data(),
+                    )
+                    for _, contract_function in bound_calls
+                ]
+            )
+            .call()
+        )
+
+        return [
+            (
+                self._decode_call_result(contract_name, contract_function, return_data)
+                if success and return_data
+                else await self._call_function(**call)
+            )
+            for call, (contract_name, contract_function), (success, return_data) in zip(
+                calls, bound_calls, results
+            )
+        ]
+
+    async def _get_transaction_receipts(
+        self, tx_hashes: list[HexBytes]
+    ) -> ReceiptsBatch:
+        return self._format_receipts(
+            await self._make_batch_request(self._get_receipts_requests(tx_hashes))
+        )
+
+    async def _make_batch_request(
+        self, requests: list[tuple[str, list[Any]]]
+    ) -> list[Any]:
+        provider = self.w3.provider
+        responses = provider.decode_rpc_response(
+            await async_make_post_request(
+                provider.endpoint_uri,
+                self._encode_batch_request(requests),
+                **provider.get_request_kwargs(),
+            )
+        )
+
+        if not isinstance(responses, list):
+            return [
+                self._get_rpc_result(await provider.make_request(method, params))
+                for method, params in requests
+            ]
+
+        return self._get_batch_results(responses, len(requests))
+
+    async def _is_multicall_available(self) -> bool:
+        if self._multicall_available is None:
+            self._multicall_available = (
+                len(await self.w3.eth.get_code(self.contracts["Multicall3"].address))
+                > 0
+            )
+        return self._multicall_available
+
+    async def _init_contracts(self):
+        if (entry := self._load_cached_contract_addresses()) is not None:
+            if not self.contracts_cache.is_expired(entry):
+                return
+
+            try:
+                return await self._sync_contract_addresses(entry["block"])
+            except Exception:
+                pass
+
+        block_number = (
+            await self.w3.eth.block_number
+            if self.contracts_cache is not None
+            else "latest"
+        )
+        hub = self.contracts["Hub"].functions
+        self._set_contract_addresses(
+            *await asyncio.gather(
+                hub.getAllContracts().call(block_identifier=block_number),
+                hub.getAllAssetStorages().call(block_identifier=block_number),
+            )
+        )
+        self._cache_contract_addresses(block_number)
+
+    async def _sync_contract_addresses(self, from_block: int) -> None:
+        block_number = await self.w3.eth.block_number
+        if block_number > from_block:
+            self._apply_hub_events(
+                await self.w3.eth.get_logs(
+                    self._get_hub_events_filter(from_block + 1, block_number)
+                )
+            )
+        self._cache_contract_addresses(block_number)
+
+    async def _update_contract_instance(self, contract: str) -> bool:
+        hub = self.contracts["Hub"].functions
+        if (
+            await hub.isContract(contractName=contract).call()
+            or await hub.isAssetStorage(assetStorageName=contract).call()
+        ):
+            self._set_contract_address(
+                contract,
+                (
+                    await hub.getContractAddress(contract).call()
+                    if not contract.endswith("AssetStorage")
+                    else await hub.getAssetStorageAddress(contract).call()
+                ),
+            )
+            return True
+
+        self._remove_contract_address(contract)
+        return False
+
+    async def _check_contract_status(self, contract: str) -> bool:
+        try:
+            return await self._call_function(contract, "status")
+        except Exception:
+            return False
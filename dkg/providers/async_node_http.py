@@ -0,0 +1,111 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+from typing import Any
+
+import aiohttp
+from dkg.dataclasses import HTTPRequestMethod, NodeResponseDict
+from dkg.exceptions import HTTPRequestMethodNotSupported, NodeRequestError
+from dkg.types import URI
+
+
+class AsyncNodeHTTPProvider:
+    def __init__(
+        self,
+        endpoint_uri: URI | str,
+        auth_token: str | None = None,
+        api_version: str = "v0",
+        limit: int = 100,
+        limit_per_host: int = 0,
+    ):
+        self.endpoint_uri = URI(endpoint_uri)
+        self.auth_token = auth_token
+        self.api_version = api_version
+
+        # limit caps the total number of open connections, limit_per_host caps
+        # the connections to a single host (0 means no per-host limit).
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+
+        self._session: aiohttp.ClientSession | None = None
+
+    async def __aenter__(self) -> "AsyncNodeHTTPProvider":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # The session binds to the running event loop, so it can only be created
+        # lazily from within a coroutine.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.limit, limit_per_host=self.limit_per_host
+                )
+            )
+
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def get_full_url(self, path: str) -> str:
+        return f"{self.endpoint_uri}/{self.api_version}/{path}"
+
+    async def make_request(
+        self,
+        method: HTTPRequestMethod,
+        path: str,
+        params: dict[str, Any] = {},
+        data: dict[str, Any] = {},
+    ) -> NodeResponseDict:
+        url = self.get_full_url(path)
+        headers = (
+            {"Authorization": f"Bearer {self.auth_token}"} if self.auth_token else {}
+        )
+
+        try:
+            if method == HTTPRequestMethod.GET:
+                request = self.session.get(
+                    url, params=self._prepare_params(params), headers=headers
+                )
+            elif method == HTTPRequestMethod.POST:
+                request = self.session.post(url, json=data, headers=headers)
+            else:
+                raise HTTPRequestMethodNotSupported(
+                    f"{method.name} method isn't supported"
+                )
+
+            async with request as response:
+                response.raise_for_status()
+
+                try:
+                    return NodeResponseDict(await response.json(content_type=None))
+                except ValueError as err:
+                    raise NodeRequestError(f"JSON decoding failed: {err}")
+
+        except aiohttp.ClientError as err:
+            raise NodeRequestError(f"Request failed: {err}")
+
+    @staticmethod
+    def _prepare_params(params: dict[str, Any]) -> dict[str, str]:
+        # Unlike requests, aiohttp only accepts str/int/float query values.
+        return {key: str(value) for key, value in params.items() if value is not None}
@@ -15,15 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import asyncio
 import json
 import os
-from collections import namedtuple
-from functools import wraps
-from pathlib import Path
-from typing import Any, Type
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial, wraps
+from typing import Any, Callable, Hashable
 
-import requests
-from dkg.constants import BLOCKCHAINS, DEFAULT_GAS_PRICE_GWEI
+from dkg.constants import BLOCKCHAINS, DEFAULT_GAS_PRICE_GWEI, MULTICALL3_ADDRESS
 from dkg.exceptions import (
     AccountMissing,
     EnvironmentNotSupported,
@@ -31,26 +30,59 @@ from dkg.exceptions import (
     RPCURINotDefined,
 )
 from dkg.types import URI, Address, DataHexStr, Environment, Wei
+from dkg.utils.abi import abis, output_named_tuples
+from dkg.utils.contracts_cache import ContractsCache
+from dkg.utils.gas import GasLimitModel, GasPriceService
+from dkg.utils.nonce import NonceManager
+from dkg.utils.receipts import ReceiptCollector, ReceiptsBatch, TransactionHandle
 from eth_account.signers.local import LocalAccount
+from eth_utils import event_abi_to_log_topic, to_wei
+from hexbytes import HexBytes
 from web3 import Web3
+from web3._utils.abi import (
+    get_abi_output_types,
+    map_abi_data,
+    named_tree,
+    recursive_dict_to_namedtuple,
+)
+from web3._utils.method_formatters import receipt_formatter
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3._utils.request import make_post_request
 from web3.contract import Contract
 from web3.contract.contract import ContractFunction
+from web3.datastructures import AttributeDict
+from web3.exceptions import TimeExhausted
 from web3.logs import DISCARD
 from web3.middleware import construct_sign_and_send_raw_middleware
-from web3.types import ABI, ABIFunction, TxReceipt
+from web3.types import FilterParams, LogReceipt, TxReceipt
+
+
+class ContractRegistry(dict[str, Contract]):
+    def __init__(self, resolve: Callable[[str], Contract | None], *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolve = resolve
 
+    def __missing__(self, contract: str) -> Contract:
+        if (contract_instance := self._resolve(contract)) is None:
+            raise KeyError(contract)
+        return contract_instance
 
-class BlockchainProvider:
-    CONTRACTS_METADATA_DIR = Path(__file__).parents[1] / "data/interfaces"
+
+class BaseBlockchainProvider:
+    HUB_ADDRESS_EVENTS = [
+        "NewContract",
+        "ContractChanged",
+        "NewAssetStorage",
+        "AssetStorageChanged",
+    ]
 
     def __init__(
         self,
         environment: Environment,
         blockchain_id: str,
         rpc_uri: URI | None = None,
-        private_key: DataHexStr | None = None,
         gas_price: Wei | None = None,
-        verify: bool = True,
+        contracts_cache: ContractsCache | None = None,
     ):
         if environment not in BLOCKCHAINS.keys():
             raise EnvironmentNotSupported(f"Environment {environment} isn't supported!")
@@ -75,35 +107,320 @@ class BlockchainProvider:
                 f"blockchain ID {self.blockchain_id}"
             )
 
-        self.w3 = Web3(
-            Web3.HTTPProvider(self.rpc_uri, request_kwargs={"verify": verify})
+        self.gas_price = gas_price
+        self.gas_limit_model = GasLimitModel()
+        self.contracts_cache = contracts_cache
+
+        self.abi = abis
+        self.output_named_tuples = output_named_tuples
+
+    def decode_logs_event(
+        self, receipt: TxReceipt, contract_name: str, event_name: str
+    ) -> Any:
+        return (
+            self.contracts[contract_name]
+            .events[event_name]()
+            .process_receipt(receipt, errors=DISCARD)
         )
 
-        if self.blockchain_id is None:
-            self.blockchain_id = f"{blockchain_id}:{self.w3.eth.chain_id}"
-            if self.blockchain_id not in BLOCKCHAINS[self.environment]:
-                raise NetworkNotSupported(
-                    f"Network with blockchain ID {self.blockchain_id} isn't supported!"
-                )
+    def _on_transaction_done(
+        self, gas_limit_key: Hashable, future: Future | asyncio.Future
+    ) -> None:
+        if future.cancelled():
+            return
+
+        if (err := future.exception()) is not None:
+            # Receipts that never arrive mean the transaction was dropped or
+            # replaced, so local nonces have to be synced with the chain again.
+            if isinstance(err, TimeExhausted):
+                self.nonce_manager.reset()
+            return
+
+        receipt: TxReceipt = future.result()
+        if receipt["status"] == 1:
+            self.gas_limit_model.observe(gas_limit_key, receipt["gasUsed"])
+        else:
+            self.gas_limit_model.invalidate(gas_limit_key)
+
+    @staticmethod
+    def _get_receipts_requests(
+        tx_hashes: list[HexBytes],
+    ) -> list[tuple[str, list[Any]]]:
+        return [
+            ("eth_blockNumber", []),
+            *(
+                ("eth_getTransactionReceipt", [HexBytes(tx_hash).hex()])
+                for tx_hash in tx_hashes
+            ),
+        ]
+
+    @staticmethod
+    def _encode_batch_request(requests: list[tuple[str, list[Any]]]) -> bytes:
+        return json.dumps(
+            [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                for i, (method, params) in enumerate(requests)
+            ]
+        ).encode()
+
+    @staticmethod
+    def _get_rpc_result(response: dict[str, Any]) -> Any:
+        if "error" in response:
+            return ValueError(response["error"])
+        return response.get("result")
+
+    def _get_batch_results(
+        self, responses: list[dict[str, Any]], size: int
+    ) -> list[Any]:
+        results = [None] * size
+        for response in responses:
+            results[response["id"]] = self._get_rpc_result(response)
+        return results
+
+    @staticmethod
+    def _format_receipts(results: list[Any]) -> ReceiptsBatch:
+        block_number, *receipts = results
+        if isinstance(block_number, Exception):
+            raise block_number
+
+        return int(block_number, 16), [
+            (
+                AttributeDict.recursive(receipt_formatter(receipt))
+                if receipt is not None and not isinstance(receipt, Exception)
+                else None
+            )
+            for receipt in receipts
+        ]
+
+    def _init_blockchain(self, blockchain_id: str) -> None:
+        self.blockchain_id = blockchain_id
+        if self.blockchain_id not in BLOCKCHAINS[self.environment]:
+            raise NetworkNotSupported(
+                f"Network with blockchain ID {self.blockchain_id} isn't supported!"
+            )
 
-        self.gas_price = gas_price
         self.gas_price_oracle = BLOCKCHAINS[self.environment][self.blockchain_id].get(
             "gas_price_oracle",
             None,
         )
-
-        self.abi = self._load_abi()
-        self.output_named_tuples = self._generate_output_named_tuples()
+        self.gas_price_service = (
+            GasPriceService(
+                self.gas_price_oracle,
+                self.rpc_uri,
+                to_wei(
+                    DEFAULT_GAS_PRICE_GWEI[self.blockchain_id.split(":")[0]], "gwei"
+                ),
+            )
+            if self.environment != "development"
+            else None
+        )
 
         hub_address: Address = BLOCKCHAINS[self.environment][self.blockchain_id]["hub"]
-        self.contracts: dict[str, Contract] = {
-            "Hub": self.w3.eth.contract(
-                address=hub_address,
-                abi=self.abi["Hub"],
-                decode_tuples=True,
+        multicall_address: Address = BLOCKCHAINS[self.environment][
+            self.blockchain_id
+        ].get("multicall", MULTICALL3_ADDRESS)
+        self.contracts = ContractRegistry(
+            self._resolve_contract,
+            {
+                "Hub": self.w3.eth.contract(
+                    address=hub_address,
+                    abi=self.abi["Hub"],
+                    decode_tuples=True,
+                ),
+                "Multicall3": self.w3.eth.contract(
+                    address=multicall_address,
+                    abi=self.abi["Multicall3"],
+                    decode_tuples=True,
+                ),
+            },
+        )
+        self.contract_addresses: dict[str, Address] | None = None
+        self._multicall_available: bool | None = None
+
+    def _resolve_contract(self, contract: str) -> Contract | None:
+        if contract not in self.abi or contract not in (self.contract_addresses or {}):
+            return None
+
+        self.contracts[contract] = self.w3.eth.contract(
+            address=self.contract_addresses[contract],
+            abi=self.abi[contract],
+            decode_tuples=True,
+        )
+        return self.contracts[contract]
+
+    def _set_contract_addresses(
+        self,
+        contracts: list[tuple[str, Address]],
+        asset_storages: list[tuple[str, Address]],
+    ) -> None:
+        self.contract_addresses = dict([*contracts, *asset_storages])
+
+    def _set_contract_address(self, contract: str, address: Address) -> None:
+        if self.contract_addresses is not None:
+            self.contract_addresses[contract] = address
+
+        if self.contracts_cache is not None:
+            self.contracts_cache.update(self._contracts_cache_key, contract, address)
+
+        self.contracts[contract] = self.w3.eth.contract(
+            address=address,
+            abi=self.abi[contract],
+            decode_tuples=True,
+        )
+
+    def _get_contract_instance(
+        self, contract: str | dict[str, str]
+    ) -> tuple[str, Contract]:
+        if isinstance(contract, str):
+            return contract, self.contracts[contract]
+
+        contract_name = contract["name"]
+        contract_instance = self.w3.eth.contract(
+            address=contract["address"],
+            abi=self.abi[contract_name],
+            decode_tuples=True,
+        )
+        self.contracts[contract_name] = contract_instance
+
+        return contract_name, contract_instance
+
+    def _remove_contract_address(self, contract: str) -> None:
+        if (
+            self.contract_addresses is None
+            or self.contract_addresses.pop(contract, None) is None
+        ):
+            return
+
+        if self.contracts_cache is not None:
+            self.contracts_cache.invalidate(self._contracts_cache_key)
+
+    @property
+    def _contracts_cache_key(self) -> str:
+        return ContractsCache.key(
+            self.environment, self.blockchain_id, self.contracts["Hub"].address
+        )
+
+    def _load_cached_contract_addresses(self) -> dict[str, Any] | None:
+        if self.contracts_cache is None:
+            return None
+
+        if (entry := self.contracts_cache.get(self._contracts_cache_key)) is not None:
+            self.contract_addresses = entry["addresses"]
+        return entry
+
+    def _cache_contract_addresses(self, block_number: int) -> None:
+        if self.contracts_cache is not None:
+            self.contracts_cache.set(
+                self._contracts_cache_key, self.contract_addresses, block_number
             )
+
+    def _get_hub_events_filter(self, from_block: int, to_block: int) -> FilterParams:
+        hub = self.contracts["Hub"]
+        return {
+            "address": hub.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [
+                [
+                    event_abi_to_log_topic(hub.events[event_name]().abi)
+                    for event_name in self.HUB_ADDRESS_EVENTS
+                ]
+            ],
         }
-        self._init_contracts()
+
+    def _apply_hub_events(self, logs: list[LogReceipt]) -> None:
+        hub = self.contracts["Hub"]
+        events = {
+            event_abi_to_log_topic(event.abi): event
+            for event in (
+                hub.events[event_name]() for event_name in self.HUB_ADDRESS_EVENTS
+            )
+        }
+
+        for log in logs:
+            event_args = events[log["topics"][0]].process_log(log)["args"]
+            self.contract_addresses[event_args["contractName"]] = event_args[
+                "newContractAddress"
+            ]
+            self.contracts.pop(event_args["contractName"], None)
+
+    def _bind_call(
+        self,
+        contract: str | dict[str, str],
+        function: str,
+        args: dict[str, Any] = {},
+        **kwargs: Any,
+    ) -> tuple[str, ContractFunction]:
+        contract_name, contract_instance = self._get_contract_instance(contract)
+
+        return contract_name, getattr(contract_instance.functions, function)(**args)
+
+    def _decode_call_result(
+        self, contract_name: str, contract_function: ContractFunction, data: bytes
+    ) -> Any:
+        output_types = get_abi_output_types(contract_function.abi)
+        result = map_abi_data(
+            BASE_RETURN_NORMALIZERS,
+            output_types,
+            self.w3.codec.decode(output_types, data),
+        )
+
+        if contract_function.decode_tuples:
+            result = recursive_dict_to_namedtuple(
+                named_tree(contract_function.abi["outputs"], result)
+            )
+
+        if len(result) == 1:
+            result = result[0]
+
+        return self._format_call_result(
+            contract_name, contract_function.fn_name, result
+        )
+
+    def _format_call_result(
+        self, contract_name: str, function: str, result: Any
+    ) -> Any:
+        if function in (output_named_tuples := self.output_named_tuples[contract_name]):
+            result = output_named_tuples[function](*result)
+        return result
+
+    @staticmethod
+    def _is_contract_error(err: Exception) -> bool:
+        return any(msg in str(err) for msg in ["revert", "VM Exception"])
+
+    def _get_network_gas_price(self) -> Wei | None:
+        if self.gas_price_service is None:
+            return None
+
+        return self.gas_price_service.get()
+
+
+class BlockchainProvider(BaseBlockchainProvider):
+    def __init__(
+        self,
+        environment: Environment,
+        blockchain_id: str,
+        rpc_uri: URI | None = None,
+        private_key: DataHexStr | None = None,
+        gas_price: Wei | None = None,
+        verify: bool = True,
+        contracts_cache: ContractsCache | None = None,
+    ):
+        super().__init__(
+            environment, blockchain_id, rpc_uri, gas_price, contracts_cache
+        )
+
+        self.w3 = Web3(
+            Web3.HTTPProvider(self.rpc_uri, request_kwargs={"verify": verify})
+        )
+        self.receipt_collector = ReceiptCollector(self._get_transaction_receipts)
+        self._resend_executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="dkg-gas-fallback"
+        )
+
+        self._init_blockchain(
+            self.blockchain_id or f"{blockchain_id}:{self.w3.eth.chain_id}"
+        )
 
         if (
             private_key is not None
@@ -111,6 +428,13 @@ class BlockchainProvider:
         ):
             self.set_account(private_key or private_key_env)
 
+    def close(self) -> None:
+        self.receipt_collector.close()
+        self._resend_executor.shutdown(wait=True, cancel_futures=True)
+
+        if self.gas_price_service is not None:
+            self.gas_price_service.close()
+
     def make_json_rpc_request(self, endpoint: str, args: dict[str, Any] = {}) -> Any:
         web3_method = getattr(self.w3.eth, endpoint)
 
@@ -131,7 +455,7 @@ class BlockchainProvider:
                 if (
                     contract_name
                     and isinstance(contract_name, str)
-                    and any(msg in str(err) for msg in ["revert", "VM Exception"])
+                    and self._is_contract_error(err)
                     and not self._check_contract_status(contract_name)
                 ):
                     is_updated = self._update_contract_instance(contract_name)
@@ -150,18 +474,9 @@ class BlockchainProvider:
         state_changing: bool = False,
         gas_price: Wei | None = None,
         gas_limit: Wei | None = None,
-    ) -> TxReceipt | Any:
-        if isinstance(contract, str):
-            contract_name = contract
-            contract_instance = self.contracts[contract_name]
-        else:
-            contract_name = contract["name"]
-            contract_instance = self.w3.eth.contract(
-                address=contract["address"],
-                abi=self.abi[contract_name],
-                decode_tuples=True,
-            )
-            self.contracts[contract_name] = contract_instance
+        wait: bool = True,
+    ) -> TxReceipt | TransactionHandle | Any:
+        contract_name, contract_instance = self._get_contract_instance(contract)
 
         contract_function: ContractFunction = getattr(
             contract_instance.functions, function
@@ -169,11 +484,7 @@ class BlockchainProvider:
 
         if not state_changing:
             result = contract_function(**args).call()
-            if function in (
-                output_named_tuples := self.output_named_tuples[contract_name]
-            ):
-                result = output_named_tuples[function](*result)
-            return result
+            return self._format_call_result(contract_name, function, result)
         else:
             if not hasattr(self, "account"):
                 raise AccountMissing(
@@ -183,24 +494,85 @@ class BlockchainProvider:
 
             gas_price = self.gas_price or gas_price or self._get_network_gas_price()
 
-            options = {
-                "gasPrice": gas_price,
-                "gas": gas_limit or contract_function(**args).estimate_gas(),
-            }
+            gas_limit_key = GasLimitModel.key(contract_name, function, args)
+            learned_gas_limit = (
+                self.gas_limit_model.predict(gas_limit_key)
+                if gas_limit is None
+                else None
+            )
 
-            tx_hash = contract_function(**args).transact(options)
-            tx_receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash)
+            def send_transaction(gas: Wei) -> TransactionHandle:
+                tx_hash = self.nonce_manager.send(
+                    lambda nonce: contract_function(**args).transact(
+                        {"gasPrice": gas_price, "gas": gas, "nonce": nonce}
+                    )
+                )
 
-            return tx_receipt
+                handle = self.receipt_collector.submit(tx_hash)
+                handle.future.add_done_callback(
+                    partial(self._on_transaction_done, gas_limit_key)
+                )
+                return handle
 
-    def decode_logs_event(
-        self, receipt: TxReceipt, contract_name: str, event_name: str
-    ) -> Any:
-        return (
-            self.contracts[contract_name]
-            .events[event_name]()
-            .process_receipt(receipt, errors=DISCARD)
-        )
+            handle = send_transaction(
+                gas_limit
+                or learned_gas_limit
+                or contract_function(**args).estimate_gas()
+            )
+
+            if learned_gas_limit is not None:
+                handle = self._with_gas_fallback(
+                    handle,
+                    lambda: send_transaction(contract_function(**args).estimate_gas()),
+                )
+
+            if not wait:
+                return handle
+
+            return handle.wait()
+
+    def _with_gas_fallback(
+        self, handle: TransactionHandle, resend: Callable[[], TransactionHandle]
+    ) -> TransactionHandle:
+        # Transactions sent with a learned gas limit skip estimation, so one
+        # that reverts (e.g. out of gas) is estimated and sent once more.
+        # Estimation raises for calls that revert anyway, before paying again.
+        # The resend runs on its own executor, done callbacks of receipt
+        # futures are called from the receipt collector thread.
+        fallback_handle = TransactionHandle(handle.tx_hash, Future())
+        future = fallback_handle.future
+
+        def forward(source: Future) -> None:
+            if source.cancelled():
+                future.cancel()
+            elif (err := source.exception()) is not None:
+                future.set_exception(err)
+            else:
+                future.set_result(source.result())
+
+        def resent(source: Future) -> None:
+            if source.cancelled() or source.exception() is not None:
+                return forward(source)
+
+            resent_handle: TransactionHandle = source.result()
+            fallback_handle.tx_hash = resent_handle.tx_hash
+            resent_handle.future.add_done_callback(forward)
+
+        def fallback(source: Future) -> None:
+            if (
+                source.cancelled()
+                or source.exception() is not None
+                or source.result()["status"] == 1
+            ):
+                return forward(source)
+
+            try:
+                self._resend_executor.submit(resend).add_done_callback(resent)
+            except RuntimeError as err:
+                future.set_exception(err)
+
+        handle.future.add_done_callback(fallback)
+        return fallback_handle
 
     def set_account(self, private_key: DataHexStr):
         self.account: LocalAccount = self.w3.eth.account.from_key(private_key)
@@ -208,50 +580,109 @@ class BlockchainProvider:
             construct_sign_and_send_raw_middleware(self.account)
         )
         self.w3.eth.default_account = self.account.address
+        self.nonce_manager = NonceManager(
+            partial(self.w3.eth.get_transaction_count, self.account.address, "pending")
+        )
 
-    def _get_network_gas_price(self) -> Wei | None:
-        if self.environment == "development":
-            return None
+    def multicall(self, calls: list[dict[str, Any]]) -> list[Any]:
+        if len(calls) < 2 or not self._is_multicall_available():
+            return [self.call_function(**call) for call in calls]
+
+        bound_calls = [self._bind_call(**call) for call in calls]
+        results = (
+            self.contracts["Multicall3"]
+            .functions.aggregate3(
+                [
+                    (
+                        contract_function.address,
+                        True,
+                        contract_function._encode_transaction_data(),
+                    )
+                    for _, contract_function in bound_calls
+                ]
+            )
+            .call()
+        )
 
-        blockchain_name, _ = self.blockchain_id.split(":")
+        # Failed calls are repeated on their own, so that reverts are raised
+        # and outdated contracts are handled the same way as for single calls.
+        return [
+            (
+                self._decode_call_result(contract_name, contract_function, return_data)
+                if success and return_data
+                else self.call_function(**call)
+            )
+            for call, (contract_name, contract_function), (success, return_data) in zip(
+                calls, bound_calls, results
+            )
+        ]
 
-        default_gas_price = self.w3.to_wei(
-            DEFAULT_GAS_PRICE_GWEI[blockchain_name], "gwei"
+    def _get_transaction_receipts(self, tx_hashes: list[HexBytes]) -> ReceiptsBatch:
+        return self._format_receipts(
+            self._make_batch_request(self._get_receipts_requests(tx_hashes))
         )
 
-        def fetch_gas_price(oracle_url: str) -> Wei | None:
-            try:
-                response = requests.get(oracle_url)
-                response.raise_for_status()
-                data: dict = response.json()
-
-                if "result" in data:
-                    return int(data["result"], 16)
-                elif "average" in data:
-                    return self.w3.to_wei(data["average"], "gwei")
-                else:
-                    return None
-            except Exception:
-                return None
+    def _make_batch_request(self, requests: list[tuple[str, list[Any]]]) -> list[Any]:
+        provider = self.w3.provider
+        responses = provider.decode_rpc_response(
+            make_post_request(
+                provider.endpoint_uri,
+                self._encode_batch_request(requests),
+                **provider.get_request_kwargs(),
+            )
+        )
+
+        if not isinstance(responses, list):
+            # Nodes without batch support answer with a single error object.
+            return [
+                self._get_rpc_result(provider.make_request(method, params))
+                for method, params in requests
+            ]
 
-        oracles = self.gas_price_oracle
-        if oracles is not None:
-            if isinstance(oracles, str):
-                oracles = [oracles]
+        return self._get_batch_results(responses, len(requests))
+
+    def _is_multicall_available(self) -> bool:
+        if self._multicall_available is None:
+            self._multicall_available = (
+                len(self.w3.eth.get_code(self.contracts["Multicall3"].address)) > 0
+            )
+        return self._multicall_available
 
-            for oracle_url in oracles:
-                gas_price = fetch_gas_price(oracle_url)
-                if gas_price is not None:
-                    return gas_price
+    def _resolve_contract(self, contract: str) -> Contract | None:
+        if self.contract_addresses is None:
+            self._init_contracts()
 
-        return default_gas_price
+        return super()._resolve_contract(contract)
 
     def _init_contracts(self):
-        for contract in self.abi.keys():
-            if contract == "Hub":
-                continue
+        if (entry := self._load_cached_contract_addresses()) is not None:
+            if not self.contracts_cache.is_expired(entry):
+                return
 
-            self._update_contract_instance(contract)
+            try:
+                return self._sync_contract_addresses(entry["block"])
+            except Exception:
+                pass
+
+        block_number = (
+            self.w3.eth.block_number if self.contracts_cache is not None else "latest"
+        )
+        hub = self.contracts["Hub"].functions
+        self._set_contract_addresses(
+            hub.getAllContracts().call(block_identifier=block_number),
+            hub.getAllAssetStorages().call(block_identifier=block_number),
+        )
+        self._cache_contract_addresses(block_number)
+
+    def _sync_contract_addresses(self, from_block: int) -> None:
+        block_number = self.w3.eth.block_number
+        if block_number > from_block:
+            self._apply_hub_events(
+                self.w3.eth.get_logs(
+                    self._get_hub_events_filter(from_block + 1, block_number)
+                )
+            )
+        self._cache_contract_addresses(block_number)
 
     def _update_contract_instance(self, contract: str) -> bool:
         if (
@@ -260,18 +691,19 @@ class BlockchainProvider:
             .functions.isAssetStorage(assetStorageName=contract)
             .call()
         ):
-            self.contracts[contract] = self.w3.eth.contract(
-                address=(
+            self._set_contract_address(
+                contract,
+                (
                     self.contracts["Hub"].functions.getContractAddress(contract).call()
                     if not contract.endswith("AssetStorage")
                     else self.contracts["Hub"]
                     .functions.getAssetStorageAddress(contract)
                     .call()
                 ),
-                abi=self.abi[contract],
-                decode_tuples=True,
             )
             return True
+
+        self._remove_contract_address(contract)
         return False
 
     def _check_contract_status(self, contract: str) -> bool:
@@ -279,33 +711,3 @@ class BlockchainProvider:
             return self.call_function(contract, "status")
         except Exception:
             return False
-
-    def _generate_output_named_tuples(self) -> dict[str, dict[str, Type[tuple]]]:
-        def generate_output_namedtuple(function_abi: ABIFunction) -> Type[tuple] | None:
-            output_names = [output["name"] for output in function_abi["outputs"]]
-            if all(name != "" for name in output_names):
-                return namedtuple(f"{function_abi['name']}Result", output_names)
-            return None
-
-        output_named_tuples = {}
-        for contract_name, contract_abi in self.abi.items():
-            output_named_tuples[contract_name] = {}
-            for item in contract_abi:
-                if (item["type"] != "function") or not item["outputs"]:
-                    continue
-                elif item["name"] in output_named_tuples[contract_name]:
-                    continue
-                named_tuple = generate_output_namedtuple(item)
-                if named_tuple is not None:
-                    output_named_tuples[contract_name][item["name"]] = named_tuple
-
-        return output_named_tuples
-
-    def _load_abi(self) -> ABI:
-        abi = {}
-
-        for contract_metadata in self.CONTRACTS_METADATA_DIR.glob("*.json"):
-            with open(contract_metadata, "r") as metadata_json:
-                abi[contract_metadata.stem] = json.load(metadata_json)
-
-        return abi
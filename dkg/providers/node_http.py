@@ -15,12 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from threading import Lock
 from typing import Any
 
 import requests
 from dkg.dataclasses import HTTPRequestMethod, NodeResponseDict
 from dkg.exceptions import HTTPRequestMethodNotSupported, NodeRequestError
 from dkg.types import URI
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError, ConnectionError, Timeout, RequestException
 
 
@@ -30,11 +32,44 @@ class NodeHTTPProvider:
         endpoint_uri: URI | str,
         auth_token: str | None = None,
         api_version: str = "v0",
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
     ):
         self.endpoint_uri = URI(endpoint_uri)
         self.auth_token = auth_token
         self.api_version = api_version
 
+        # pool_connections is the number of per-host pools kept alive,
+        # pool_maxsize is the number of connections kept alive per host.
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+
+        self._session: requests.Session | None = None
+        self._session_lock = Lock()
+
+    def __enter__(self) -> "NodeHTTPProvider":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+
+        return self._session
+
+    def close(self) -> None:
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
     def get_full_url(self, path: str) -> str:
         return f"{self.endpoint_uri}/{self.api_version}/{path}"
 
@@ -52,9 +87,9 @@ class NodeHTTPProvider:
 
         try:
             if method == HTTPRequestMethod.GET:
-                response = requests.get(url, params=params, headers=headers)
+                response = self.session.get(url, params=params, headers=headers)
             elif method == HTTPRequestMethod.POST:
-                response = requests.post(url, json=data, headers=headers)
+                response = self.session.post(url, json=data, headers=headers)
             else:
                 raise HTTPRequestMethodNotSupported(
                     f"{method.name} method isn't supported"
@@ -69,3 +104,16 @@ class NodeHTTPProvider:
 
         except (HTTPError, ConnectionError, Timeout, RequestException) as err:
             raise NodeRequestError(f"Request failed: {err}")
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import json
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Generic, Iterator, Mapping, Type, TypeVar
+
+from dkg.types import ABI, ABIFunction
+
+CONTRACTS_METADATA_DIR = Path(__file__).parents[1] / "data/interfaces"
+
+V = TypeVar("V")
+
+
+@lru_cache(maxsize=None)
+def get_contract_names() -> tuple[str, ...]:
+    return tuple(
+        sorted(
+            contract_metadata.stem
+            for contract_metadata in CONTRACTS_METADATA_DIR.glob("*.json")
+        )
+    )
+
+
+class AbiRegistry(Mapping[str, V], Generic[V]):
+    def __init__(self, name: str, load: Callable[[str], V]):
+        self._name = name
+        self._load = load
+        self._items: dict[str, V] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, contract: str) -> V:
+        if contract in self._items:
+            return self._items[contract]
+
+        if contract not in get_contract_names():
+            raise KeyError(contract)
+
+        with self._lock:
+            if contract not in self._items:
+                self._items[contract] = self._load(contract)
+
+        return self._items[contract]
+
+    # Attribute access makes registry items reachable through their qualified
+    # names, which is how pickle looks up the output named tuple classes.
+    def __getattr__(self, contract: str) -> V:
+        if contract.startswith("_"):
+            raise AttributeError(contract)
+
+        try:
+            return self[contract]
+        except KeyError:
+            raise AttributeError(contract) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(get_contract_names())
+
+    def __len__(self) -> int:
+        return len(get_contract_names())
+
+    def __contains__(self, contract: object) -> bool:
+        return contract in get_contract_names()
+
+    def __reduce__(self) -> str:
+        return self._name
+
+
+class OutputNamedTuples(dict[str, Type[tuple]]):
+    def __getattr__(self, function: str) -> Type[tuple]:
+        try:
+            return self[function]
+        except KeyError:
+            raise AttributeError(function) from None
+
+
+def _load_abi(contract: str) -> ABI:
+    with open(CONTRACTS_METADATA_DIR / f"{contract}.json", "r") as metadata_json:
+        return json.load(metadata_json)
+
+
+def _generate_output_named_tuples(contract: str) -> OutputNamedTuples:
+    def generate_output_namedtuple(function_abi: ABIFunction) -> Type[tuple] | None:
+        output_names = [output["name"] for output in function_abi["outputs"]]
+        if all(name != "" for name in output_names):
+            named_tuple = namedtuple(
+                f"{function_abi['name']}Result", output_names, module=__name__
+            )
+            named_tuple.__qualname__ = (
+                f"output_named_tuples.{contract}.{function_abi['name']}"
+            )
+            return named_tuple
+        return None
+
+    output_named_tuples = OutputNamedTuples()
+    for item in abis[contract]:
+        if (item["type"] != "function") or not item["outputs"]:
+            continue
+        elif item["name"] in output_named_tuples:
+            continue
+        named_tuple = generate_output_namedtuple(item)
+        if named_tuple is not None:
+            output_named_tuples[item["name"]] = named_tuple
+
+    return output_named_tuples
+
+
+abis: AbiRegistry[ABI] = AbiRegistry("abis", _load_abi)
+output_named_tuples: AbiRegistry[OutputNamedTuples] = AbiRegistry(
+    "output_named_tuples", _generate_output_named_tuples
+)
@@ -0,0 +1,122 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+from dkg.types import UAL, AgreementData, HexStr
+
+
+@dataclass
+class AgreementEntry:
+    agreement_id: HexStr
+    agreement_data: AgreementData
+    latest_state: HexStr
+    latest_state_size: int
+    fetched_at: float = field(default_factory=time.monotonic)
+
+
+class BlockClock:
+    def __init__(self, max_age: float | None = 300.0):
+        self.max_age = max_age
+
+        self._anchor: tuple[int, float] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_anchored(self) -> bool:
+        return self.now() is not None
+
+    def anchor(self, block_timestamp: int) -> None:
+        with self._lock:
+            self._anchor = (block_timestamp, time.monotonic())
+
+    def now(self) -> int | None:
+        with self._lock:
+            if self._anchor is None:
+                return None
+
+            block_timestamp, anchored_at = self._anchor
+            elapsed = time.monotonic() - anchored_at
+            if self.max_age is not None and elapsed > self.max_age:
+                return None
+
+            return block_timestamp + int(elapsed)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._anchor = None
+
+
+class AgreementCache:
+    def __init__(
+        self,
+        ttl: float | None = 60.0,
+        max_size: int = 1024,
+        clock: BlockClock | None = None,
+    ):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock or BlockClock()
+
+        self._entries: OrderedDict[UAL, AgreementEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, ual: UAL) -> AgreementEntry | None:
+        with self._lock:
+            entry = self._entries.get(ual)
+            if entry is None:
+                return None
+
+            if self.ttl is not None and time.monotonic() - entry.fetched_at > self.ttl:
+                del self._entries[ual]
+                return None
+
+            self._entries.move_to_end(ual)
+            return entry
+
+    def set(self, ual: UAL, entry: AgreementEntry) -> None:
+        with self._lock:
+            self._entries[ual] = entry
+            self._entries.move_to_end(ual)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, ual: UAL | None = None) -> None:
+        with self._lock:
+            if ual is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(ual, None)
+
+    def epochs_left(self, agreement_data: AgreementData) -> int | None:
+        timestamp_now = self.clock.now()
+        if timestamp_now is None:
+            return None
+
+        return get_epochs_left(agreement_data, timestamp_now)
+
+
+def get_epochs_left(agreement_data: AgreementData, timestamp_now: int) -> int:
+    current_epoch = math.floor(
+        (timestamp_now - agreement_data.startTime) / agreement_data.epochLength
+    )
+    return agreement_data.epochsNumber - current_epoch
@@ -0,0 +1,168 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable
+
+from dkg.types import Wei
+
+
+class BaseAllowanceBudget:
+    def __init__(self, top_up: Wei = 0):
+        self.top_up = top_up
+
+        self._available: Wei | None = None
+        self._in_flight: Wei = 0
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> Wei | None:
+        return self._available
+
+    @property
+    def in_flight(self) -> Wei:
+        return self._in_flight
+
+    def confirm(self, amount: Wei) -> None:
+        with self._lock:
+            self._in_flight -= amount
+
+    def release(self, amount: Wei, invalidate: bool = True) -> None:
+        with self._lock:
+            self._in_flight -= amount
+            if invalidate:
+                self._available = None
+            elif self._available is not None:
+                self._available += amount
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._available = None
+
+    def _take(self, amount: Wei) -> bool:
+        with self._lock:
+            if amount <= 0:
+                return True
+
+            if self._available is None or self._available < amount:
+                return False
+
+            self._available -= amount
+            self._in_flight += amount
+            return True
+
+    def _missing(self, allowance: Wei, amount: Wei) -> tuple[Wei, Wei]:
+        # Reservations of unconfirmed transactions aren't spent on chain yet,
+        # so they're subtracted from the on-chain allowance.
+        with self._lock:
+            available = allowance - self._in_flight
+        return available, max(amount - available, 0)
+
+    def _set(self, available: Wei, reserved: Wei = 0) -> None:
+        with self._lock:
+            self._available = available - reserved
+            self._in_flight += reserved
+
+
+class AllowanceBudget(BaseAllowanceBudget):
+    def __init__(
+        self,
+        get_allowance: Callable[[], Wei],
+        increase_allowance: Callable[[Wei], Any],
+        top_up: Wei = 0,
+    ):
+        super().__init__(top_up)
+        self.get_allowance = get_allowance
+        self.increase_allowance = increase_allowance
+
+        self._reconcile_lock = threading.Lock()
+
+    def approve(self, amount: Wei) -> Wei:
+        with self._reconcile_lock:
+            self.invalidate()
+            available, missing = self._missing(self.get_allowance(), amount)
+            if missing > 0:
+                self.increase_allowance(missing)
+
+            self._set(available + missing)
+            return missing
+
+    def reserve(self, amount: Wei) -> Wei:
+        if self._take(amount):
+            return 0
+
+        with self._reconcile_lock:
+            if self._take(amount):
+                return 0
+
+            self.invalidate()
+            available, missing = self._missing(self.get_allowance(), amount)
+            if missing > 0:
+                missing += self.top_up
+                self.increase_allowance(missing)
+
+            self._set(available + missing, amount)
+            return missing
+
+
+class AsyncAllowanceBudget(BaseAllowanceBudget):
+    def __init__(
+        self,
+        get_allowance: Callable[[], Awaitable[Wei]],
+        increase_allowance: Callable[[Wei], Awaitable[Any]],
+        top_up: Wei = 0,
+    ):
+        super().__init__(top_up)
+        self.get_allowance = get_allowance
+        self.increase_allowance = increase_allowance
+
+        self._reconcile_lock: asyncio.Lock | None = None
+
+    @property
+    def reconcile_lock(self) -> asyncio.Lock:
+        if self._reconcile_lock is None:
+            self._reconcile_lock = asyncio.Lock()
+        return self._reconcile_lock
+
+    async def approve(self, amount: Wei) -> Wei:
+        async with self.reconcile_lock:
+            self.invalidate()
+            available, missing = self._missing(await self.get_allowance(), amount)
+            if missing > 0:
+                await self.increase_allowance(missing)
+
+            self._set(available + missing)
+            return missing
+
+    async def reserve(self, amount: Wei) -> Wei:
+        if self._take(amount):
+            return 0
+
+        async with self.reconcile_lock:
+            if self._take(amount):
+                return 0
+
+            self.invalidate()
+            available, missing = self._missing(await self.get_allowance(), amount)
+            if missing > 0:
+                missing += self.top_up
+                await self.increase_allowance(missing)
+
+            self._set(available + missing, amount)
+            return missing
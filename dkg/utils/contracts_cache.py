@@ -0,0 +1,93 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from dkg.types import Address
+
+DEFAULT_CONTRACTS_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "dkg"
+    / "contracts.json"
+)
+
+
+class ContractsCache:
+    def __init__(self, path: str | Path | None = None, ttl: float | None = 3600):
+        self.path = Path(path) if path is not None else DEFAULT_CONTRACTS_CACHE_PATH
+        self.ttl = ttl
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(environment: str, blockchain_id: str, hub_address: Address) -> str:
+        return f"{environment}:{blockchain_id}:{hub_address.lower()}"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self._read().get(key)
+
+    def set(self, key: str, addresses: dict[str, Address], block_number: int) -> None:
+        with self._lock:
+            entries = self._read()
+            entries[key] = {
+                "block": block_number,
+                "timestamp": time.time(),
+                "addresses": addresses,
+            }
+            self._write(entries)
+
+    def update(self, key: str, contract: str, address: Address) -> None:
+        with self._lock:
+            entries = self._read()
+            if key in entries:
+                entries[key]["addresses"][contract] = address
+                self._write(entries)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            entries = self._read()
+            if entries.pop(key, None) is not None:
+                self._write(entries)
+
+    def is_expired(self, entry: dict[str, Any]) -> bool:
+        return self.ttl is not None and (time.time() - entry["timestamp"]) > self.ttl
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            with open(self.path, "r") as cache_json:
+                return json.load(cache_json)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, entries: dict[str, dict[str, Any]]) -> None:
+        # Written to a temporary file first, so that concurrent processes
+        # never read a partially written cache.
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as cache_json:
+                json.dump(entries, cache_json, indent=2)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,241 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Hashable
+
+import requests
+from dkg.types import URI, Wei
+from eth_utils import to_wei
+
+
+def parse_gas_price(data: dict[str, Any]) -> Wei | None:
+    if "result" in data:
+        return int(data["result"], 16)
+    elif "average" in data:
+        return to_wei(data["average"], "gwei")
+    else:
+        return None
+
+
+class GasPriceService:
+    def __init__(
+        self,
+        oracles: str | list[str] | None,
+        rpc_uri: URI | None,
+        default_gas_price: Wei,
+        ttl: float = 30.0,
+        timeout: float = 2.0,
+        refresh_ahead: float = 0.5,
+    ):
+        self.oracles = [oracles] if isinstance(oracles, str) else list(oracles or [])
+        self.rpc_uri = rpc_uri
+        self.default_gas_price = default_gas_price
+        self.ttl = ttl
+        self.timeout = timeout
+        self.refresh_ahead = refresh_ahead
+
+        self._cached: tuple[Wei, float] | None = None
+        self._lock = threading.Lock()
+        self._refreshing: Future | None = None
+        self._refresh_thread: threading.Thread | None = None
+        self._closed = False
+        self._session = requests.Session()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def get(self) -> Wei:
+        if (cached := self._cached) is not None:
+            gas_price, fetched_at = cached
+            age = time.monotonic() - fetched_at
+
+            if age < self.ttl:
+                if age >= self.ttl * self.refresh_ahead:
+                    self._refresh_in_background()
+                return gas_price
+
+        return self._refresh()
+
+    def invalidate(self) -> None:
+        self._cached = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            refresh_thread = self._refresh_thread
+
+        if refresh_thread is not None:
+            refresh_thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+
+    def _refresh(self) -> Wei:
+        # Only one fetch runs at a time, callers that find one in flight
+        # wait for its result instead of querying the oracles again.
+        with self._lock:
+            if (cached := self._cached) is not None and (
+                time.monotonic() - cached[1] < self.ttl
+            ):
+                return cached[0]
+
+            in_flight = self._refreshing is not None
+            if not in_flight:
+                self._refreshing = Future()
+            refreshing = self._refreshing
+
+        if not in_flight:
+            self._run_refresh(refreshing)
+        return refreshing.result()
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing is not None or self._closed:
+                return
+            self._refreshing = Future()
+
+            self._refresh_thread = threading.Thread(
+                target=self._run_refresh,
+                args=(self._refreshing,),
+                name="dkg-gas-price-refresh",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def _run_refresh(self, refreshing: Future) -> None:
+        try:
+            gas_price = self._fetch()
+            self._cached = (gas_price, time.monotonic())
+            refreshing.set_result(gas_price)
+        except BaseException as err:
+            refreshing.set_exception(err)
+        finally:
+            with self._lock:
+                self._refreshing = None
+
+    def _fetch(self) -> Wei:
+        if self.oracles:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=len(self.oracles), thread_name_prefix="dkg-gas-price"
+                )
+
+            pending = {
+                self._executor.submit(self._fetch_oracle_gas_price, oracle)
+                for oracle in self.oracles
+            }
+            deadline = time.monotonic() + self.timeout
+            while pending and (remaining := deadline - time.monotonic()) > 0:
+                done, pending = wait(
+                    pending, timeout=remaining, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    if (gas_price := future.result()) is not None:
+                        return gas_price
+
+        return self._fetch_rpc_gas_price() or self.default_gas_price
+
+    def _fetch_oracle_gas_price(self, oracle_url: str) -> Wei | None:
+        try:
+            response = self._session.get(oracle_url, timeout=self.timeout)
+            response.raise_for_status()
+            return parse_gas_price(response.json())
+        except Exception:
+            return None
+
+    def _fetch_rpc_gas_price(self) -> Wei | None:
+        if self.rpc_uri is None:
+            return None
+
+        try:
+            response = self._session.post(
+                self.rpc_uri,
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "eth_gasPrice",
+                    "params": [],
+                },
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            return parse_gas_price(response.json())
+        except Exception:
+            return None
+
+
+def _args_shape(value: Any) -> Hashable:
+    match value:
+        case str() | bytes() | bytearray():
+            return type(value).__name__, len(value)
+        case dict():
+            return tuple((key, _args_shape(item)) for key, item in value.items())
+        case list() | tuple():
+            return tuple(_args_shape(item) for item in value)
+        case _:
+            return type(value).__name__
+
+
+class GasLimitModel:
+    def __init__(
+        self,
+        margin: float = 1.25,
+        min_samples: int = 3,
+        max_samples: int = 16,
+        tolerance: float = 0.25,
+    ):
+        self.margin = margin
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.tolerance = tolerance
+
+        self._samples: dict[Hashable, deque[int]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(contract: str, function: str, args: dict[str, Any]) -> Hashable:
+        return contract, function, _args_shape(args)
+
+    def predict(self, key: Hashable) -> Wei | None:
+        with self._lock:
+            samples = self._samples.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+
+            return int(max(samples) * self.margin)
+
+    def observe(self, key: Hashable, gas_used: int) -> None:
+        with self._lock:
+            samples = self._samples.setdefault(key, deque(maxlen=self.max_samples))
+
+            # Outliers mean the cost depends on more than the shape of the
+            # arguments, the model is relearned and estimation is used again.
+            if samples and (
+                abs(gas_used - (median := statistics.median(samples))) / median
+                > self.tolerance
+            ):
+                samples.clear()
+
+            samples.append(gas_used)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._samples.pop(key, None)
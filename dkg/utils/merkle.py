@@ -15,41 +15,84 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import copy
 import hashlib
-from typing import Callable
-
+import os
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Callable, Iterable
+
+from dkg.constants import DEFAULT_MERKLE_PARALLEL_THRESHOLD
+from dkg.dataclasses import Multiproof, MultiproofStep
 from dkg.exceptions import LeafNotInTree
 from dkg.types import HexStr
 from eth_abi.packed import encode_packed
+from eth_utils import keccak
 from hexbytes import HexBytes
-from web3 import Web3
 
 
-def solidity_keccak256(data: HexStr) -> HexStr:
-    bytes_hash: HexBytes = Web3.solidity_keccak(
-        ["bytes"],
-        [data],
+def _load_keccak256() -> Callable[[bytes], bytes]:
+    try:
+        from sha3 import keccak_256
+
+        return lambda data: keccak_256(data).digest()
+    except ImportError:
+        pass
+
+    try:
+        from Crypto.Hash import keccak as _keccak
+
+        return lambda data: _keccak.new(data=data, digest_bits=256).digest()
+    except ImportError:
+        return keccak
+
+
+keccak256: Callable[[bytes], bytes] = _load_keccak256()
+
+
+def solidity_keccak256(data: HexStr | bytes) -> HexStr:
+    bytes_hash = HexBytes(
+        keccak(hexstr=data) if isinstance(data, str) else keccak(data)
     )
 
     return bytes_hash.hex()
 
 
+def hash_leaves(leaves: list[str], offset: int = 0) -> list[bytes]:
+    # keccak(abi.encodePacked(keccak(leaf), index)) on a reused 64-byte buffer.
+    buffer = bytearray(64)
+    hashes = []
+    for i, leaf in enumerate(leaves, offset):
+        buffer[:32] = keccak256(leaf.encode())
+        buffer[32:] = i.to_bytes(32, "big")
+        hashes.append(keccak256(buffer))
+
+    return hashes
+
+
 def hash_assertion_with_indexes(
     leaves: list[str],
     hash_function: str | Callable[[str], HexStr] = solidity_keccak256,
     sort: bool = True,
+    parallel: bool = False,
+    max_workers: int | None = None,
 ) -> list[HexStr]:
     if sort:
         leaves.sort()
 
+    if hash_function is solidity_keccak256:
+        if parallel and len(leaves) >= DEFAULT_MERKLE_PARALLEL_THRESHOLD:
+            return _to_hex_list(_hash_leaves_parallel(leaves, max_workers))
+
+        return ["0x" + leaf_hash.hex() for leaf_hash in hash_leaves(leaves)]
+
     return list(
         map(
             hash_function,
             [
                 encode_packed(
                     ["bytes32", "uint256"],
-                    [Web3.solidity_keccak(["string"], [leaf]), i],
+                    [keccak(text=leaf), i],
                 )
                 for i, leaf in enumerate(leaves)
             ],
@@ -71,6 +114,8 @@ class MerkleTree:
         self.leaves = self._process_leaves(leaves)
         self.tree = self.build_tree()
 
+        self._leaf_indexes: dict[HexStr, int] | None = None
+
     @property
     def root(self) -> HexStr:
         return self.tree[0][0]
@@ -99,57 +144,80 @@ class MerkleTree:
 
     def proof(self, leaf: HexStr, index: int | None = None) -> list[HexStr]:
         if index is None:
-            for i, t_leaf in enumerate(self.leaves):
-                if leaf == t_leaf:
-                    index = i
-                    break
+            index = self.index(leaf)
 
-        if index is None:
-            raise LeafNotInTree(f"{leaf} is not a part of the Merkle Tree.")
+        return self.proofs([leaf], [index])[0]
 
-        proof = []
-        levels = copy.deepcopy(self.tree[:0:-1])
-        for level in levels:
-            if (len(level) % 2) == 1:
-                level.append(level[-1])
+    def proofs(
+        self, leaves: list[HexStr], indexes: list[int] | None = None
+    ) -> list[list[HexStr]]:
+        if indexes is None:
+            indexes = [self.index(leaf) for leaf in leaves]
 
-            if (index % 2) == 1:
-                proof.append(level[index - 1])
-            else:
-                proof.append(level[index + 1])
+        levels = self.tree[:0:-1]
+        return _batch_proofs(
+            indexes,
+            len(levels),
+            lambda height, index: _sibling(levels[height], index),
+        )
 
-            index //= 2
+    def verify(self, proof: list[HexStr], leaf: HexStr) -> bool:
+        index = None if self.sort_pairs else self.index(leaf)
 
-        return proof
+        hash = leaf
+        for p in proof:
+            if hash != p:
+                if self.sort_pairs:
+                    hash = self.hash_function("0x" + "".join(sorted([hash[2:], p[2:]])))
+                else:
+                    hash = self.hash_function(
+                        hash + p[2:] if index % 2 == 0 else p + hash[2:]
+                    )
 
-    def verify(self, proof: list[HexStr], leaf: HexStr) -> bool:
-        if self.sort_pairs:
-            hash = leaf
-            for p in proof:
-                if hash == p:
-                    continue
+            if index is not None:
+                index //= 2
 
-                hash = self.hash_function("".join(sorted([hash, p])))
+        return hash == self.root
 
-        else:
-            for i, t_leaf in enumerate(self.leaves):
-                if leaf == t_leaf:
-                    index = i
-                    break
+    def multiproof(
+        self, leaves: list[HexStr], indexes: list[int] | None = None
+    ) -> Multiproof:
+        if not self.sort_pairs:
+            raise ValueError("Multiproofs require a tree with sorted pairs.")
 
-            if index is None:
-                raise LeafNotInTree(f"{leaf} is not a part of the Merkle Tree.")
+        if indexes is None:
+            indexes = [self.index(leaf) for leaf in leaves]
 
-            hash = leaf
-            for p in proof:
-                if hash == p:
-                    continue
+        levels = self.tree[::-1]
+        indexes, proof, steps = _build_multiproof(
+            indexes,
+            [len(level) for level in levels],
+            lambda height, index: levels[height][index],
+        )
 
-                is_left = (index % 2) == 0
-                hash = self.hash_function("".join([hash, p] if is_left else [p, hash]))
-                index //= 2
+        return Multiproof([self.leaves[i] for i in indexes], proof, steps)
 
-        return hash == self.root
+    def verify_multiproof(self, multiproof: Multiproof | dict) -> bool:
+        if isinstance(multiproof, dict):
+            multiproof = Multiproof.from_openzeppelin(multiproof)
+
+        return self.root == _process_multiproof(
+            multiproof.leaves,
+            multiproof.proof,
+            multiproof.steps,
+            lambda a, b: self.hash_function("0x" + "".join(sorted([a[2:], b[2:]]))),
+        )
+
+    def index(self, leaf: HexStr) -> int:
+        if self._leaf_indexes is None:
+            self._leaf_indexes = {}
+            for i, t_leaf in enumerate(self.leaves):
+                self._leaf_indexes.setdefault(t_leaf, i)
+
+        if (index := self._leaf_indexes.get(leaf)) is None:
+            raise LeafNotInTree(f"{leaf} is not a part of the Merkle Tree.")
+
+        return index
 
     def _process_leaves(self, leaves: list[str | HexStr]) -> list[HexStr]:
         if self.sort_leaves:
@@ -171,3 +239,494 @@ class MerkleTree:
             return hash_function
         else:
             raise ValueError()
+
+
+class BytesMerkleTree:
+    def __init__(
+        self,
+        leaves: list[bytes | HexStr] | bytes,
+        sort_leaves: bool = False,
+        sort_pairs: bool = False,
+        parallel: bool = False,
+        max_workers: int | None = None,
+    ):
+        self.sort_leaves = sort_leaves
+        self.sort_pairs = sort_pairs
+        self.parallel = parallel
+        self.max_workers = max_workers
+        self.levels = self.build_tree(self._process_leaves(leaves))
+
+        self._leaf_indexes: dict[bytes, int] | None = None
+
+    @property
+    def root(self) -> HexStr:
+        return "0x" + self.levels[-1].hex()
+
+    @property
+    def leaves(self) -> list[HexStr]:
+        return _to_hex_list(self.levels[0])
+
+    @property
+    def tree(self) -> list[list[HexStr]]:
+        return [_to_hex_list(level) for level in reversed(self.levels)]
+
+    def __len__(self) -> int:
+        return len(self.levels[0]) // 32
+
+    def build_tree(self, leaves: bytes) -> list[bytes]:
+        if self.parallel and len(leaves) // 32 >= DEFAULT_MERKLE_PARALLEL_THRESHOLD:
+            return _build_tree_parallel(leaves, self.sort_pairs, self.max_workers)
+
+        return _build_tree(leaves, self.sort_pairs)
+
+    def proof(self, leaf: HexStr | bytes, index: int | None = None) -> list[HexStr]:
+        if index is None:
+            index = self.index(leaf)
+
+        return self.proofs([leaf], [index])[0]
+
+    def proofs(
+        self, leaves: list[HexStr | bytes], indexes: list[int] | None = None
+    ) -> list[list[HexStr]]:
+        if indexes is None:
+            indexes = [self.index(leaf) for leaf in leaves]
+
+        return _batch_proofs(
+            indexes,
+            len(self.levels) - 1,
+            lambda height, index: "0x" + self.node(height, index ^ 1).hex(),
+        )
+
+    def node(self, height: int, index: int) -> bytes:
+        level = self.levels[height]
+        if index * 32 >= len(level):
+            index -= 1
+
+        return level[index * 32 : index * 32 + 32]
+
+    def verify(self, proof: list[HexStr], leaf: HexStr | bytes) -> bool:
+        node = _to_bytes(leaf)
+        index = None if self.sort_pairs else self.index(node)
+
+        for p in map(_to_bytes, proof):
+            if node != p:
+                if self.sort_pairs:
+                    node = keccak256(min(node, p) + max(node, p))
+                else:
+                    node = keccak256(node + p if index % 2 == 0 else p + node)
+
+            if index is not None:
+                index //= 2
+
+        return node == self.levels[-1]
+
+    def multiproof(
+        self, leaves: list[HexStr | bytes], indexes: list[int] | None = None
+    ) -> Multiproof:
+        if not self.sort_pairs:
+            raise ValueError("Multiproofs require a tree with sorted pairs.")
+
+        if indexes is None:
+            indexes = [self.index(leaf) for leaf in leaves]
+
+        indexes, proof, steps = _build_multiproof(
+            indexes,
+            [len(level) // 32 for level in self.levels],
+            self.node,
+        )
+
+        return Multiproof(
+            ["0x" + self.node(0, i).hex() for i in indexes],
+            ["0x" + node.hex() for node in proof],
+            steps,
+        )
+
+    def verify_multiproof(self, multiproof: Multiproof | dict) -> bool:
+        if isinstance(multiproof, dict):
+            multiproof = Multiproof.from_openzeppelin(multiproof)
+
+        return self.levels[-1] == _process_multiproof(
+            list(map(_to_bytes, multiproof.leaves)),
+            list(map(_to_bytes, multiproof.proof)),
+            multiproof.steps,
+            lambda a, b: keccak256(min(a, b) + max(a, b)),
+        )
+
+    def index(self, leaf: HexStr | bytes) -> int:
+        if self._leaf_indexes is None:
+            self._leaf_indexes = {}
+            for i, t_leaf in enumerate(_split(self.levels[0])):
+                self._leaf_indexes.setdefault(t_leaf, i)
+
+        leaf = _to_bytes(leaf)
+        if (index := self._leaf_indexes.get(leaf)) is None:
+            raise LeafNotInTree(f"0x{leaf.hex()} is not a part of the Merkle Tree.")
+
+        return index
+
+    def _process_leaves(self, leaves: list[bytes | HexStr] | bytes) -> bytes:
+        if not isinstance(leaves, (bytes, bytearray, memoryview)):
+            leaves = [_to_bytes(leaf) for leaf in leaves]
+            if self.sort_leaves:
+                leaves.sort()
+            leaves = b"".join(leaves)
+        elif self.sort_leaves:
+            leaves = b"".join(sorted(_split(leaves)))
+
+        if not leaves or len(leaves) % 32:
+            raise ValueError("Leaves must be a non-empty sequence of 32-byte hashes.")
+
+        return bytes(leaves)
+
+
+def hash_level(level: bytes, sort_pairs: bool = False) -> bytes:
+    hashes = []
+    end = len(level) - 32
+    for i in range(0, end, 64):
+        pair = level[i : i + 64]
+        if sort_pairs and pair[32:] < pair[:32]:
+            pair = pair[32:] + pair[:32]
+        hashes.append(keccak256(pair))
+
+    if len(level) % 64:
+        hashes.append(level[end:])
+
+    return b"".join(hashes)
+
+
+def calculate_merkle_root(
+    assertion: list[str],
+    sort: bool = True,
+    parallel: bool = False,
+    max_workers: int | None = None,
+) -> HexStr:
+    if sort:
+        assertion.sort()
+
+    if parallel and len(assertion) >= DEFAULT_MERKLE_PARALLEL_THRESHOLD:
+        leaves = _hash_leaves_parallel(assertion, max_workers)
+    else:
+        leaves = b"".join(hash_leaves(assertion))
+
+    return BytesMerkleTree(
+        leaves, sort_pairs=True, parallel=parallel, max_workers=max_workers
+    ).root
+
+
+def _build_tree(leaves: bytes, sort_pairs: bool) -> list[bytes]:
+    levels = [leaves]
+    while len(level := levels[-1]) > 32:
+        levels.append(hash_level(level, sort_pairs))
+
+    return levels
+
+
+def _build_tree_parallel(
+    leaves: bytes, sort_pairs: bool, max_workers: int | None = None
+) -> list[bytes]:
+    # Subtrees over aligned power-of-two chunks are independent, and their
+    # levels concatenate into the levels of the whole tree up to the chunk
+    # height. A chunk that runs out of levels earlier carries its root up.
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = 1 << (-(-len(leaves) // 32 // max_workers) - 1).bit_length()
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        subtrees = list(
+            executor.map(
+                _build_tree,
+                _chunks(leaves, chunk_size * 32),
+                repeat(sort_pairs),
+            )
+        )
+
+    height = max(map(len, subtrees))
+    levels = [
+        b"".join(subtree[min(i, len(subtree) - 1)] for subtree in subtrees)
+        for i in range(height)
+    ]
+
+    subtree_roots = levels.pop()
+    return levels + _build_tree(subtree_roots, sort_pairs)
+
+
+def _hash_leaves_parallel(leaves: list[str], max_workers: int | None = None) -> bytes:
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = -(-len(leaves) // max_workers)
+
+    with ProcessPoolExecutor(max_workers) as executor:
+        return b"".join(
+            executor.map(
+                _hash_leaves_chunk,
+                _chunks(leaves, chunk_size),
+                range(0, len(leaves), chunk_size),
+            )
+        )
+
+
+def _hash_leaves_chunk(leaves: list[str], offset: int) -> bytes:
+    return b"".join(hash_leaves(leaves, offset))
+
+
+def _chunks(data: bytes | list, size: int) -> list[bytes | list]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def _sibling(level: list[HexStr], index: int) -> HexStr:
+    # The last node of an odd level is its own sibling, as it's carried up.
+    return level[index ^ 1] if (index ^ 1) < len(level) else level[index]
+
+
+def _batch_proofs(
+    indexes: list[int], height: int, sibling: Callable[[int, int], HexStr]
+) -> list[list[HexStr]]:
+    # Proofs of leaves under the same node share the path above it, so each
+    # node's path is only resolved once.
+    paths: dict[tuple[int, int], tuple[HexStr, ...]] = {}
+
+    def path(level: int, index: int) -> tuple[HexStr, ...]:
+        if level == height:
+            return ()
+
+        if (key := (level, index)) not in paths:
+            paths[key] = (sibling(level, index),) + path(level + 1, index // 2)
+
+        return paths[key]
+
+    return [list(path(0, index)) for index in indexes]
+
+
+def _build_multiproof(
+    indexes: list[int],
+    level_sizes: list[int],
+    node: Callable[[int, int], HexStr | bytes],
+) -> tuple[list[int], list[HexStr | bytes], list[MultiproofStep]]:
+    # OpenZeppelin's multiproof layout: nodes are consumed from a single queue
+    # (leaves, then computed hashes) in descending index order per level, see
+    # Multiproof for the CARRY step it lacks.
+    indexes = sorted(set(indexes), reverse=True)
+    proof, steps = [], []
+
+    level = indexes
+    for height, size in enumerate(level_sizes[:-1]):
+        next_level = []
+        i = 0
+        while i < len(level):
+            index = level[i]
+            if index == size - 1 and size % 2:
+                if len(level) > 1:
+                    steps.append(MultiproofStep.CARRY)
+            elif i + 1 < len(level) and level[i + 1] == index ^ 1:
+                steps.append(MultiproofStep.QUEUE)
+                i += 1
+            else:
+                steps.append(MultiproofStep.PROOF)
+                proof.append(node(height, index ^ 1))
+
+            next_level.append(index // 2)
+            i += 1
+
+        level = next_level
+
+    return indexes, proof, steps
+
+
+def _process_multiproof(
+    leaves: list[HexStr | bytes],
+    proof: list[HexStr | bytes],
+    steps: list[MultiproofStep],
+    hash_pair: Callable[[HexStr | bytes, HexStr | bytes], HexStr | bytes],
+) -> HexStr | bytes | None:
+    hashes_count = sum(step is not MultiproofStep.CARRY for step in steps)
+    if not leaves or len(leaves) + len(proof) != hashes_count + 1:
+        return None
+
+    queue = deque(leaves)
+    proof = deque(proof)
+    for step in steps:
+        if (
+            not queue
+            or (step is MultiproofStep.QUEUE and len(queue) < 2)
+            or (step is MultiproofStep.PROOF and not proof)
+        ):
+            return None
+
+        node = queue.popleft()
+        if step is MultiproofStep.CARRY:
+            queue.append(node)
+        elif step is MultiproofStep.QUEUE:
+            queue.append(hash_pair(node, queue.popleft()))
+        else:
+            queue.append(hash_pair(node, proof.popleft()))
+
+    return queue.pop() if len(queue) == 1 else None
+
+
+def _to_bytes(data: HexStr | bytes) -> bytes:
+    if isinstance(data, str):
+        return bytes.fromhex(data[2:] if data.startswith("0x") else data)
+
+    return bytes(data)
+
+
+def _to_hex_list(level: bytes) -> list[HexStr]:
+    return ["0x" + node.hex() for node in _split(level)]
+
+
+def _split(level: bytes) -> list[bytes]:
+    return [level[i : i + 32] for i in range(0, len(level), 32)]
+
+
+class IncrementalMerkleTree:
+    def __init__(self, assertion: list[str], sort_pairs: bool = True):
+        self.sort_pairs = sort_pairs
+        self.quads: list[str] = []
+        self.levels: list[bytearray] = []
+
+        self._counts: Counter[str] = Counter()
+        self._quad_hashes: dict[str, bytes] = {}
+        self.update(added=assertion)
+
+    @property
+    def root(self) -> HexStr:
+        return "0x" + self.levels[-1].hex()
+
+    def __len__(self) -> int:
+        return len(self.quads)
+
+    def replace(self, assertion: list[str]) -> HexStr:
+        new_counts = Counter(assertion)
+        return self.update(
+            added=(new_counts - self._counts).elements(),
+            removed=(self._counts - new_counts).elements(),
+        )
+
+    def update(self, added: Iterable[str] = (), removed: Iterable[str] = ()) -> HexStr:
+        # Quads are a multiset: each removed quad drops a single occurrence.
+        added, removed = Counter(added), Counter(removed) & self._counts
+        counts = self._counts - removed + added
+        if not counts:
+            raise ValueError("Merkle tree can't be empty.")
+
+        quads = []
+        for quad in self.quads:
+            if removed[quad]:
+                removed[quad] -= 1
+            else:
+                quads.append(quad)
+        quads = sorted(quads + list(added.elements()))
+
+        for quad in self._counts - counts:
+            if quad not in counts:
+                self._quad_hashes.pop(quad, None)
+        self._counts = counts
+
+        # Leaves are position-indexed, so every position holding a different
+        # quad than before is rehashed, along with the paths above it.
+        dirty = [
+            i
+            for i, quad in enumerate(quads)
+            if i >= len(self.quads) or self.quads[i] != quad
+        ]
+        self.quads = quads
+
+        buffer = bytearray(64)
+        leaves = self._resize(0, len(quads), dirty)
+        for i in dirty:
+            quad_hash = self._quad_hashes.get(quads[i])
+            if quad_hash is None:
+                quad_hash = self._quad_hashes[quads[i]] = keccak256(quads[i].encode())
+            buffer[:32] = quad_hash
+            buffer[32:] = i.to_bytes(32, "big")
+            leaves[i * 32 : i * 32 + 32] = keccak256(buffer)
+
+        height = 0
+        while len(level := self.levels[height]) > 32:
+            dirty = sorted({i // 2 for i in dirty})
+            parents = self._resize(height + 1, -(-len(level) // 64), dirty)
+            for i in dirty:
+                pair = level[i * 64 : i * 64 + 64]
+                if len(pair) == 64:
+                    if self.sort_pairs and pair[32:] < pair[:32]:
+                        pair = pair[32:] + pair[:32]
+                    pair = keccak256(pair)
+                parents[i * 32 : i * 32 + 32] = pair
+            height += 1
+
+        del self.levels[height + 1 :]
+        return self.root
+
+    def _resize(self, height: int, size: int, dirty: list[int]) -> bytearray:
+        if height == len(self.levels):
+            self.levels.append(bytearray())
+
+        level = self.levels[height]
+        previous_size = len(level) // 32
+        if size != previous_size:
+            # The last node may switch between a hashed pair and a carried node.
+            dirty.extend(range(min(size, previous_size) - 1, size))
+            dirty[:] = sorted(set(i for i in dirty if 0 <= i < size))
+            level[size * 32 :] = b""
+            level.extend(bytes(max(size - previous_size, 0) * 32))
+
+        return level
+
+
+class StreamingMerkleRoot:
+    def __init__(self, sort_pairs: bool = True):
+        self.sort_pairs = sort_pairs
+        self.count = 0
+
+        # Roots of the perfect subtrees seen so far, with strictly decreasing
+        # heights, like the set bits of the leaf count.
+        self._stack: list[tuple[int, bytes]] = []
+        self._last_quad: str | None = None
+        self._buffer = bytearray(64)
+
+    @property
+    def root(self) -> HexStr:
+        if not self._stack:
+            raise ValueError("Merkle tree can't be empty.")
+
+        # A tree with carried odd nodes is the perfect subtree over the largest
+        # power of two on the left and the tree over the remaining leaves.
+        root = self._stack[-1][1]
+        for _, node in reversed(self._stack[:-1]):
+            root = self._hash_pair(node, root)
+
+        return "0x" + root.hex()
+
+    def add_leaf(self, leaf: HexStr | bytes) -> None:
+        node, height = _to_bytes(leaf), 0
+        while self._stack and self._stack[-1][0] == height:
+            node = self._hash_pair(self._stack.pop()[1], node)
+            height += 1
+
+        self._stack.append((height, node))
+        self.count += 1
+
+    def add_leaves(self, leaves: Iterable[HexStr | bytes]) -> HexStr:
+        for leaf in leaves:
+            self.add_leaf(leaf)
+
+        return self.root
+
+    def add_quad(self, quad: str) -> None:
+        if self._last_quad is not None and quad < self._last_quad:
+            raise ValueError("Quads must be added in sorted order.")
+        self._last_quad = quad
+
+        self._buffer[:32] = keccak256(quad.encode())
+        self._buffer[32:] = self.count.to_bytes(32, "big")
+        self.add_leaf(keccak256(self._buffer))
+
+    def add_quads(self, quads: Iterable[str]) -> HexStr:
+        for quad in quads:
+            self.add_quad(quad)
+
+        return self.root
+
+    def _hash_pair(self, left: bytes, right: bytes) -> bytes:
+        if self.sort_pairs and right < left:
+            left, right = right, left
+
+        return keccak256(left + right)
@@ -0,0 +1,151 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import heapq
+import threading
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+NONCE_ERRORS = (
+    "nonce too low",
+    "nonce too high",
+    "invalid nonce",
+    "invalid transaction nonce",
+    "replacement transaction underpriced",
+    "already known",
+)
+
+
+def is_nonce_error(err: Exception) -> bool:
+    message = str(err).lower()
+    return any(nonce_error in message for nonce_error in NONCE_ERRORS)
+
+
+class BaseNonceManager:
+    def __init__(self, retries: int = 1):
+        self.retries = retries
+
+        self._lock = threading.Lock()
+        self._next_nonce: int | None = None
+        self._released: list[int] = []
+
+    @property
+    def is_synced(self) -> bool:
+        return self._next_nonce is not None
+
+    def release(self, nonce: int) -> None:
+        with self._lock:
+            if self._next_nonce is None or nonce >= self._next_nonce:
+                return
+
+            if nonce in self._released:
+                return
+
+            heapq.heappush(self._released, nonce)
+            # Nonces released from the top are given back to the counter, so
+            # that no gap is left behind when nothing else is in flight.
+            while self._next_nonce - 1 in self._released:
+                self._next_nonce -= 1
+                self._released.remove(self._next_nonce)
+            heapq.heapify(self._released)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._next_nonce = None
+            self._released.clear()
+
+    def _sync(self, transaction_count: int) -> None:
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = transaction_count
+
+    def _take(self) -> int:
+        with self._lock:
+            if self._released:
+                return heapq.heappop(self._released)
+
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+
+class NonceManager(BaseNonceManager):
+    def __init__(self, get_transaction_count: Callable[[], int], retries: int = 1):
+        super().__init__(retries)
+        self.get_transaction_count = get_transaction_count
+
+        self._sync_lock = threading.Lock()
+
+    def acquire(self) -> int:
+        if not self.is_synced:
+            with self._sync_lock:
+                if not self.is_synced:
+                    self._sync(self.get_transaction_count())
+
+        return self._take()
+
+    def send(self, send_transaction: Callable[[int], T]) -> T:
+        for attempt in range(self.retries + 1):
+            nonce = self.acquire()
+            try:
+                return send_transaction(nonce)
+            except Exception as err:
+                if not is_nonce_error(err):
+                    self.release(nonce)
+                    raise
+
+                self.reset()
+                if attempt == self.retries:
+                    raise
+
+
+class AsyncNonceManager(BaseNonceManager):
+    def __init__(
+        self, get_transaction_count: Callable[[], Awaitable[int]], retries: int = 1
+    ):
+        super().__init__(retries)
+        self.get_transaction_count = get_transaction_count
+
+        self._sync_lock: asyncio.Lock | None = None
+
+    async def acquire(self) -> int:
+        if not self.is_synced:
+            if self._sync_lock is None:
+                self._sync_lock = asyncio.Lock()
+
+            async with self._sync_lock:
+                if not self.is_synced:
+                    self._sync(await self.get_transaction_count())
+
+        return self._take()
+
+    async def send(self, send_transaction: Callable[[int], Awaitable[T]]) -> T:
+        for attempt in range(self.retries + 1):
+            nonce = await self.acquire()
+            try:
+                return await send_transaction(nonce)
+            except Exception as err:
+                if not is_nonce_error(err):
+                    self.release(nonce)
+                    raise
+
+                self.reset()
+                if attempt == self.retries:
+                    raise
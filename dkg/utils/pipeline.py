@@ -0,0 +1,113 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Iterable, Sequence
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: Callable[[Any], Any]
+    concurrency: int = 1
+
+
+class BasePipeline:
+    def __init__(self, stages: Sequence[Stage], max_pending: int | None = None):
+        self.stages = stages
+        self.max_pending = max_pending or 2 * sum(stage.concurrency for stage in stages)
+
+
+class Pipeline(BasePipeline):
+    def run(self, items: Iterable[Any]) -> list[Any | Exception]:
+        results: list[Any | Exception] = []
+        pending = threading.Semaphore(self.max_pending)
+        executors = [
+            ThreadPoolExecutor(
+                max_workers=stage.concurrency, thread_name_prefix=f"dkg-{stage.name}"
+            )
+            for stage in self.stages
+        ]
+
+        def advance(index: int, stage_index: int, value: Any) -> None:
+            if stage_index == len(self.stages):
+                results[index] = value
+                pending.release()
+                return
+
+            future = executors[stage_index].submit(self.stages[stage_index].fn, value)
+            future.add_done_callback(partial(on_done, index, stage_index))
+
+        def on_done(index: int, stage_index: int, future: Future) -> None:
+            try:
+                value = future.result()
+            except Exception as err:
+                results[index] = err
+                pending.release()
+            else:
+                advance(index, stage_index + 1, value)
+
+        try:
+            for index, item in enumerate(items):
+                pending.acquire()
+                results.append(None)
+                advance(index, 0, item)
+        finally:
+            # In-flight items are handed to the next stage from done
+            # callbacks, so they are drained before the executors are shut
+            # down, also when iterating the items raised.
+            for _ in range(self.max_pending):
+                pending.acquire()
+
+            for executor in executors:
+                executor.shutdown()
+
+        return results
+
+
+class AsyncPipeline(BasePipeline):
+    async def run(self, items: Iterable[Any]) -> list[Any | Exception]:
+        semaphores = [asyncio.Semaphore(stage.concurrency) for stage in self.stages]
+        pending = asyncio.Semaphore(self.max_pending)
+
+        async def process(item: Any) -> Any | Exception:
+            try:
+                value = item
+                for stage, semaphore in zip(self.stages, semaphores):
+                    async with semaphore:
+                        value = await stage.fn(value)
+                return value
+            except Exception as err:
+                return err
+            finally:
+                pending.release()
+
+        tasks = []
+        try:
+            for item in items:
+                await pending.acquire()
+                tasks.append(asyncio.create_task(process(item)))
+        except BaseException:
+            await asyncio.gather(*tasks)
+            raise
+
+        return await asyncio.gather(*tasks)
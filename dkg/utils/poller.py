@@ -0,0 +1,303 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from dkg.dataclasses import NodeResponseDict
+from dkg.exceptions import OperationNotFinished, OperationTimeout
+from dkg.utils.node_request import validate_operation_status
+
+
+@dataclass
+class PollingSchedule:
+    initial_delay: float = 0.25
+    min_interval: float = 0.5
+    max_interval: float = 8.0
+    backoff: float = 2.0
+    jitter: float = 0.1
+    timeout: float = 60.0
+    smoothing: float = 0.2
+
+    def first_delay(self, expected_latency: float | None) -> float:
+        if expected_latency is None:
+            return self.initial_delay
+        return self._jittered(min(expected_latency / 2, self.max_interval))
+
+    def next_interval(self, interval: float | None) -> float:
+        if interval is None:
+            return self.min_interval
+        return min(interval * self.backoff, self.max_interval)
+
+    def delay(self, interval: float) -> float:
+        return self._jittered(interval)
+
+    def _jittered(self, delay: float) -> float:
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+class _LatencyEstimator:
+    def __init__(self, smoothing: float):
+        self.smoothing = smoothing
+        self._latencies: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def get(self, operation: str) -> float | None:
+        return self._latencies.get(operation)
+
+    def observe(self, operation: str, latency: float) -> None:
+        with self._lock:
+            if (previous := self._latencies.get(operation)) is None:
+                self._latencies[operation] = latency
+            else:
+                self._latencies[operation] = (
+                    self.smoothing * latency + (1 - self.smoothing) * previous
+                )
+
+
+@dataclass(eq=False)
+class _PolledOperation:
+    operation_id: str
+    operation: str
+    started_at: float
+    deadline: float
+    future: Future
+    interval: float | None = None
+
+
+class OperationPoller:
+    def __init__(
+        self,
+        fetch: Callable[[str, str], NodeResponseDict],
+        schedule: PollingSchedule | None = None,
+        max_workers: int = 8,
+    ):
+        self.fetch = fetch
+        self.schedule = schedule or PollingSchedule()
+        self.max_workers = max_workers
+
+        self._latencies = _LatencyEstimator(self.schedule.smoothing)
+        self._queue: list[tuple[float, int, _PolledOperation]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._executor: ThreadPoolExecutor | None = None
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def submit(
+        self,
+        operation_id: str,
+        operation: str,
+        callback: Callable[[Future], Any] | None = None,
+    ) -> Future:
+        future = Future()
+        if callback is not None:
+            future.add_done_callback(callback)
+
+        now = time.monotonic()
+        polled_operation = _PolledOperation(
+            operation_id, operation, now, now + self.schedule.timeout, future
+        )
+        first_delay = self.schedule.first_delay(self._latencies.get(operation))
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Operation poller is closed.")
+
+            self._start()
+            self._schedule(polled_operation, now + first_delay)
+
+        return future
+
+    def close(self, wait: bool = True) -> None:
+        with self._condition:
+            self._closed = True
+            pending, self._queue = self._queue, []
+            self._condition.notify_all()
+
+        for _, _, polled_operation in pending:
+            polled_operation.future.cancel()
+
+        if self._thread is not None:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+
+    def __enter__(self) -> "OperationPoller":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="dkg-poller"
+        )
+        self._thread = threading.Thread(
+            target=self._run, name="dkg-poller-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def _schedule(self, polled_operation: _PolledOperation, due: float) -> None:
+        heapq.heappush(self._queue, (due, next(self._sequence), polled_operation))
+        self._condition.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and (
+                    not self._queue or self._queue[0][0] > time.monotonic()
+                ):
+                    self._condition.wait(
+                        self._queue[0][0] - time.monotonic() if self._queue else None
+                    )
+
+                if self._closed:
+                    return
+
+                _, _, polled_operation = heapq.heappop(self._queue)
+
+            self._executor.submit(self._poll, polled_operation)
+
+    def _poll(self, polled_operation: _PolledOperation) -> None:
+        future = polled_operation.future
+        if future.cancelled():
+            return
+
+        try:
+            operation_result = self.fetch(
+                polled_operation.operation, polled_operation.operation_id
+            )
+            validate_operation_status(operation_result)
+        except OperationNotFinished:
+            now = time.monotonic()
+            if now >= polled_operation.deadline:
+                return _set_exception(
+                    future,
+                    _timeout_error(
+                        polled_operation.operation,
+                        polled_operation.operation_id,
+                        self.schedule.timeout,
+                    ),
+                )
+
+            polled_operation.interval = self.schedule.next_interval(
+                polled_operation.interval
+            )
+            due = min(
+                now + self.schedule.delay(polled_operation.interval),
+                polled_operation.deadline,
+            )
+            with self._condition:
+                if not self._closed:
+                    return self._schedule(polled_operation, due)
+            future.cancel()
+        except Exception as err:
+            _set_exception(future, err)
+        else:
+            self._latencies.observe(
+                polled_operation.operation,
+                time.monotonic() - polled_operation.started_at,
+            )
+            _set_result(future, operation_result)
+
+
+class AsyncOperationPoller:
+    def __init__(
+        self,
+        fetch: Callable[[str, str], Awaitable[NodeResponseDict]],
+        schedule: PollingSchedule | None = None,
+        max_concurrency: int = 32,
+    ):
+        self.fetch = fetch
+        self.schedule = schedule or PollingSchedule()
+        self.max_concurrency = max_concurrency
+
+        self._latencies = _LatencyEstimator(self.schedule.smoothing)
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def submit(
+        self,
+        operation_id: str,
+        operation: str,
+        callback: Callable[[asyncio.Future], Any] | None = None,
+    ) -> asyncio.Task:
+        task = asyncio.ensure_future(self.poll(operation_id, operation))
+        if callback is not None:
+            task.add_done_callback(callback)
+        return task
+
+    async def poll(self, operation_id: str, operation: str) -> NodeResponseDict:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        deadline = started_at + self.schedule.timeout
+
+        interval = None
+        delay = self.schedule.first_delay(self._latencies.get(operation))
+        while True:
+            await asyncio.sleep(delay)
+
+            async with self._semaphore:
+                operation_result = await self.fetch(operation, operation_id)
+
+            try:
+                validate_operation_status(operation_result)
+            except OperationNotFinished:
+                if (now := loop.time()) >= deadline:
+                    raise _timeout_error(operation, operation_id, self.schedule.timeout)
+
+                interval = self.schedule.next_interval(interval)
+                delay = min(self.schedule.delay(interval), deadline - now)
+            else:
+                self._latencies.observe(operation, loop.time() - started_at)
+                return operation_result
+
+
+def _timeout_error(
+    operation: str, operation_id: str, timeout: float
+) -> OperationTimeout:
+    return OperationTimeout(
+        f"Operation {operation} {operation_id} didn't finish in {timeout}s."
+    )
+
+
+def _set_result(future: Future, result: Any) -> None:
+    try:
+        future.set_result(result)
+    except InvalidStateError:
+        pass
+
+
+def _set_exception(future: Future, exception: BaseException) -> None:
+    try:
+        future.set_exception(exception)
+    except InvalidStateError:
+        pass
@@ -20,8 +20,7 @@ from typing import Literal
 from dkg.constants import PRIVATE_ASSERTION_PREDICATE
 from dkg.exceptions import DatasetInputFormatNotSupported, InvalidDataset
 from dkg.types import JSONLD, HexStr, NQuads
-from dkg.utils.merkle import MerkleTree, hash_assertion_with_indexes
-from pyld import jsonld
+from dkg.utils.merkle import calculate_merkle_root
 
 
 def normalize_dataset(
@@ -44,6 +43,8 @@ def normalize_dataset(
                 "Supported formats: JSON-LD / N-Quads."
             )
 
+    from pyld import jsonld
+
     n_quads = jsonld.normalize(dataset, normalization_options)
     assertion = [quad for quad in n_quads.split("\n") if quad]
 
@@ -64,10 +65,7 @@ def format_content(
 
     if content.get("private", None):
         private_assertion = normalize_dataset(content["private"], type)
-        private_assertion_id = MerkleTree(
-            hash_assertion_with_indexes(private_assertion),
-            sort_pairs=True,
-        ).root
+        private_assertion_id = calculate_merkle_root(private_assertion)
 
         public_graph["@graph"].append(
             {PRIVATE_ASSERTION_PREDICATE: private_assertion_id}
@@ -77,7 +75,5 @@ def format_content(
 
     return {
         "public": public_assertion,
-        "private": private_assertion
-        if content.get("private", None)
-        else {},
+        "private": private_assertion if content.get("private", None) else {},
     }
@@ -0,0 +1,332 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+
+#   http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Generator
+
+from hexbytes import HexBytes
+from web3.exceptions import TimeExhausted
+from web3.types import TxReceipt
+
+ReceiptsBatch = tuple[int, list[TxReceipt | None]]
+
+
+@dataclass(eq=False)
+class TransactionHandle:
+    tx_hash: HexBytes
+    future: Future
+
+    @property
+    def done(self) -> bool:
+        return self.future.done()
+
+    def wait(self, timeout: float | None = None) -> TxReceipt:
+        return self.future.result(timeout)
+
+    def __await__(self) -> Generator[Any, None, TxReceipt]:
+        return asyncio.wrap_future(self.future).__await__()
+
+
+@dataclass(eq=False)
+class AsyncTransactionHandle:
+    tx_hash: HexBytes
+    future: asyncio.Future
+
+    @property
+    def done(self) -> bool:
+        return self.future.done()
+
+    async def wait(self) -> TxReceipt:
+        return await asyncio.shield(self.future)
+
+    def __await__(self) -> Generator[Any, None, TxReceipt]:
+        return self.wait().__await__()
+
+
+class BlockTimeEstimator:
+    def __init__(
+        self,
+        block_time: float | None = None,
+        smoothing: float = 0.3,
+        poll_fraction: float = 0.5,
+        min_interval: float = 0.1,
+        max_interval: float = 10.0,
+        backoff: float = 2.0,
+    ):
+        self.block_time = block_time
+        self.smoothing = smoothing
+        self.poll_fraction = poll_fraction
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+        self._last_block: tuple[int, float] | None = None
+        self._interval = min_interval
+
+    @property
+    def poll_interval(self) -> float:
+        # Until the block time is known, polling starts short and backs off.
+        if self.block_time is None:
+            return self._interval
+
+        return min(
+            max(self.block_time * self.poll_fraction, self.min_interval),
+            self.max_interval,
+        )
+
+    def polled(self) -> None:
+        self._interval = min(self._interval * self.backoff, self.max_interval)
+
+    def reset(self) -> None:
+        self._interval = self.min_interval
+
+    def observe(self, block_number: int, timestamp: float) -> None:
+        if self._last_block is not None:
+            last_block_number, last_timestamp = self._last_block
+            if block_number <= last_block_number:
+                return
+
+            block_time = (timestamp - last_timestamp) / (
+                block_number - last_block_number
+            )
+            self.block_time = (
+                block_time
+                if self.block_time is None
+                else self.smoothing * block_time
+                + (1 - self.smoothing) * self.block_time
+            )
+
+        self._last_block = (block_number, timestamp)
+
+
+class BaseReceiptCollector:
+    def __init__(
+        self,
+        timeout: float = 120.0,
+        batch_size: int = 100,
+        block_time: BlockTimeEstimator | None = None,
+    ):
+        self.timeout = timeout
+        self.batch_size = batch_size
+        self.block_time = block_time or BlockTimeEstimator()
+
+    def _batches(self, tx_hashes: list[HexBytes]) -> list[list[HexBytes]]:
+        return [
+            tx_hashes[i : i + self.batch_size]
+            for i in range(0, len(tx_hashes), self.batch_size)
+        ]
+
+    def _timeout_error(self, tx_hash: HexBytes) -> TimeExhausted:
+        return TimeExhausted(
+            f"Transaction {HexBytes(tx_hash).hex()} is not in the chain "
+            f"after {self.timeout} seconds"
+        )
+
+
+class ReceiptCollector(BaseReceiptCollector):
+    def __init__(
+        self,
+        get_receipts: Callable[[list[HexBytes]], ReceiptsBatch],
+        timeout: float = 120.0,
+        batch_size: int = 100,
+        block_time: BlockTimeEstimator | None = None,
+    ):
+        super().__init__(timeout, batch_size, block_time)
+        self.get_receipts = get_receipts
+
+        self._pending: dict[HexBytes, tuple[Future, float]] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def submit(self, tx_hash: HexBytes) -> TransactionHandle:
+        tx_hash = HexBytes(tx_hash)
+
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Receipt collector is closed.")
+
+            if tx_hash not in self._pending:
+                self._pending[tx_hash] = (Future(), time.monotonic() + self.timeout)
+                self._start()
+                if len(self._pending) == 1:
+                    self.block_time.reset()
+                    self._condition.notify()
+
+            return TransactionHandle(tx_hash, self._pending[tx_hash][0])
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            self._condition.notify_all()
+
+        for future, _ in pending.values():
+            future.cancel()
+
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ReceiptCollector":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="dkg-receipt-collector", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._closed and not self._pending:
+                    self._condition.wait()
+
+                self._condition.wait(self.block_time.poll_interval)
+                if self._closed:
+                    return
+
+                tx_hashes = list(self._pending.keys())
+
+            for batch in self._batches(tx_hashes):
+                self._collect(batch)
+            self.block_time.polled()
+
+    def _collect(self, tx_hashes: list[HexBytes]) -> None:
+        try:
+            block_number, receipts = self.get_receipts(tx_hashes)
+        except Exception:
+            receipts = [None] * len(tx_hashes)
+        else:
+            self.block_time.observe(block_number, time.monotonic())
+
+        now = time.monotonic()
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            with self._condition:
+                if (entry := self._pending.get(tx_hash)) is None:
+                    continue
+
+                future, deadline = entry
+                if receipt is None and now < deadline:
+                    continue
+                del self._pending[tx_hash]
+
+            try:
+                if receipt is not None:
+                    future.set_result(receipt)
+                else:
+                    future.set_exception(self._timeout_error(tx_hash))
+            except InvalidStateError:
+                pass
+
+
+class AsyncReceiptCollector(BaseReceiptCollector):
+    def __init__(
+        self,
+        get_receipts: Callable[[list[HexBytes]], Awaitable[ReceiptsBatch]],
+        timeout: float = 120.0,
+        batch_size: int = 100,
+        block_time: BlockTimeEstimator | None = None,
+    ):
+        super().__init__(timeout, batch_size, block_time)
+        self.get_receipts = get_receipts
+
+        self._pending: dict[HexBytes, tuple[asyncio.Future, float]] = {}
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def submit(self, tx_hash: HexBytes) -> AsyncTransactionHandle:
+        tx_hash = HexBytes(tx_hash)
+        loop = asyncio.get_running_loop()
+
+        if tx_hash not in self._pending:
+            if not self._pending:
+                self.block_time.reset()
+            self._pending[tx_hash] = (
+                loop.create_future(),
+                loop.time() + self.timeout,
+            )
+            self._start()
+
+        return AsyncTransactionHandle(tx_hash, self._pending[tx_hash][0])
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        pending, self._pending = self._pending, {}
+        for future, _ in pending.values():
+            future.cancel()
+
+    def _start(self) -> None:
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            await asyncio.sleep(self.block_time.poll_interval)
+
+            await asyncio.gather(
+                *(
+                    self._collect(batch)
+                    for batch in self._batches(list(self._pending.keys()))
+                )
+            )
+            self.block_time.polled()
+
+            if not self._pending:
+                self._wakeup.clear()
+
+    async def _collect(self, tx_hashes: list[HexBytes]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            block_number, receipts = await self.get_receipts(tx_hashes)
+        except Exception:
+            receipts = [None] * len(tx_hashes)
+        else:
+            self.block_time.observe(block_number, loop.time())
+
+        now = loop.time()
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            if (entry := self._pending.get(tx_hash)) is None:
+                continue
+
+            future, deadline = entry
+            if receipt is None and now < deadline:
+                continue
+            del self._pending[tx_hash]
+
+            if future.done():
+                continue
+            if receipt is not None:
+                future.set_result(receipt)
+            else:
+                future.set_exception(self._timeout_error(tx_hash))
@@ -17,7 +17,7 @@
 
 from dkg.exceptions import ValidationError
 from dkg.types import UAL, Address, ChecksumAddress
-from web3 import Web3
+from eth_utils import to_checksum_address
 
 
 def format_ual(
@@ -39,6 +39,6 @@ def parse_ual(ual: UAL) -> dict[str, str | Address | int]:
 
     return {
         "blockchain": blockchain,
-        "contract_address": Web3.to_checksum_address(contract_address),
+        "contract_address": to_checksum_address(contract_address),
         "token_id": int(token_id),
     }
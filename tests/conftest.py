@@ -0,0 +1,247 @@
+import json
+import threading
+from collections.abc import Mapping
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+from eth_abi import decode, encode
+from eth_account import Account
+from eth_utils import function_abi_to_4byte_selector, to_checksum_address
+from hexbytes import HexBytes
+from web3 import EthereumTesterProvider, Web3
+
+from dkg.constants import BLOCKCHAINS, MULTICALL3_ADDRESS
+from dkg.providers import AsyncBlockchainProvider, BlockchainProvider
+from dkg.utils.abi import abis
+
+BLOCKCHAIN_ID = "hardhat1:31337"
+HUB_ADDRESS = BLOCKCHAINS["development"][BLOCKCHAIN_ID]["hub"]
+PRIVATE_KEY = "0x" + "22" * 32
+ADDRESS = Account.from_key(PRIVATE_KEY).address
+GAS_PRICE = 10**9
+
+
+def _abi_types(params: list[dict[str, Any]]) -> list[str]:
+    types = []
+    for param in params:
+        if param["type"].startswith("tuple"):
+            components = ",".join(_abi_types(param["components"]))
+            types.append(f"({components}){param['type'][5:]}")
+        else:
+            types.append(param["type"])
+    return types
+
+
+def _to_rpc(value: Any) -> Any:
+    if isinstance(value, bool) or value is None:
+        return value
+    if isinstance(value, int):
+        return hex(value)
+    if isinstance(value, bytes):
+        return HexBytes(value).hex()
+    if isinstance(value, Mapping):
+        return {key: _to_rpc(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_rpc(item) for item in value]
+    return value
+
+
+class ChainStub:
+    """
+    JSON-RPC endpoint backed by eth-tester. Hub, Multicall3 and the other
+    contracts without deployed code are emulated from their ABIs, results of
+    emulated functions are read from `results` (values or callables).
+    """
+
+    def __init__(self):
+        self.w3 = Web3(EthereumTesterProvider())
+        self.multicall = True
+        self.results: dict[tuple[str, str], Any] = {("*", "status"): True}
+        self.calls: list[tuple[str, str, tuple]] = []
+
+        self.addresses = {
+            contract: to_checksum_address(f"0x{0x1000 + i:040x}")
+            for i, contract in enumerate(abis)
+            if contract not in ("Hub", "Multicall3")
+        }
+        self._emulated = {
+            HUB_ADDRESS: "Hub",
+            MULTICALL3_ADDRESS: "Multicall3",
+            **{address: contract for contract, address in self.addresses.items()},
+        }
+        self._functions = {
+            contract: {
+                function_abi_to_4byte_selector(item): item
+                for item in abi
+                if item["type"] == "function"
+            }
+            for contract, abi in abis.items()
+        }
+
+        self._request = self.w3.provider.request_func(self.w3, self.w3.middleware_onion)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_port}"
+
+    def start(self) -> "ChainStub":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def fund(self, address: str, value: int = 10**21) -> None:
+        self.w3.eth.send_transaction(
+            {"from": self.w3.eth.accounts[0], "to": address, "value": value}
+        )
+
+    def deploy(self, contract: str, runtime: bytes) -> str:
+        init = bytes.fromhex(
+            f"60{len(runtime):02x}600c60003960{len(runtime):02x}6000f3"
+        )
+        tx_hash = self.w3.eth.send_transaction(
+            {"from": self.w3.eth.accounts[0], "data": init + runtime}
+        )
+        address = self.w3.eth.wait_for_transaction_receipt(tx_hash)["contractAddress"]
+
+        self._emulated.pop(self.addresses[contract])
+        self.addresses[contract] = address
+        return address
+
+    def handle_rpc(self, method: str, params: list[Any]) -> Any:
+        if method in ("eth_call", "eth_getCode"):
+            address = params[0]["to"] if method == "eth_call" else params[0]
+            contract = self._emulated.get(to_checksum_address(address))
+            if contract is not None and method == "eth_getCode":
+                return "0x01" if contract != "Multicall3" or self.multicall else "0x"
+            elif contract is not None:
+                data = bytes.fromhex(params[0]["data"][2:])
+                try:
+                    return HexBytes(self._call(contract, data)).hex()
+                except Exception as err:
+                    raise ValueError(f"execution reverted: {err!r}") from err
+
+        with self._lock:
+            return _to_rpc(self._request(method, params)["result"])
+
+    def _call(self, contract: str, data: bytes) -> bytes:
+        function = self._functions[contract][data[:4]]
+        args = decode(_abi_types(function["inputs"]), data[4:])
+        self.calls.append((contract, function["name"], args))
+
+        if contract == "Multicall3":
+            result = []
+            for target, _, call_data in args[0]:
+                try:
+                    target = self._emulated[to_checksum_address(target)]
+                    result.append((True, self._call(target, call_data)))
+                except Exception:
+                    result.append((False, b""))
+        elif contract == "Hub":
+            result = self._hub_function(function["name"], *args)
+        else:
+            result = self.results.get(
+                (contract, function["name"]), self.results.get(("*", function["name"]))
+            )
+            if callable(result):
+                result = result(*args)
+            elif result is None:
+                raise KeyError((contract, function["name"]))
+
+        output_types = _abi_types(function["outputs"])
+        return encode(output_types, result if len(output_types) > 1 else [result])
+
+    def _hub_function(self, name: str, *args: Any) -> Any:
+        storages = {c for c in self.addresses if c.endswith("AssetStorage")}
+        match name:
+            case "getAllContracts":
+                return [(c, a) for c, a in self.addresses.items() if c not in storages]
+            case "getAllAssetStorages":
+                return [(c, a) for c, a in self.addresses.items() if c in storages]
+            case "isContract":
+                return args[0] in self.addresses and args[0] not in storages
+            case "isAssetStorage":
+                return args[0] in storages
+            case "getContractAddress" | "getAssetStorageAddress":
+                return self.addresses[args[0]]
+        raise KeyError(name)
+
+    def _handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        try:
+            result = self.handle_rpc(request["method"], request.get("params", []))
+            return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+        except Exception as err:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32000, "message": str(err)},
+            }
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args) -> None:
+                pass
+
+            def do_POST(self) -> None:
+                body = json.loads(
+                    self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                )
+                payload = (
+                    [stub._handle_request(request) for request in body]
+                    if isinstance(body, list)
+                    else stub._handle_request(body)
+                )
+
+                data = json.dumps(payload).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+@pytest.fixture
+def chain() -> ChainStub:
+    pytest.importorskip("eth_tester")
+
+    stub = ChainStub().start()
+    stub.fund(ADDRESS)
+    yield stub
+    stub.stop()
+
+
+@pytest.fixture
+def blockchain_provider(chain: ChainStub) -> BlockchainProvider:
+    provider = BlockchainProvider(
+        "development",
+        BLOCKCHAIN_ID,
+        rpc_uri=chain.url,
+        private_key=PRIVATE_KEY,
+        gas_price=GAS_PRICE,
+    )
+    yield provider
+    provider.close()
+
+
+@pytest.fixture
+def async_blockchain_provider(chain: ChainStub) -> AsyncBlockchainProvider:
+    # Closed by the tests, inside the event loop they run in.
+    return AsyncBlockchainProvider(
+        "development",
+        BLOCKCHAIN_ID,
+        rpc_uri=chain.url,
+        private_key=PRIVATE_KEY,
+        gas_price=GAS_PRICE,
+    )
@@ -0,0 +1,140 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import ClientSession
+
+from dkg.asset import (
+    _build_assertions_list,
+    _get_update_token_amount,
+    _resolve_state,
+)
+from dkg.exceptions import InvalidStateOption
+from dkg.main import AsyncDKG, DKG
+from dkg.providers import AsyncNodeHTTPProvider, NodeHTTPProvider
+from dkg.utils.node_request import StoreTypes
+
+ASSERTION_IDS = [b"\x01" * 32, b"\x02" * 32]
+FIRST_STATE = "0x" + "01" * 32
+LATEST_STATE = "0x" + "02" * 32
+CONTRACT = "0x" + "22" * 20
+
+
+def test_resolve_state_by_index_and_hash():
+    assert _resolve_state(0, ASSERTION_IDS) == (FIRST_STATE, False)
+    assert _resolve_state(1, ASSERTION_IDS) == (LATEST_STATE, True)
+    assert _resolve_state(FIRST_STATE, ASSERTION_IDS) == (FIRST_STATE, False)
+    assert _resolve_state(LATEST_STATE, ASSERTION_IDS) == (LATEST_STATE, True)
+
+
+@pytest.mark.parametrize("state", [2, -1, "0x" + "ab" * 32])
+def test_resolve_state_rejects_unknown_states(state):
+    with pytest.raises(InvalidStateOption):
+        _resolve_state(state, ASSERTION_IDS)
+
+
+@pytest.mark.parametrize("private", [True, False])
+def test_build_assertions_list(private):
+    asset = {
+        "assertions": {"public": ["<a> <b> <c> ."], "private": ["<a> <b> <d> ."]},
+        "public_assertion_id": FIRST_STATE,
+        "private_assertion_id": LATEST_STATE if private else None,
+    }
+
+    assertions = _build_assertions_list(
+        asset, "hardhat1:31337", CONTRACT, 1, StoreTypes.PENDING
+    )
+
+    assert [a["assertionId"] for a in assertions] == (
+        [FIRST_STATE, LATEST_STATE] if private else [FIRST_STATE]
+    )
+    assert assertions[0]["assertion"] == asset["assertions"]["public"]
+    assert all(a["storeType"] == StoreTypes.PENDING for a in assertions)
+    assert all(a["contract"] == CONTRACT and a["tokenId"] == 1 for a in assertions)
+
+
+@pytest.mark.parametrize("bid_suggestion, expected", [("100", 60), ("30", 0)])
+def test_update_token_amount_subtracts_locked_tokens(bid_suggestion, expected):
+    agreement = SimpleNamespace(agreement_data=SimpleNamespace(tokens=[40, 0]))
+
+    amount = _get_update_token_amount({"bidSuggestion": bid_suggestion}, agreement)
+
+    assert amount == expected
+
+
+def test_async_blockchain_provider_close(async_blockchain_provider):
+    provider = async_blockchain_provider
+
+    async def run():
+        await provider.initialize()
+        async with ClientSession() as probe:
+            session = await provider.w3.provider.cache_async_session(probe)
+        handle = provider.receipt_collector.submit(b"\x01" * 32)
+
+        assert session is not probe and not session.closed
+
+        await provider.close()
+        return session, handle
+
+    session, handle = asyncio.run(run())
+
+    assert session.closed
+    assert handle.future.cancelled()
+
+
+def test_dkg_close(blockchain_provider):
+    with DKG(NodeHTTPProvider("http://127.0.0.1:8900"), blockchain_provider) as dkg:
+        session = dkg.node_provider.session
+        handle = blockchain_provider.receipt_collector.submit(b"\x01" * 32)
+
+    assert handle.future.cancelled()
+    assert dkg.node_provider.session is not session
+    with pytest.raises(RuntimeError):
+        blockchain_provider.receipt_collector.submit(b"\x02" * 32)
+    with pytest.raises(RuntimeError):
+        dkg.manager.operation_poller.submit("operation", "get")
+
+
+@pytest.mark.parametrize(
+    "change_allowance",
+    [
+        lambda asset: asset.set_allowance(40),
+        lambda asset: asset.increase_allowance(40),
+        lambda asset: asset.decrease_allowance(40),
+    ],
+    ids=["set", "increase", "decrease"],
+)
+def test_allowance_changes_invalidate_budget(
+    chain, blockchain_provider, change_allowance
+):
+    chain.addresses["ServiceAgreementV1"] = CONTRACT
+    chain.results[("Token", "allowance")] = 100
+    with DKG(NodeHTTPProvider("http://127.0.0.1:8900"), blockchain_provider) as dkg:
+        dkg.asset.allowance_budget.reserve(30)
+        assert dkg.asset.allowance_budget.available == 70
+
+        change_allowance(dkg.asset)
+
+        assert dkg.asset.allowance_budget.available is None
+
+
+@pytest.mark.parametrize("change", ["increase_allowance", "decrease_allowance"])
+def test_async_allowance_changes_invalidate_budget(
+    chain, async_blockchain_provider, change
+):
+    chain.addresses["ServiceAgreementV1"] = CONTRACT
+    chain.results[("Token", "allowance")] = 100
+
+    async def run():
+        dkg = AsyncDKG(
+            AsyncNodeHTTPProvider("http://127.0.0.1:8900"), async_blockchain_provider
+        )
+        async with dkg:
+            await dkg.asset.allowance_budget.reserve(30)
+            available = dkg.asset.allowance_budget.available
+
+            await getattr(dkg.asset, change)(40)
+
+            return available, dkg.asset.allowance_budget.available
+
+    assert asyncio.run(run()) == (70, None)
@@ -0,0 +1,181 @@
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from web3.exceptions import ContractLogicError
+
+from dkg.utils.gas import GasLimitModel, GasPriceService
+
+# Increments storage slot 0, the first call costs about 43k gas.
+COUNTER = bytes.fromhex("60005460010160005500")
+REVERT = bytes.fromhex("60006000fd")
+
+ARGS = {"spender": "0x" + "11" * 20, "addedValue": 1}
+KEY = GasLimitModel.key("Token", "increaseAllowance", ARGS)
+
+
+def learn_gas_limit(model: GasLimitModel, gas_used: int) -> None:
+    for _ in range(model.min_samples):
+        model.observe(KEY, gas_used)
+
+
+def sent_transactions(chain) -> list[dict]:
+    w3 = chain.w3
+    return [
+        transaction
+        for block_number in range(w3.eth.block_number + 1)
+        for transaction in w3.eth.get_block(block_number, True)["transactions"]
+        if transaction["to"] == chain.addresses["Token"]
+    ]
+
+
+@pytest.fixture
+def oracle():
+    requests = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args) -> None:
+            pass
+
+        def do_GET(self) -> None:
+            requests.append(self.path)
+            time.sleep(0.2)
+            data = json.dumps({"average": len(requests)}).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", requests
+    server.shutdown()
+    server.server_close()
+
+
+def refresh_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "dkg-gas-price-refresh"]
+
+
+def test_gas_price_service_fetches_once_for_concurrent_callers(oracle):
+    oracle_url, requests = oracle
+    service = GasPriceService(oracle_url, None, 1)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        gas_prices = list(executor.map(lambda _: service.get(), range(8)))
+    service.close()
+
+    assert gas_prices == [10**9] * 8
+    assert len(requests) == 1
+
+
+def test_gas_price_service_refreshes_ahead_once(oracle):
+    oracle_url, requests = oracle
+    service = GasPriceService(oracle_url, None, 1, refresh_ahead=0.0)
+    assert service.get() == 10**9
+
+    barrier = threading.Barrier(8)
+
+    def get() -> int:
+        barrier.wait()
+        return service.get()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        gas_prices = list(executor.map(lambda _: get(), range(8)))
+    service.close()
+
+    assert gas_prices == [10**9] * 8
+    assert len(requests) == 2
+    assert not any(t.is_alive() for t in refresh_threads())
+    assert service.get() == 2 * 10**9
+
+
+def test_gas_limit_model_learns_after_min_samples():
+    model = GasLimitModel()
+    for _ in range(model.min_samples - 1):
+        model.observe(KEY, 50_000)
+    assert model.predict(KEY) is None
+
+    model.observe(KEY, 50_000)
+    assert model.predict(KEY) == int(50_000 * model.margin)
+
+    model.observe(KEY, 100_000)
+    assert model.predict(KEY) is None
+
+
+@pytest.mark.parametrize("wait", [True, False])
+def test_learned_gas_limit_falls_back_to_estimation(chain, blockchain_provider, wait):
+    chain.deploy("Token", COUNTER)
+    learn_gas_limit(blockchain_provider.gas_limit_model, 30_000)
+
+    result = blockchain_provider.call_function(
+        "Token", "increaseAllowance", ARGS, state_changing=True, wait=wait
+    )
+    receipt = result if wait else result.wait(10)
+
+    transactions = sent_transactions(chain)
+    assert receipt["status"] == 1
+    assert [tx["gas"] for tx in transactions][0] == 37_500
+    assert [tx["nonce"] for tx in transactions] == [0, 1]
+    assert receipt["transactionHash"] == transactions[1]["hash"]
+    if not wait:
+        assert result.tx_hash == receipt["transactionHash"]
+    assert blockchain_provider.gas_limit_model.predict(KEY) is None
+
+
+def test_learned_gas_limit_is_used_without_estimation(chain, blockchain_provider):
+    chain.deploy("Token", COUNTER)
+    learn_gas_limit(blockchain_provider.gas_limit_model, 50_000)
+
+    receipt = blockchain_provider.call_function(
+        "Token", "increaseAllowance", ARGS, state_changing=True
+    )
+
+    assert receipt["status"] == 1
+    assert [tx["gas"] for tx in sent_transactions(chain)] == [62_500]
+
+
+@pytest.mark.parametrize("wait", [True, False])
+def test_learned_gas_limit_fallback_raises_for_reverting_calls(
+    chain, blockchain_provider, wait
+):
+    chain.deploy("Token", REVERT)
+    learn_gas_limit(blockchain_provider.gas_limit_model, 30_000)
+
+    with pytest.raises(ContractLogicError):
+        result = blockchain_provider.call_function(
+            "Token", "increaseAllowance", ARGS, state_changing=True, wait=wait
+        )
+        result.wait(10)
+
+    assert len(sent_transactions(chain)) == 1
+    assert blockchain_provider.gas_limit_model.predict(KEY) is None
+
+
+def test_async_learned_gas_limit_falls_back_to_estimation(
+    chain, async_blockchain_provider
+):
+    chain.deploy("Token", COUNTER)
+    provider = async_blockchain_provider
+    learn_gas_limit(provider.gas_limit_model, 30_000)
+
+    async def run():
+        try:
+            handle = await provider.call_function(
+                "Token", "increaseAllowance", ARGS, state_changing=True, wait=False
+            )
+            return handle, await handle
+        finally:
+            await provider.close()
+
+    handle, receipt = asyncio.run(run())
+
+    transactions = sent_transactions(chain)
+    assert receipt["status"] == 1
+    assert [tx["gas"] for tx in transactions][0] == 37_500
+    assert handle.tx_hash == receipt["transactionHash"] == transactions[1]["hash"]
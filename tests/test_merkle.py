@@ -0,0 +1,252 @@
+import random
+import sys
+
+import pytest
+from eth_abi.packed import encode_packed
+from web3 import Web3
+
+from dkg.dataclasses import Multiproof, MultiproofStep
+from dkg.utils import merkle
+from dkg.utils.merkle import (
+    BytesMerkleTree,
+    IncrementalMerkleTree,
+    MerkleTree,
+    calculate_merkle_root,
+    hash_assertion_with_indexes,
+    hash_leaves,
+)
+
+QUADS = [
+    '<uuid:1> <http://schema.org/name> "Alice" .',
+    '<uuid:2> <http://schema.org/name> "Bob" .',
+    '<uuid:3> <http://schema.org/description> "Ünïcödé ✓ 日本語"@ja .',
+    "_:c14n0 <http://schema.org/author> <uuid:1> .",
+    '<uuid:4> <http://schema.org/dateCreated> "2024-01-01"'
+    "^^<http://www.w3.org/2001/XMLSchema#date> .",
+]
+
+KECCAK_BACKENDS = {
+    "pysha3": ["Crypto.Hash"],
+    "pycryptodome": ["sha3"],
+    "eth_utils": ["sha3", "Crypto.Hash"],
+}
+
+
+def reference_hash_assertion_with_indexes(leaves: list[str]) -> list[str]:
+    return [
+        Web3.solidity_keccak(
+            ["bytes"],
+            [
+                encode_packed(
+                    ["bytes32", "uint256"],
+                    [Web3.solidity_keccak(["string"], [leaf]), i],
+                )
+            ],
+        ).hex()
+        for i, leaf in enumerate(sorted(leaves))
+    ]
+
+
+def openzeppelin_process_multiproof(
+    leaves: list[bytes], proof: list[bytes], proof_flags: list[bool]
+) -> bytes | None:
+    # Port of MerkleProof.processMultiProof with commutative keccak pairs.
+    if len(leaves) + len(proof) != len(proof_flags) + 1:
+        return None
+
+    leaves, proof, hashes = iter(leaves), iter(proof), []
+    hash_pos = 0
+
+    def next_node() -> bytes:
+        nonlocal hash_pos
+        if (leaf := next(leaves, None)) is not None:
+            return leaf
+        hash_pos += 1
+        return hashes[hash_pos - 1]
+
+    for flag in proof_flags:
+        a = next_node()
+        b = next_node() if flag else next(proof)
+        hashes.append(Web3.keccak(min(a, b) + max(a, b)))
+
+    return hashes[-1] if hashes else next(leaves, None) or next(proof, None)
+
+
+def quads(count: int) -> list[str]:
+    return [
+        f'<uuid:{i}> <http://schema.org/name> "Name {i} ünï \\"{i % 3}\\"" .'
+        for i in range(count)
+    ]
+
+
+@pytest.mark.parametrize(
+    "leaves",
+    [[], QUADS[:1], QUADS[2:3], QUADS, quads(3), quads(33), quads(100)],
+    ids=["empty", "single", "non-ascii", "mixed", "odd-3", "odd-33", "even-100"],
+)
+def test_hash_assertion_with_indexes_matches_reference(leaves):
+    expected = reference_hash_assertion_with_indexes(leaves)
+
+    assert hash_assertion_with_indexes(list(leaves)) == expected
+    assert ["0x" + leaf.hex() for leaf in hash_leaves(sorted(leaves))] == expected
+
+
+def test_hash_leaves_offset():
+    leaves = sorted(quads(7))
+
+    assert hash_leaves(leaves[3:], 3) == hash_leaves(leaves)[3:]
+
+
+def test_hash_assertion_with_indexes_sorts_in_place():
+    leaves = list(reversed(QUADS))
+    hash_assertion_with_indexes(leaves)
+
+    assert leaves == sorted(QUADS)
+
+
+def test_custom_hash_function_keeps_encode_packed_path():
+    def custom_keccak256(data):
+        return merkle.solidity_keccak256(data)
+
+    assert hash_assertion_with_indexes(
+        list(QUADS), custom_keccak256
+    ) == reference_hash_assertion_with_indexes(QUADS)
+
+
+@pytest.mark.parametrize("backend", KECCAK_BACKENDS)
+def test_keccak_backends_match_reference(monkeypatch, backend):
+    required = {"pysha3": "sha3", "pycryptodome": "Crypto.Hash"}.get(backend)
+    if required is not None:
+        pytest.importorskip(required)
+
+    for module in KECCAK_BACKENDS[backend]:
+        monkeypatch.setitem(sys.modules, module, None)
+    keccak256 = merkle._load_keccak256()
+    monkeypatch.setattr(merkle, "keccak256", keccak256)
+
+    assert keccak256(b"") == bytes(Web3.keccak(b""))
+    assert keccak256(bytearray(64)) == bytes(Web3.keccak(bytes(64)))
+    for leaves in ([], QUADS[:1], QUADS, quads(33)):
+        assert [
+            "0x" + leaf.hex() for leaf in hash_leaves(sorted(leaves))
+        ] == reference_hash_assertion_with_indexes(leaves)
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 17, 33])
+def test_merkle_root_matches_reference(count):
+    leaves = quads(count)
+    expected = MerkleTree(
+        reference_hash_assertion_with_indexes(leaves), sort_pairs=True
+    ).root
+
+    assert calculate_merkle_root(list(leaves)) == expected
+    assert (
+        MerkleTree(hash_assertion_with_indexes(list(leaves)), sort_pairs=True).root
+        == expected
+    )
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        (QUADS + QUADS[:2], QUADS),
+        (QUADS, QUADS + QUADS[:2]),
+        (QUADS + QUADS[:1], QUADS + QUADS[1:2]),
+        (quads(9) * 2, quads(9) + quads(4)),
+        (quads(3), quads(3) * 3 + QUADS[2:3]),
+    ],
+)
+def test_incremental_replace_with_duplicates_matches_rebuild(old, new):
+    tree = IncrementalMerkleTree(list(old))
+    assert tree.root == calculate_merkle_root(list(old))
+
+    assert tree.replace(list(new)) == calculate_merkle_root(list(new))
+    assert tree.quads == sorted(new)
+
+
+def test_incremental_update_removes_single_occurrence():
+    tree = IncrementalMerkleTree(QUADS + QUADS[:1])
+
+    assert tree.update(removed=QUADS[:1]) == calculate_merkle_root(list(QUADS))
+    assert tree.update(added=QUADS[:2], removed=QUADS[3:]) == calculate_merkle_root(
+        QUADS[:3] + QUADS[:2]
+    )
+
+
+def multiproof_trees(count: int) -> tuple[MerkleTree, BytesMerkleTree]:
+    leaves = hash_assertion_with_indexes(quads(count))
+    return (
+        MerkleTree(list(leaves), sort_pairs=True),
+        BytesMerkleTree(list(leaves), sort_pairs=True),
+    )
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 5, 7, 12, 13, 33])
+def test_multiproof_verifies(count):
+    tree, bytes_tree = multiproof_trees(count)
+    rng = random.Random(count)
+    selections = [[i] for i in range(count)] + [list(range(count))]
+    selections += [rng.sample(range(count), rng.randint(1, count)) for _ in range(20)]
+
+    for indexes in selections:
+        leaves = [tree.leaves[i] for i in indexes]
+        multiproof = tree.multiproof(leaves)
+
+        assert multiproof == bytes_tree.multiproof(leaves)
+        assert sorted(multiproof.leaves) == sorted(set(leaves))
+        assert tree.verify_multiproof(multiproof)
+        assert bytes_tree.verify_multiproof(multiproof)
+
+        if MultiproofStep.CARRY not in multiproof.steps:
+            openzeppelin = multiproof.to_openzeppelin()
+            assert all(type(flag) is bool for flag in openzeppelin["proofFlags"])
+            assert openzeppelin_process_multiproof(
+                [bytes.fromhex(leaf[2:]) for leaf in openzeppelin["leaves"]],
+                [bytes.fromhex(node[2:]) for node in openzeppelin["proof"]],
+                openzeppelin["proofFlags"],
+            ) == bytes.fromhex(tree.root[2:])
+            assert bytes_tree.verify_multiproof(openzeppelin)
+
+
+def test_multiproof_carry_has_no_openzeppelin_layout():
+    tree, _ = multiproof_trees(5)
+    multiproof = tree.multiproof([tree.leaves[1], tree.leaves[4]])
+
+    assert MultiproofStep.CARRY in multiproof.steps
+    assert tree.verify_multiproof(multiproof)
+    with pytest.raises(ValueError):
+        multiproof.to_openzeppelin()
+
+
+def test_multiproof_requires_sorted_pairs():
+    tree = MerkleTree(hash_assertion_with_indexes(quads(3)))
+
+    with pytest.raises(ValueError):
+        tree.multiproof(tree.leaves[:1])
+
+
+@pytest.mark.parametrize("count", [3, 5, 13])
+def test_multiproof_rejects_tampering(count):
+    tree, bytes_tree = multiproof_trees(count)
+    multiproof = tree.multiproof([tree.leaves[0], tree.leaves[count - 1]])
+    forged = "0x" + "11" * 32
+
+    tampered = [
+        Multiproof(
+            [forged] + multiproof.leaves[1:], multiproof.proof, multiproof.steps
+        ),
+        Multiproof(
+            multiproof.leaves, [forged] + multiproof.proof[1:], multiproof.steps
+        ),
+        Multiproof(multiproof.leaves, multiproof.proof, multiproof.steps[:-1]),
+        Multiproof(multiproof.leaves[:1], multiproof.proof, multiproof.steps),
+        Multiproof(multiproof.leaves[::-1], multiproof.proof, multiproof.steps),
+        Multiproof(
+            multiproof.leaves,
+            multiproof.proof,
+            [MultiproofStep.PROOF] * len(multiproof.steps),
+        ),
+    ]
+    for multiproof in tampered:
+        assert not tree.verify_multiproof(multiproof)
+        assert not bytes_tree.verify_multiproof(multiproof)
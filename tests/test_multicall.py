@@ -0,0 +1,120 @@
+import pytest
+from web3.exceptions import ContractLogicError
+
+ASSERTION_ID = bytes(range(32))
+AGREEMENT_ID = b"\xaa" * 32
+AGREEMENT_DATA = (1_700_000_000, 5, 7_776_000, [10**18, 2 * 10**18], [1, 25])
+
+CALLS = [
+    {
+        "contract": "ContentAssetStorage",
+        "function": "getLatestAssertionId",
+        "args": {"tokenId": 1},
+    },
+    {
+        "contract": "AssertionStorage",
+        "function": "getAssertionSize",
+        "args": {"assertionId": ASSERTION_ID},
+    },
+    {
+        "contract": "ServiceAgreementStorageProxy",
+        "function": "getAgreementData",
+        "args": {"agreementId": AGREEMENT_ID},
+    },
+]
+RESULTS = {
+    ("ContentAssetStorage", "getLatestAssertionId"): ASSERTION_ID,
+    ("AssertionStorage", "getAssertionSize"): 1024,
+    ("ServiceAgreementStorageProxy", "getAgreementData"): AGREEMENT_DATA,
+}
+
+
+def contract_calls(chain) -> list[tuple[str, str]]:
+    return [
+        (contract, function)
+        for contract, function, _ in chain.calls
+        if contract not in ("Hub", "Multicall3") or function == "aggregate3"
+    ]
+
+
+def reverts_once(result):
+    responses = [ValueError("execution reverted"), result]
+
+    def call(*args):
+        if isinstance(response := responses.pop(0), Exception):
+            raise response
+        return response
+
+    return call
+
+
+def test_multicall_decodes_results(chain, blockchain_provider):
+    chain.results.update(RESULTS)
+
+    latest_assertion_id, size, agreement_data = blockchain_provider.multicall(CALLS)
+
+    assert latest_assertion_id == ASSERTION_ID
+    assert size == 1024
+    assert type(agreement_data).__name__ == "getAgreementDataResult"
+    assert agreement_data.startTime == AGREEMENT_DATA[0]
+    assert agreement_data.epochsNumber == AGREEMENT_DATA[1]
+    assert agreement_data.epochLength == AGREEMENT_DATA[2]
+    assert list(agreement_data.tokens) == AGREEMENT_DATA[3]
+    assert list(agreement_data.scoreFunctionIdAndProofWindowOffsetPerc) == [1, 25]
+
+
+def test_multicall_encodes_calls(chain, blockchain_provider):
+    chain.results.update(RESULTS)
+    blockchain_provider.multicall(CALLS)
+
+    aggregated = [args for _, function, args in chain.calls if function == "aggregate3"]
+    assert len(aggregated) == 1
+    assert [target for target, _, _ in aggregated[0][0]] == [
+        chain.addresses[call["contract"]].lower() for call in CALLS
+    ]
+    assert all(allow_failure for _, allow_failure, _ in aggregated[0][0])
+    assert contract_calls(chain) == [
+        ("Multicall3", "aggregate3"),
+        *((call["contract"], call["function"]) for call in CALLS),
+    ]
+    assert [args for _, _, args in chain.calls[-3:]] == [
+        (1,),
+        (ASSERTION_ID,),
+        (AGREEMENT_ID,),
+    ]
+
+
+def test_multicall_falls_back_for_failed_calls(chain, blockchain_provider):
+    chain.results.update(RESULTS)
+    chain.results[("AssertionStorage", "getAssertionSize")] = reverts_once(1024)
+
+    _, size, _ = blockchain_provider.multicall(CALLS)
+
+    assert size == 1024
+    assert contract_calls(chain)[-1] == ("AssertionStorage", "getAssertionSize")
+    assert contract_calls(chain).count(("AssertionStorage", "getAssertionSize")) == 2
+
+
+def test_multicall_raises_for_reverting_calls(chain, blockchain_provider):
+    chain.results.update(RESULTS)
+    del chain.results[("AssertionStorage", "getAssertionSize")]
+
+    with pytest.raises(ContractLogicError):
+        blockchain_provider.multicall(CALLS)
+
+
+def test_multicall_without_multicall3_calls_each_function(chain, blockchain_provider):
+    chain.results.update(RESULTS)
+    chain.multicall = False
+
+    assert blockchain_provider.multicall(CALLS)[1] == 1024
+    assert contract_calls(chain) == [
+        (call["contract"], call["function"]) for call in CALLS
+    ]
+
+
+def test_multicall_single_call_skips_aggregation(chain, blockchain_provider):
+    chain.results.update(RESULTS)
+
+    assert blockchain_provider.multicall(CALLS[:1]) == [ASSERTION_ID]
+    assert contract_calls(chain) == [("ContentAssetStorage", "getLatestAssertionId")]
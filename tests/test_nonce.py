@@ -0,0 +1,161 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import pytest
+
+from dkg.utils.nonce import AsyncNonceManager, NonceManager, is_nonce_error
+
+
+class TransactionCount:
+    def __init__(self, count: int = 0):
+        self.count = count
+        self.calls = 0
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.count
+
+
+def test_is_nonce_error():
+    assert is_nonce_error(ValueError({"message": "Nonce too low: 3 < 5"}))
+    assert is_nonce_error(ValueError("replacement transaction underpriced"))
+    assert is_nonce_error(ValueError("Invalid transaction nonce: Expected 2, got 1"))
+    assert not is_nonce_error(ValueError("execution reverted"))
+
+
+def test_concurrent_acquire_reserves_sequential_nonces():
+    transaction_count = TransactionCount(7)
+    nonce_manager = NonceManager(transaction_count)
+    barrier = threading.Barrier(8)
+
+    def acquire() -> list[int]:
+        barrier.wait()
+        return [nonce_manager.acquire() for _ in range(25)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        nonces = [n for ns in executor.map(lambda _: acquire(), range(8)) for n in ns]
+
+    assert sorted(nonces) == list(range(7, 7 + 200))
+    assert transaction_count.calls == 1
+
+
+def test_send_resets_on_nonce_too_low():
+    transaction_count = TransactionCount(3)
+    nonce_manager = NonceManager(transaction_count)
+    assert nonce_manager.acquire() == 3
+
+    # Another client sent transactions from the same account in the meantime.
+    transaction_count.count = 10
+    sent = []
+
+    def send_transaction(nonce: int) -> str:
+        sent.append(nonce)
+        if nonce < transaction_count.count:
+            raise ValueError({"code": -32000, "message": "nonce too low"})
+        return f"tx-{nonce}"
+
+    assert nonce_manager.send(send_transaction) == "tx-10"
+    assert sent == [4, 10]
+    assert transaction_count.calls == 2
+    assert nonce_manager.acquire() == 11
+
+
+def test_send_raises_after_retries():
+    nonce_manager = NonceManager(TransactionCount(0), retries=1)
+
+    def send_transaction(nonce: int) -> str:
+        raise ValueError("nonce too low")
+
+    with pytest.raises(ValueError):
+        nonce_manager.send(send_transaction)
+    assert not nonce_manager.is_synced
+
+
+def test_send_releases_nonce_on_other_errors():
+    nonce_manager = NonceManager(TransactionCount(5))
+
+    def send_transaction(nonce: int) -> str:
+        raise ValueError("execution reverted")
+
+    with pytest.raises(ValueError):
+        nonce_manager.send(send_transaction)
+
+    assert nonce_manager.acquire() == 5
+
+
+def test_release_fills_gaps_before_new_nonces():
+    nonce_manager = NonceManager(TransactionCount(0))
+    nonces = [nonce_manager.acquire() for _ in range(4)]
+
+    nonce_manager.release(nonces[1])
+    assert nonce_manager.acquire() == 1
+
+    nonce_manager.release(nonces[3])
+    nonce_manager.release(nonces[2])
+    assert [nonce_manager.acquire() for _ in range(3)] == [2, 3, 4]
+
+
+def test_async_concurrent_send_reserves_sequential_nonces():
+    transaction_count = TransactionCount(2)
+
+    async def get_transaction_count() -> int:
+        await asyncio.sleep(0)
+        return transaction_count()
+
+    async def send_transaction(nonce: int) -> int:
+        await asyncio.sleep(0)
+        return nonce
+
+    async def run() -> list[int]:
+        nonce_manager = AsyncNonceManager(get_transaction_count)
+        return await asyncio.gather(
+            *(nonce_manager.send(send_transaction) for _ in range(50))
+        )
+
+    assert sorted(asyncio.run(run())) == list(range(2, 52))
+    assert transaction_count.calls == 1
+
+
+def test_async_send_resets_on_nonce_too_low():
+    transaction_count = TransactionCount(0)
+
+    async def get_transaction_count() -> int:
+        return transaction_count()
+
+    async def run() -> list[int]:
+        nonce_manager = AsyncNonceManager(get_transaction_count)
+        await nonce_manager.acquire()
+        transaction_count.count = 4
+
+        async def send_transaction(nonce: int) -> int:
+            if nonce < transaction_count.count:
+                raise ValueError("nonce too low")
+            return nonce
+
+        return [await nonce_manager.send(send_transaction) for _ in range(2)]
+
+    assert asyncio.run(run()) == [4, 5]
+
+
+def test_send_recovers_on_test_chain():
+    pytest.importorskip("eth_tester")
+    from web3 import EthereumTesterProvider, Web3
+
+    w3 = Web3(EthereumTesterProvider())
+    sender, receiver = w3.eth.accounts[:2]
+    transaction = {"from": sender, "to": receiver, "value": 1, "gas": 21_000}
+    nonce_manager = NonceManager(
+        partial(w3.eth.get_transaction_count, sender, "pending")
+    )
+
+    def send_transaction(nonce: int):
+        return w3.eth.send_transaction({**transaction, "nonce": nonce})
+
+    tx_hashes = [nonce_manager.send(send_transaction) for _ in range(3)]
+    w3.eth.send_transaction(transaction)
+    tx_hashes.append(nonce_manager.send(send_transaction))
+
+    assert [w3.eth.get_transaction(h)["nonce"] for h in tx_hashes] == [0, 1, 2, 4]
+    assert w3.eth.get_transaction_count(sender) == 5
@@ -0,0 +1,65 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dkg.utils.pipeline import AsyncPipeline, Pipeline, Stage
+
+
+def failing_items(count: int):
+    yield from range(count)
+    raise ValueError("items failed")
+
+
+def test_pipeline_runs_items_through_stages_in_order():
+    stages = [
+        Stage("double", lambda x: 2 * x, concurrency=2),
+        Stage("check", lambda x: x if x != 6 else 1 / 0, concurrency=3),
+    ]
+
+    results = Pipeline(stages, max_pending=3).run(range(5))
+
+    assert results[:3] == [0, 2, 4]
+    assert isinstance(results[3], ZeroDivisionError)
+    assert results[4] == 8
+
+
+def test_pipeline_drains_in_flight_items_when_items_raise():
+    processed = []
+    lock = threading.Lock()
+
+    def slow(x: int) -> int:
+        time.sleep(0.05)
+        return x
+
+    def record(x: int) -> int:
+        with lock:
+            processed.append(x)
+        return x
+
+    stages = [Stage("slow", slow, concurrency=2), Stage("record", record)]
+
+    with pytest.raises(ValueError, match="items failed"):
+        Pipeline(stages, max_pending=4).run(failing_items(4))
+
+    assert sorted(processed) == [0, 1, 2, 3]
+
+
+def test_async_pipeline_drains_in_flight_items_when_items_raise():
+    processed = []
+
+    async def slow(x: int) -> int:
+        await asyncio.sleep(0.05)
+        return x
+
+    async def record(x: int) -> int:
+        processed.append(x)
+        return x
+
+    stages = [Stage("slow", slow, concurrency=2), Stage("record", record)]
+
+    with pytest.raises(ValueError, match="items failed"):
+        asyncio.run(AsyncPipeline(stages, max_pending=4).run(failing_items(4)))
+
+    assert sorted(processed) == [0, 1, 2, 3]